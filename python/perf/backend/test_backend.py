@@ -0,0 +1,71 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps import backend
+from zkps.elliptic_curve import get_curve
+
+MODULUS_BITS = [512, 1024, 2048, 3072]
+
+def time_powmod(bits, simulations):
+    times = []
+    for _ in range(simulations):
+        p = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+        g = random.randrange(2, p)
+        e = random.getrandbits(bits)
+        s_p = time.time()
+        backend.powmod(g, e, p)
+        e_p = time.time()
+        times.append(e_p - s_p)
+    return median(times)
+
+def time_mult_point(curve_name, simulations):
+    curve = get_curve(curve_name)
+    point = curve.get_generators(1)[0]
+    times = []
+    for _ in range(simulations):
+        k = curve.get_random()
+        s_m = time.time()
+        curve.mult_point(k, point)
+        e_m = time.time()
+        times.append(e_m - s_m)
+    return median(times)
+
+def test_performance(simulations=20, curve_name='secp256r1'):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    for name in backend.BACKENDS:
+        try:
+            backend.set_backend(name)
+        except ImportError:
+            print(f"Backend {name} is not installed, skipping")
+            continue
+        print(f"Backend: {backend.get_backend().name}")
+
+        y_powmod = []
+        for bits in MODULUS_BITS:
+            t = time_powmod(bits, simulations)
+            y_powmod.append(t * 1000)
+            print(f"  powmod {bits} bits: {t * 1000:.3f} ms")
+        mult = time_mult_point(curve_name, simulations)
+        print(f"  mult_point {curve_name}: {mult * 1000:.3f} ms")
+
+        axes[0].plot(MODULUS_BITS, y_powmod, marker='o', label=name)
+        axes[1].bar(name, mult * 1000)
+
+    axes[0].set_title('Median powmod time')
+    axes[0].set_xlabel('Bit length of p')
+    axes[0].set_ylabel('Median execution time (miliseconds)')
+    axes[0].legend()
+    axes[1].set_title(f'Median mult_point time on {curve_name}')
+    axes[1].set_ylabel('Median execution time (miliseconds)')
+    for ax in axes:
+        ax.grid(True)
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/backends.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=50)
@@ -0,0 +1,64 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.zkp_log_disjunction import DiscreteLogDisjunction, DiscreteLogDisjunctionEcc
+
+SIZES = [1, 4, 16, 64, 256]
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def test_performance(simulations=5, bits=2048):
+    curve = DiscreteLogDisjunctionEcc.curve
+    x = curve.get_random()
+    g, h = curve.get_generators(2)
+    P, Q = curve.mult_point(x, g), curve.mult_point(curve.get_random(), h)
+    prover = DiscreteLogDisjunctionEcc(x)
+    verifier = DiscreteLogDisjunctionEcc()
+    y_speedup = []
+    for size in SIZES:
+        proofs = [(g, h, P, Q) + prover.response(g, h, P, Q) for _ in range(size)]
+        t_single = measure(lambda: [verifier.verify(*proof) for proof in proofs], simulations)
+        t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+        y_speedup.append(t_single / t_batch)
+        print(f"ECC {size} proofs: verify {t_single * 1000:.3f} ms, "
+              f"verify_batch {t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+    plt.plot(SIZES, y_speedup, marker='o', label='secp256r1')
+
+    p = randprime(2**(bits - 1), 2**bits)
+    g, h = 2, 3
+    x = random.randint(1, p - 2)
+    P, Q = pow(g, x, p), pow(h, random.randint(1, p - 2), p)
+    prover = DiscreteLogDisjunction(g, h, P, Q, p, x)
+    verifier = DiscreteLogDisjunction(g, h, P, Q, p)
+    y_speedup = []
+    for size in SIZES:
+        proofs = [(g, h, P, Q) + prover.response() for _ in range(size)]
+        t_single = measure(lambda: [verifier.verify(*proof) for proof in proofs], simulations)
+        t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+        y_speedup.append(t_single / t_batch)
+        print(f"mod p {bits} bits {size} proofs: verify {t_single * 1000:.3f} ms, "
+              f"verify_batch {t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+    plt.plot(SIZES, y_speedup, marker='o', label=f'{bits}-bit p')
+
+    plt.xscale('log', base=2)
+    plt.title('OR-proof batch verification speedup over verify')
+    plt.xlabel('Number of proofs')
+    plt.ylabel('Speedup')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/batch_disjunction.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=5)
@@ -0,0 +1,75 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.zkp_log_equality import DiscreteLogEquality, DiscreteLogEqualityEcc
+
+SIZES = [1, 4, 16, 64, 256]
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def ecc_proofs(size, vrf):
+    curve = DiscreteLogEqualityEcc.curve
+    x = curve.get_random()
+    prover = DiscreteLogEqualityEcc(x)
+    g, h = curve.get_generators(2)
+    P = curve.mult_point(x, g)
+    Q = curve.mult_point(x, h)
+    proofs = []
+    # VRF style: one key, a fresh h for every input
+    for h_i in (curve.get_generators(size) if vrf else [h] * size):
+        Q_i = curve.mult_point(x, h_i) if vrf else Q
+        proofs.append((g, h_i, P, Q_i) + prover.response(g, h_i, P, Q_i))
+    return proofs
+
+def test_performance(simulations=5, bits=2048):
+    verifier = DiscreteLogEqualityEcc()
+    for vrf in [False, True]:
+        y_speedup = []
+        for size in SIZES:
+            proofs = ecc_proofs(size, vrf)
+            t_single = measure(lambda: [verifier.verify(*proof) for proof in proofs], simulations)
+            t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+            y_speedup.append(t_single / t_batch)
+            print(f"ECC {'VRF ' if vrf else ''}{size} proofs: verify {t_single * 1000:.3f} ms, "
+                  f"verify_batch {t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+        plt.plot(SIZES, y_speedup, marker='o',
+                 label='secp256r1, fresh h per proof' if vrf else 'secp256r1, one statement')
+
+    p = randprime(2**(bits - 1), 2**bits)
+    g, h = 2, 3
+    x = random.randint(1, p - 2)
+    prover = DiscreteLogEquality(g, h, pow(g, x, p), pow(h, x, p), p, x)
+    verifier = DiscreteLogEquality(g, h, pow(g, x, p), pow(h, x, p), p)
+    y_speedup = []
+    for size in SIZES:
+        proofs = [prover.response(commitments=True) for _ in range(size)]
+        compact = [prover.response() for _ in range(size)]
+        t_single = measure(lambda: [verifier.verify(c, r) for c, r in compact], simulations)
+        t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+        y_speedup.append(t_single / t_batch)
+        print(f"mod p {bits} bits {size} proofs: verify {t_single * 1000:.3f} ms, "
+              f"verify_batch {t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+    plt.plot(SIZES, y_speedup, marker='o', label=f'{bits}-bit p')
+
+    plt.xscale('log', base=2)
+    plt.title('DLEQ batch verification speedup over verify')
+    plt.xlabel('Number of proofs')
+    plt.ylabel('Speedup')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/batch_dleq.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=5)
@@ -0,0 +1,47 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.zkp_log_discrete import DiscreteLogEcc
+
+SIZES = [1, 4, 16, 64, 256]
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def test_performance(simulations=10):
+    prover = DiscreteLogEcc(DiscreteLogEcc.curve.get_random())
+    verifier = DiscreteLogEcc()
+    proofs = [prover.response() for _ in range(max(SIZES))]
+
+    y_single = []
+    y_batch = []
+    for size in SIZES:
+        batch = proofs[:size]
+        t_single = measure(lambda: [verifier.verify(s, t) for t, s in batch], simulations)
+        t_batch = measure(lambda: verifier.verify_batch(batch), simulations)
+        y_single.append(size / t_single)
+        y_batch.append(size / t_batch)
+        print(f"{size} proofs: verify {t_single * 1000:.3f} ms, verify_batch "
+              f"{t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+
+    plt.plot(SIZES, y_single, marker='o', label='verify')
+    plt.plot(SIZES, y_batch, marker='o', label='verify_batch')
+    plt.xscale('log', base=2)
+    plt.title('DiscreteLogEcc verification throughput on secp256r1')
+    plt.xlabel('Number of proofs')
+    plt.ylabel('Proofs per second')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/batch_ecc.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=10)
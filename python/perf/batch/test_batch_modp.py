@@ -0,0 +1,69 @@
+import os
+import time
+import random
+import contextlib
+import io
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.zkp_log_discrete import DiscreteLog
+
+MODULUS_BITS = [1024, 2048, 3072]
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def make_proofs(g, p, size, keys):
+    proofs = []
+    for i in range(size):
+        x = random.randint(1, p - 2)
+        y = pow(g, x, p)
+        prover = DiscreteLog(g, y, p, x)
+        # DiscreteLog.response prints the challenge
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(size // keys):
+                proofs.append(prover.response() + (y,))
+        if len(proofs) >= size:
+            return proofs
+
+def test_performance(size=64, keys=(1, 8, 64), simulations=5):
+    for count in keys:
+        y_single = []
+        y_batch = []
+        for bits in MODULUS_BITS:
+            p = randprime(2**(bits - 1), 2**bits)
+            g = 2
+            proofs = make_proofs(g, p, size, count)
+            verifier = DiscreteLog(g, proofs[0][2], p)
+
+            def single():
+                for t, s, y in proofs:
+                    DiscreteLog(g, y, p).verify(s, t)
+
+            t_single = measure(single, simulations)
+            t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+            y_single.append(t_single / size * 1000)
+            y_batch.append(t_batch / size * 1000)
+            print(f"{bits} bits, {size} proofs of {count} keys: verify {t_single / size * 1000:.3f} ms, "
+                  f"verify_batch {t_batch / size * 1000:.3f} ms per proof, "
+                  f"speedup {t_single / t_batch:.2f}x")
+        plt.plot(MODULUS_BITS, y_batch, marker='o', label=f'verify_batch, {count} keys')
+    plt.plot(MODULUS_BITS, y_single, marker='o', label='verify')
+    plt.yscale('log')
+    plt.title(f'DiscreteLog amortized verification cost, {size} proofs')
+    plt.xlabel('Bit length of p')
+    plt.ylabel('Median time per proof (miliseconds)')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/batch_modp.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=5)
@@ -0,0 +1,93 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.zkp_pederesen_commitment import PedersenCommitment, PedersenCommitmentEcc
+from zkps.zkp_pederesen_commitments import PedersenCommitmentsEqual, PederesenCommitmentsEqualEcc
+from zkps.zkp_pederesen_commitments_messages import PederesenCommitmentsEqualMessages, \
+    PederesenCommitmentsEqualMessagesEcc
+
+SIZES = [1, 4, 16, 64, 256]
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def ecc_proofs(protocol, size):
+    curve = protocol.curve
+    x, y, z = curve.get_random(), curve.get_random(), curve.get_random()
+    g1, h1, g2, h2 = curve.get_generators(4)
+    if protocol is PedersenCommitmentEcc:
+        P = curve.multi_mult([(x, g1), (y, h1)])
+        prover = protocol(x, y)
+        return [(g1, h1, P) + prover.response(g1, h1, P) for _ in range(size)]
+    if protocol is PederesenCommitmentsEqualEcc:
+        prover = protocol(x, y)
+        P = curve.multi_mult([(x, g1), (y, h1)])
+        Q = curve.multi_mult([(x, g2), (y, h2)])
+    else:
+        prover = protocol(x, y, z)
+        P = curve.multi_mult([(x, g1), (y, h1)])
+        Q = curve.multi_mult([(x, g2), (z, h2)])
+    return [(g1, h1, g2, h2, P, Q) + prover.response(g1, h1, g2, h2, P, Q) for _ in range(size)]
+
+def modp_proofs(protocol, size, p):
+    g1, h1, g2, h2 = 2, 3, 5, 7
+    x, y, z = (random.randint(1, p - 2) for _ in range(3))
+    if protocol is PedersenCommitment:
+        P = pow(g1, x, p) * pow(h1, y, p) % p
+        return protocol(g1, h1, p), [(g1, h1, P) + protocol(g1, h1, p, x, y).response(P) for _ in range(size)]
+    if protocol is PedersenCommitmentsEqual:
+        P = pow(g1, x, p) * pow(h1, y, p) % p
+        Q = pow(g2, x, p) * pow(h2, y, p) % p
+        prover = protocol(p, x, y)
+        return protocol(p), [(g1, h1, g2, h2, P, Q) + prover.response(g1, h1, g2, h2, P, Q) for _ in range(size)]
+    P = pow(g1, x, p) * pow(h1, y, p) % p
+    Q = pow(g1, x, p) * pow(h1, z, p) % p
+    prover = protocol(p, g1, h1, x, y, z)
+    return protocol(p, g1, h1), [(P, Q) + prover.response(P, Q) for _ in range(size)]
+
+def test_performance(simulations=5, bits=2048):
+    for protocol in [PedersenCommitmentEcc, PederesenCommitmentsEqualEcc, PederesenCommitmentsEqualMessagesEcc]:
+        verifier = protocol()
+        y_speedup = []
+        for size in SIZES:
+            proofs = ecc_proofs(protocol, size)
+            t_single = measure(lambda: [verifier.verify(*proof) for proof in proofs], simulations)
+            t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+            y_speedup.append(t_single / t_batch)
+            print(f"{protocol.__name__} {size} proofs: verify {t_single * 1000:.3f} ms, "
+                  f"verify_batch {t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+        plt.plot(SIZES, y_speedup, marker='o', label=protocol.__name__)
+
+    p = randprime(2**(bits - 1), 2**bits)
+    for protocol in [PedersenCommitment, PedersenCommitmentsEqual, PederesenCommitmentsEqualMessages]:
+        y_speedup = []
+        for size in SIZES:
+            verifier, proofs = modp_proofs(protocol, size, p)
+            t_single = measure(lambda: [verifier.verify(*proof) for proof in proofs], simulations)
+            t_batch = measure(lambda: verifier.verify_batch(proofs), simulations)
+            y_speedup.append(t_single / t_batch)
+            print(f"{protocol.__name__} {bits} bits {size} proofs: verify {t_single * 1000:.3f} ms, "
+                  f"verify_batch {t_batch * 1000:.3f} ms, speedup {t_single / t_batch:.2f}x")
+        plt.plot(SIZES, y_speedup, marker='o', linestyle='--', label=f'{protocol.__name__} ({bits}-bit p)')
+
+    plt.xscale('log', base=2)
+    plt.title('Pedersen batch verification speedup over verify')
+    plt.xlabel('Number of proofs')
+    plt.ylabel('Speedup')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/batch_pedersen.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=5)
@@ -0,0 +1,97 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.zkp_log_discrete import DiscreteLog, DiscreteLogEcc
+from zkps.zkp_log_conjunction import DiscreteLogConjunction, DiscreteLogConjunctionEcc
+from zkps.zkp_pederesen_commitment import PedersenCommitment, PedersenCommitmentEcc
+
+CHALLENGE_BITS = [None, 128]
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def ecc_cases():
+    curve = DiscreteLogEcc.curve
+    x, y = curve.get_random(), curve.get_random()
+    g, h = curve.get_generators(2)
+    P, Q = curve.mult_point(x, g), curve.mult_point(y, h)
+    C = curve.multi_mult([(x, g), (y, h)])
+    prover = DiscreteLogEcc(x)
+    verifier = DiscreteLogEcc()
+
+    def discrete_log():
+        t, s = prover.response()
+        return lambda: verifier.verify(s, t)
+
+    def conjunction():
+        proof = DiscreteLogConjunctionEcc(x, y).response(g, h, P, Q)
+        return lambda: DiscreteLogConjunctionEcc().verify(g, h, P, Q, *proof)
+
+    def pedersen():
+        proof = PedersenCommitmentEcc(x, y).response(g, h, C)
+        return lambda: PedersenCommitmentEcc().verify(g, h, C, *proof)
+
+    return [(DiscreteLogEcc, discrete_log), (DiscreteLogConjunctionEcc, conjunction),
+            (PedersenCommitmentEcc, pedersen)]
+
+def modp_cases(p):
+    g, h = 2, 3
+    x, y = random.randint(1, p - 2), random.randint(1, p - 2)
+    P, Q = pow(g, x, p), pow(h, y, p)
+    C = P * Q % p
+
+    def discrete_log():
+        t, s = DiscreteLog(g, P, p, x).response()
+        return lambda: DiscreteLog(g, P, p).verify(s, t)
+
+    def conjunction():
+        proof = DiscreteLogConjunction(g, h, P, Q, p, x, y).response()
+        return lambda: DiscreteLogConjunction(g, h, P, Q, p).verify(*proof)
+
+    def pedersen():
+        proof = PedersenCommitment(g, h, p, x, y).response(C)
+        return lambda: PedersenCommitment(g, h, p).verify(g, h, C, *proof)
+
+    return [(DiscreteLog, discrete_log), (DiscreteLogConjunction, conjunction),
+            (PedersenCommitment, pedersen)]
+
+def test_performance(simulations=50, bits=2048):
+    p = randprime(2**(bits - 1), 2**bits)
+    names, speedups = [], []
+    for hash_function in ['sha256', 'sha512']:
+        DiscreteLogEcc.curve.hash_function = hash_function
+        for protocol, case in ecc_cases() + modp_cases(p):
+            protocol.supported_hash_name = hash_function
+            times = []
+            for challenge_bits in CHALLENGE_BITS:
+                protocol.challenge_bits = challenge_bits
+                times.append(measure(case(), simulations))
+            protocol.challenge_bits = None
+            name = f'{protocol.__name__} ({hash_function})'
+            print(f"{name}: verify full challenge {times[0] * 1000:.3f} ms, "
+                  f"128-bit {times[1] * 1000:.3f} ms, speedup {times[0] / times[1]:.2f}x")
+            names.append(name)
+            speedups.append(times[0] / times[1])
+    DiscreteLogEcc.curve.hash_function = 'sha256'
+
+    plt.figure(figsize=(12, 5))
+    plt.bar(range(len(names)), speedups)
+    plt.xticks(range(len(names)), names, rotation=30, fontsize=6, ha='right')
+    plt.title(f'Verification speedup of 128-bit challenges (secp256r1, {bits}-bit p)')
+    plt.ylabel('Speedup')
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/challenge_bits.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=50)
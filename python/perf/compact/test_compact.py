@@ -0,0 +1,143 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.zkp_log_discrete import DiscreteLog, DiscreteLogEcc
+from zkps.zkp_log_conjunction import DiscreteLogConjunction, DiscreteLogConjunctionEcc
+from zkps.zkp_log_disjunction import DiscreteLogDisjunction, DiscreteLogDisjunctionEcc
+from zkps.zkp_log_equality import DiscreteLogEqualityEcc
+from zkps.zkp_pederesen_commitment import PedersenCommitment, PedersenCommitmentEcc
+from zkps.zkp_pederesen_commitments import PedersenCommitmentsEqual, PederesenCommitmentsEqualEcc
+from zkps.zkp_pederesen_commitments_messages import PederesenCommitmentsEqualMessages, \
+    PederesenCommitmentsEqualMessagesEcc
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def is_point(curve, item):
+    return isinstance(item, tuple) and len(item) == 2 and \
+        all(isinstance(v, int) for v in item) and curve.is_on_curve(item)
+
+def ecc_size(curve, proof):
+    # points in compressed SEC1 form, scalars at the size of the order
+    size = 0
+    for item in proof:
+        if is_point(curve, item):
+            size += len(curve.encode_point(item))
+        elif isinstance(item, tuple):
+            size += ecc_size(curve, item)
+        else:
+            size += (curve.order.bit_length() + 7) // 8
+    return size
+
+def modp_size(proof):
+    # every value at its own byte length, the challenge is shorter than p
+    return sum(modp_size(item) if isinstance(item, tuple) else (item.bit_length() + 7) // 8
+               for item in proof)
+
+def ecc_cases():
+    curve = DiscreteLogEcc.curve
+    x, y, z = curve.get_random(), curve.get_random(), curve.get_random()
+    g1, h1, g2, h2 = curve.get_generators(4)
+    P, Q = curve.mult_point(x, g1), curve.mult_point(y, h1)
+    R = curve.mult_point(x, h1)
+    C1 = curve.multi_mult([(x, g1), (y, h1)])
+    C2 = curve.multi_mult([(x, g2), (y, h2)])
+    C3 = curve.multi_mult([(x, g2), (z, h2)])
+    return [
+        (DiscreteLogEcc(x), DiscreteLogEcc(), []),
+        (DiscreteLogConjunctionEcc(x, y), DiscreteLogConjunctionEcc(), [g1, h1, P, Q]),
+        (DiscreteLogDisjunctionEcc(x), DiscreteLogDisjunctionEcc(), [g1, h1, P, Q]),
+        (DiscreteLogEqualityEcc(x), DiscreteLogEqualityEcc(), [g1, h1, P, R]),
+        (PedersenCommitmentEcc(x, y), PedersenCommitmentEcc(), [g1, h1, C1]),
+        (PederesenCommitmentsEqualEcc(x, y), PederesenCommitmentsEqualEcc(), [g1, h1, g2, h2, C1, C2]),
+        (PederesenCommitmentsEqualMessagesEcc(x, y, z), PederesenCommitmentsEqualMessagesEcc(),
+         [g1, h1, g2, h2, C1, C3]),
+    ]
+
+def modp_cases(p):
+    g1, h1, g2, h2 = 2, 3, 5, 7
+    x, y, z = (random.randint(1, p - 2) for _ in range(3))
+    P, Q = pow(g1, x, p), pow(h1, y, p)
+    C1 = pow(g1, x, p) * pow(h1, y, p) % p
+    C2 = pow(g2, x, p) * pow(h2, y, p) % p
+    C3 = pow(g1, x, p) * pow(h1, z, p) % p
+    return [
+        (DiscreteLog(g1, P, p, x), DiscreteLog(g1, P, p), [], []),
+        (DiscreteLogConjunction(g1, h1, P, Q, p, x, y), DiscreteLogConjunction(g1, h1, P, Q, p), [], []),
+        (DiscreteLogDisjunction(g1, h1, P, Q, p, x), DiscreteLogDisjunction(g1, h1, P, Q, p),
+         [], [g1, h1, P, Q]),
+        (PedersenCommitment(g1, h1, p, x, y), PedersenCommitment(g1, h1, p), [C1], [g1, h1, C1]),
+        (PedersenCommitmentsEqual(p, x, y), PedersenCommitmentsEqual(p),
+         [g1, h1, g2, h2, C1, C2], [g1, h1, g2, h2, C1, C2]),
+        (PederesenCommitmentsEqualMessages(p, g1, h1, x, y, z), PederesenCommitmentsEqualMessages(p, g1, h1),
+         [C1, C3], [C1, C3]),
+    ]
+
+def ecc_verify(verifier, statement, proof, compact):
+    if isinstance(verifier, DiscreteLogEcc):
+        return lambda: verifier.verify_compact(*proof) if compact else verifier.verify(proof[1], proof[0])
+    if compact:
+        return lambda: verifier.verify_compact(*statement, *proof)
+    return lambda: verifier.verify(*statement, *proof)
+
+def modp_verify(verifier, statement, proof, compact):
+    if isinstance(verifier, DiscreteLog):
+        return lambda: verifier.verify_compact(*proof) if compact else verifier.verify(proof[1], proof[0])
+    if compact:
+        return lambda: verifier.verify_compact(*statement, *proof)
+    return lambda: verifier.verify(*statement, *proof)
+
+def test_performance(simulations=50, bits=2048):
+    names, full_times, compact_times = [], [], []
+
+    curve = DiscreteLogEcc.curve
+    for prover, verifier, statement in ecc_cases():
+        name = type(prover).__name__
+        proof = prover.response(*statement)
+        compact = prover.response(*statement, compact=True)
+        t_full = measure(ecc_verify(verifier, statement, proof, False), simulations)
+        t_compact = measure(ecc_verify(verifier, statement, compact, True), simulations)
+        print(f"{name}: proof {ecc_size(curve, proof)} -> {ecc_size(curve, compact)} bytes, "
+              f"verify {t_full * 1000:.3f} ms -> {t_compact * 1000:.3f} ms")
+        names.append(name)
+        full_times.append(t_full * 1000)
+        compact_times.append(t_compact * 1000)
+
+    p = randprime(2**(bits - 1), 2**bits)
+    for prover, verifier, args, statement in modp_cases(p):
+        name = type(prover).__name__
+        proof = prover.response(*args)
+        compact = prover.response(*args, compact=True)
+        t_full = measure(modp_verify(verifier, statement, proof, False), simulations)
+        t_compact = measure(modp_verify(verifier, statement, compact, True), simulations)
+        print(f"{name} ({bits} bits): proof {modp_size(proof)} -> {modp_size(compact)} bytes, "
+              f"verify {t_full * 1000:.3f} ms -> {t_compact * 1000:.3f} ms")
+        names.append(f'{name} ({bits})')
+        full_times.append(t_full * 1000)
+        compact_times.append(t_compact * 1000)
+
+    x = range(len(names))
+    plt.figure(figsize=(14, 5))
+    plt.bar([i - 0.2 for i in x], full_times, width=0.4, label='(t, s)')
+    plt.bar([i + 0.2 for i in x], compact_times, width=0.4, label='(c, s)')
+    plt.xticks(list(x), names, rotation=30, fontsize=6, ha='right')
+    plt.yscale('log')
+    plt.title('Median verification time per proof format')
+    plt.ylabel('Median execution time (milliseconds)')
+    plt.legend()
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/compact.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=50)
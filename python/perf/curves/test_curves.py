@@ -0,0 +1,62 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.elliptic_curve import get_curve, supported_curves
+from zkps.zkp_log_discrete import DiscreteLogEcc
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_m = time.time()
+        function()
+        e_m = time.time()
+        times.append(e_m - s_m)
+    return median(times)
+
+def time_table(curve):
+    # first multiplication of the generator builds the fixed base table
+    curve.fixed_base_window = curve.fixed_base_window
+    s_t = time.time()
+    curve.mult_point(1, curve.g)
+    e_t = time.time()
+    return e_t - s_t
+
+def test_performance(simulations=20):
+    names = sorted(supported_curves, key=lambda name: get_curve(name).n)
+    results = {'fixed base table': [], 'mult_point G': [], 'mult_point': [],
+               'DiscreteLogEcc verify': []}
+    for name in names:
+        curve = get_curve(name)
+        point = curve.get_generators(1)[0]
+        DiscreteLogEcc.curve = curve
+        prover = DiscreteLogEcc(curve.get_random())
+        t, s = prover.response()
+
+        results['fixed base table'].append(time_table(curve))
+        results['mult_point G'].append(measure(
+            lambda: curve.mult_point(curve.get_random(), curve.g, validate=False), simulations))
+        results['mult_point'].append(measure(
+            lambda: curve.mult_point(curve.get_random(), point, validate=False), simulations))
+        results['DiscreteLogEcc verify'].append(measure(
+            lambda: DiscreteLogEcc().verify(s, t), simulations))
+        print(f"{name} ({curve.security_bits} bits, cofactor {curve.cofactor}): " +
+              ', '.join(f"{case} {times[-1] * 1000:.3f} ms" for case, times in results.items()))
+    DiscreteLogEcc.curve = get_curve('secp256r1')
+
+    plt.figure(figsize=(14, 5))
+    for case, times in results.items():
+        plt.plot(names, [t * 1000 for t in times], marker='o', label=case)
+    plt.xticks(rotation=30, fontsize=7)
+    plt.yscale('log')
+    plt.title('Median latency per curve, ordered by group order')
+    plt.ylabel('Median execution time (miliseconds)')
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/curves.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=20)
@@ -0,0 +1,72 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.elliptic_curve import get_curve
+from zkps.zkp_log_discrete import DiscreteLogEcc
+
+CURVES = ['secp256r1', 'ed25519']
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_m = time.time()
+        function()
+        e_m = time.time()
+        times.append(e_m - s_m)
+    return median(times)
+
+def operations(curve):
+    P, Q = curve.get_generators(2)
+    jp, jq = curve._to_jacobian(P), curve._to_jacobian(Q)
+    jp = curve._jacobian_double(curve._jacobian_add(jp, jq))
+    k, l = curve.get_random(), curve.get_random()
+    return {
+        'double x1000': lambda: [curve._jacobian_double(jp) for _ in range(1000)],
+        'add x1000': lambda: [curve._jacobian_add(jp, jq) for _ in range(1000)],
+        'mult_point': lambda: curve.mult_point(k, P, validate=False),
+        'mult_point G': lambda: curve.mult_point(k, curve.g, validate=False),
+        'multi_mult 2': lambda: curve.multi_mult([(k, P), (l, Q)], validate=False),
+    }
+
+def protocol(curve):
+    DiscreteLogEcc.curve = curve
+    prover = DiscreteLogEcc(curve.get_random())
+    verifier = DiscreteLogEcc()
+    t, s = prover.response()
+    return {
+        'DiscreteLogEcc response': prover.response,
+        'DiscreteLogEcc verify': lambda: verifier.verify(s, t),
+    }
+
+def test_performance(simulations=50):
+    results = {}
+    for name in CURVES:
+        curve = get_curve(name)
+        # build the generator table outside of the measurements
+        curve.mult_point(1, curve.g)
+        cases = dict(operations(curve), **protocol(curve))
+        for case, function in cases.items():
+            results.setdefault(case, {})[name] = measure(function, simulations)
+    DiscreteLogEcc.curve = get_curve('secp256r1')
+
+    for case, times in results.items():
+        line = ', '.join(f"{name} {t * 1000:.3f} ms" for name, t in times.items())
+        print(f"{case}: {line}, speedup {times['secp256r1'] / times['ed25519']:.2f}x")
+
+    x = range(len(results))
+    plt.figure(figsize=(12, 5))
+    for i, name in enumerate(CURVES):
+        plt.bar([j + (i - 0.5) * 0.4 for j in x],
+                [times[name] * 1000 for times in results.values()], width=0.4, label=name)
+    plt.xticks(list(x), list(results), rotation=15, fontsize=7)
+    plt.yscale('log')
+    plt.title('Median execution time, secp256r1 against ed25519')
+    plt.ylabel('Median execution time (miliseconds)')
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/edwards.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=50)
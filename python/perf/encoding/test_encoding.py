@@ -0,0 +1,72 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.elliptic_curve import get_curve
+
+# points hashed into the challenge by each ECC protocol
+PROTOCOLS = {
+    'DiscreteLogEcc': 3,
+    'PedersenCommitmentEcc': 4,
+    'DiscreteLogConjunctionEcc': 6,
+    'DiscreteLogDisjunctionEcc': 6,
+    'DiscreteLogEqualityEcc': 6,
+    'PederesenCommitmentsEqualEcc': 8,
+}
+
+def hash_points_str(curve, points):
+    # the previous challenge input, decimal text of every point
+    return curve.hash_list([str(point).encode() for point in points])
+
+def measure(function, curve, points, simulations):
+    times = []
+    for _ in range(simulations):
+        s_h = time.time()
+        for _ in range(100):
+            function(curve, points)
+        e_h = time.time()
+        times.append((e_h - s_h) / 100)
+    return median(times)
+
+def time_decode(curve, simulations):
+    data = [curve.encode_point(point) for point in curve.get_generators(100)]
+    times = []
+    for _ in range(simulations):
+        s_d = time.time()
+        for item in data:
+            curve.decode_point(item)
+        e_d = time.time()
+        times.append((e_d - s_d) / len(data))
+    return median(times)
+
+def test_performance(simulations=20, curve_name='secp256r1'):
+    curve = get_curve(curve_name)
+    points = curve.get_generators(max(PROTOCOLS.values()))
+
+    y_str = []
+    y_bytes = []
+    for name, size in PROTOCOLS.items():
+        t_str = measure(hash_points_str, curve, points[:size], simulations)
+        t_bytes = measure(lambda c, p: c.hash_points(p), curve, points[:size], simulations)
+        y_str.append(t_str * 1e6)
+        y_bytes.append(t_bytes * 1e6)
+        print(f"{name} ({size} points): str {t_str * 1e6:.2f} us, "
+              f"SEC1 {t_bytes * 1e6:.2f} us, speedup {t_str / t_bytes:.2f}x")
+    print(f"Input size per point: str {len(str(points[0]).encode())} bytes, "
+          f"SEC1 {len(curve.encode_point(points[0]))} bytes")
+    print(f"decode_point (compressed): {time_decode(curve, simulations) * 1e6:.2f} us")
+
+    x = range(len(PROTOCOLS))
+    plt.figure(figsize=(12, 5))
+    plt.bar([i - 0.2 for i in x], y_str, width=0.4, label='str(point)')
+    plt.bar([i + 0.2 for i in x], y_bytes, width=0.4, label='SEC1 compressed')
+    plt.xticks(list(x), list(PROTOCOLS), rotation=15, fontsize=7)
+    plt.title(f'Median challenge hashing time on {curve_name}')
+    plt.ylabel('Median execution time (microseconds)')
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/encoding.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=20)
@@ -0,0 +1,65 @@
+import os
+import time
+import random
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.elliptic_curve import EllipticCurve, get_curve
+from zkps.field import PrimeField, special_fields
+
+CURVES = ['secp256k1', 'secp256r1', 'P192', 'P512']
+
+def time_reduce(field, products):
+    s_r = time.time()
+    for x in products:
+        field.reduce(x)
+    e_r = time.time()
+    return (e_r - s_r) / len(products)
+
+def time_mult(curve, simulations):
+    point = curve.get_generators(1)[0]
+    times = []
+    for _ in range(simulations):
+        k = curve.get_random()
+        s_m = time.time()
+        curve.mult_point(k, point)
+        e_m = time.time()
+        times.append(e_m - s_m)
+    return median(times)
+
+def test_performance(simulations=50, reductions=100000):
+    labels = []
+    y_reduce = []
+    y_mult = []
+
+    for name in CURVES:
+        curve = get_curve(name)
+        products = [random.randrange(curve.p) * random.randrange(curve.p)
+                    for _ in range(reductions)]
+        for field in [PrimeField(curve.p)] + special_fields(curve.p):
+            assert all(field.reduce(x) == x % curve.p for x in products[:1000])
+            backend = EllipticCurve(name, curve.a, curve.b, curve.G, curve.p,
+                                    curve.n, field=field)
+            reduce_ = time_reduce(field, products)
+            mult = time_mult(backend, simulations)
+            enabled = ' (enabled)' if type(field) is type(curve.field) else ''
+            print(f"{name} {field.name}{enabled}: reduce {reduce_ * 1e9:.0f} ns, "
+                  f"mult_point {mult * 1000:.3f} ms")
+            labels.append(f'{name} {field.name}')
+            y_reduce.append(reduce_ * 1e9)
+            y_mult.append(mult * 1000)
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    axes[0].barh(labels, y_reduce, color='lightblue')
+    axes[0].set_title('Median reduction of a product (nanoseconds)')
+    axes[1].barh(labels, y_mult, color='lightcoral')
+    axes[1].set_title('Median mult_point (miliseconds)')
+    for ax in axes:
+        ax.invert_yaxis()
+        ax.grid(True)
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/field_backends.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=100)
@@ -0,0 +1,51 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.elliptic_curve import EllipticCurve, get_curve
+
+def measure(curve, points, simulations, size):
+    times = []
+    for _ in range(simulations):
+        pairs = [(curve.get_random(), point) for point in points[:size]]
+        s_m = time.time()
+        if size == 1:
+            curve.mult_point(*pairs[0])
+        else:
+            curve.multi_mult(pairs)
+        e_m = time.time()
+        times.append(e_m - s_m)
+    return median(times)
+
+def test_performance(sizes=(1, 2, 4, 8, 16, 64, 256), simulations=20):
+    glv = get_curve('secp256k1')
+    # The same curve without the endomorphism runs the generic wNAF/Straus path.
+    generic = EllipticCurve('secp256k1', glv.a, glv.b, glv.G, glv.p, glv.n)
+    points = glv.get_generators(max(sizes))
+
+    y_generic = []
+    y_glv = []
+    for size in sizes:
+        print(f"Running {simulations} simulations for {size} points")
+        t_generic = measure(generic, points, simulations, size)
+        t_glv = measure(glv, points, simulations, size)
+        y_generic.append(t_generic * 1000)
+        y_glv.append(t_glv * 1000)
+        print(f"{size} points: generic {t_generic * 1000:.3f} ms, glv {t_glv * 1000:.3f} ms, "
+              f"speedup {t_generic / t_glv:.2f}x")
+
+    plt.plot(sizes, y_generic, marker='o', label='generic')
+    plt.plot(sizes, y_glv, marker='o', label='glv')
+    plt.xscale('log', base=2)
+    plt.yscale('log')
+    plt.title('Median variable base multiplication on secp256k1')
+    plt.xlabel('Number of (scalar, point) pairs')
+    plt.ylabel('Median execution time (miliseconds)')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/glv_secp256k1.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=50)
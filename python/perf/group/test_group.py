@@ -0,0 +1,67 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.group import SchnorrGroup
+from zkps.zkp_log_discrete import DiscreteLog
+from zkps.zkp_log_conjunction import DiscreteLogConjunction
+from zkps.zkp_pederesen_commitment import PedersenCommitment
+
+def measure(function, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        function()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def cases(group, modulus):
+    # the same elements of the subgroup, modulus is either the plain p
+    # (exponents modulo p - 1) or the group (exponents modulo q)
+    p = group.p
+    g, h = group.get_generators(2)
+    x, y = group.get_random(), group.get_random()
+    X, Y = pow(g, x, p), pow(h, y, p)
+    C = X * Y % p
+
+    def discrete_log():
+        t, s = DiscreteLog(g, X, modulus, x).response()
+        DiscreteLog(g, X, modulus).verify(s, t)
+
+    def conjunction():
+        proof = DiscreteLogConjunction(g, h, X, Y, modulus, x, y).response()
+        DiscreteLogConjunction(g, h, X, Y, modulus).verify(*proof)
+
+    def pedersen():
+        proof = PedersenCommitment(g, h, modulus, x, y).response(C)
+        PedersenCommitment(g, h, modulus).verify(g, h, C, *proof)
+
+    return [(DiscreteLog, discrete_log), (DiscreteLogConjunction, conjunction),
+            (PedersenCommitment, pedersen)]
+
+def test_performance(simulations=20, sizes=[(1024, 160), (2048, 224), (2048, 256), (3072, 256)]):
+    names, speedups = [], []
+    for p_bits, q_bits in sizes:
+        group = SchnorrGroup.generate(p_bits, q_bits)
+        for (protocol, full), (_, subgroup) in zip(cases(group, group.p), cases(group, group)):
+            t_full = measure(full, simulations)
+            t_subgroup = measure(subgroup, simulations)
+            name = f'{protocol.__name__} ({p_bits}/{q_bits})'
+            print(f"{name}: prove and verify mod p - 1 {t_full * 1000:.3f} ms, "
+                  f"mod q {t_subgroup * 1000:.3f} ms, speedup {t_full / t_subgroup:.2f}x")
+            names.append(name)
+            speedups.append(t_full / t_subgroup)
+
+    plt.figure(figsize=(12, 5))
+    plt.bar(range(len(names)), speedups)
+    plt.xticks(range(len(names)), names, rotation=30, fontsize=6, ha='right')
+    plt.title('Speedup of exponents modulo the subgroup order q over p - 1')
+    plt.ylabel('Speedup')
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/group.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=20)
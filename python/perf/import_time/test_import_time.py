@@ -0,0 +1,99 @@
+import os
+import sys
+import time
+import subprocess
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.elliptic_curve import EllipticCurve, CURVE_PARAMETERS, get_curve
+
+MODULES = ['zkp_log_discrete', 'zkp_log_conjunction', 'zkp_log_disjunction',
+           'zkp_log_equality', 'zkp_pederesen_commitment',
+           'zkp_pederesen_commitments', 'zkp_pederesen_commitments_messages']
+
+IMPORT_SCRIPT = """
+import time
+s_i = time.time()
+{imports}
+e_i = time.time()
+print(e_i - s_i)
+"""
+
+def time_import(simulations):
+    imports = '\n'.join(f'import zkps.{module}' for module in MODULES)
+    times = []
+    for _ in range(simulations):
+        # a fresh interpreter per run, the import cache would hide the cost
+        output = subprocess.check_output(
+            [sys.executable, '-c', IMPORT_SCRIPT.format(imports=imports)])
+        times.append(float(output))
+    return median(times)
+
+def build_all_curves():
+    for name, parameters in CURVE_PARAMETERS.items():
+        # as get_curve does, ed25519 is built by its own model class
+        parameters = dict(parameters)
+        model = parameters.pop('model', EllipticCurve)
+        field = parameters.pop('field', None)
+        model(name, field=field and field(), **parameters)
+
+def time_eager_registry(simulations):
+    # the registry used to build every curve on each get_curve call, once for
+    # every protocol module that declares a curve
+    times = []
+    for _ in range(simulations):
+        s_b = time.time()
+        for _ in MODULES:
+            build_all_curves()
+        e_b = time.time()
+        times.append(e_b - s_b)
+    return median(times)
+
+def time_cached_registry(simulations):
+    get_curve('secp256r1')
+    times = []
+    for _ in range(simulations):
+        s_g = time.time()
+        for _ in MODULES:
+            get_curve('secp256r1')
+        e_g = time.time()
+        times.append(e_g - s_g)
+    return median(times)
+
+def time_first_proofs(shared):
+    # every protocol's first fixed base multiplication builds the generator
+    # table of its curve, once overall when the curve object is shared
+    params = CURVE_PARAMETERS['secp256r1']
+    s_f = time.time()
+    for _ in MODULES:
+        curve = shared or EllipticCurve('secp256r1', **params)
+        curve.mult_point(curve.get_random(), curve.g)
+    e_f = time.time()
+    return e_f - s_f
+
+def test_performance(simulations=20):
+    t_import = time_import(simulations)
+    t_eager = time_eager_registry(simulations)
+    t_cached = time_cached_registry(simulations)
+    params = CURVE_PARAMETERS['secp256r1']
+    t_first_own = time_first_proofs(None)
+    t_first_shared = time_first_proofs(EllipticCurve('secp256r1', **params))
+    print(f"Import of all protocol modules: {t_import * 1000:.3f} ms")
+    print(f"Curve lookups, building every curve per call: {t_eager * 1000:.3f} ms")
+    print(f"Curve lookups, cached registry: {t_cached * 1000:.3f} ms")
+    print(f"First proof of every protocol, one curve each: {t_first_own * 1000:.3f} ms")
+    print(f"First proof of every protocol, shared curve: {t_first_shared * 1000:.3f} ms")
+
+    labels = ['import', 'eager lookups', 'cached lookups',
+              'first proofs\n(own curves)', 'first proofs\n(shared curve)']
+    values = [t_import, t_eager, t_cached, t_first_own, t_first_shared]
+    plt.figure(figsize=(10, 5))
+    plt.bar(labels, [t * 1000 for t in values])
+    plt.yscale('log')
+    plt.title(f'Median time for {len(MODULES)} protocol modules')
+    plt.ylabel('Median execution time (miliseconds)')
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/import_time.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=20)
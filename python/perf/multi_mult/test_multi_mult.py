@@ -0,0 +1,60 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from zkps.elliptic_curve import get_curve
+from statistics import median
+
+def test_performance(max_size=4096, simulations=3, curve_name='secp256r1'):
+    curve = get_curve(curve_name)
+    points = curve.get_generators(max_size)
+
+    x_ = []
+    y_s = []
+    y_p = []
+
+    # Double the number of (scalar, point) pairs on each step
+    size = 1
+    while size <= max_size:
+        times_s = []
+        times_p = []
+
+        for i in range(simulations):
+            print(f"Running simulation {i+1}/{simulations} for {size} pairs")
+            pairs = [(curve.get_random(), point) for point in points[:size]]
+
+            s_s = time.time()
+            straus = curve.multi_mult(pairs, method='straus')
+            e_s = time.time()
+
+            s_p = time.time()
+            pippenger = curve.multi_mult(pairs, method='pippenger')
+            e_p = time.time()
+
+            assert straus == pippenger
+            times_s.append(e_s - s_s)
+            times_p.append(e_p - s_p)
+
+        y_s.append(median(times_s) / size)
+        y_p.append(median(times_p) / size)
+        x_.append(size)
+        print(f"{size} pairs: straus {y_s[-1] * 1000:.3f} ms/pair, pippenger {y_p[-1] * 1000:.3f} ms/pair")
+        size *= 2
+
+    crossover = next((size for size, s, p in zip(x_, y_s, y_p) if p < s), None)
+    print(f"Pippenger is faster from {crossover} pairs on "
+          f"(PIPPENGER_THRESHOLD = {curve.PIPPENGER_THRESHOLD})")
+
+    plt.plot(x_, y_s, marker='o', label='straus')
+    plt.plot(x_, y_p, marker='o', label='pippenger')
+    plt.xscale('log', base=2)
+    plt.title(f'Median multi_mult time per pair on {curve_name}')
+    plt.xlabel('Number of (scalar, point) pairs')
+    plt.ylabel('Median execution time per pair (seconds)')
+    plt.grid(True)
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig(f'images/multi_mult_{curve_name}_{max_size}pairs.png')
+
+
+if __name__ == "__main__":
+    test_performance(max_size=16384, simulations=3)
@@ -0,0 +1,109 @@
+import os
+import time
+import random
+import hashlib
+import matplotlib.pyplot as plt
+from statistics import median
+from sympy import randprime
+from zkps.elliptic_curve import get_curve
+from zkps.transcript import Transcript
+from zkps.zkp_base import Base, BaseEcc
+
+HASH_FUNCTIONS = ['md5', 'sha1', 'sha256', 'sha512']
+
+def hash_str(hash_function, items):
+    # the previous Base._hash, decimal text of every item concatenated
+    s_ = ''
+    h = hashlib.new(hash_function)
+    for item in items:
+        s_ += str(item)
+    h.update(s_.encode())
+    return int(h.hexdigest(), 16)
+
+def hash_points_str(curve, points):
+    # the previous hash_points, decimal text of every point
+    return curve.hash_list([str(point).encode() for point in points])
+
+def transcript_ints(hash_function, statement, commitments, order):
+    transcript = Transcript(b'DiscreteLogConjunction', hash_function)
+    transcript.append_ints(b'statement', statement)
+    transcript.append_ints(b'commitment', commitments)
+    return transcript.challenge(b'challenge', order)
+
+def transcript_points(curve, statement, commitments):
+    transcript = Transcript(b'DiscreteLogConjunctionEcc', curve.hash_function, curve)
+    transcript.append_points(b'statement', statement)
+    transcript.append_points(b'commitment', commitments)
+    return transcript.challenge(b'challenge', curve.order)
+
+def measure(function, simulations, repeat=200):
+    times = []
+    for _ in range(simulations):
+        s_h = time.time()
+        for _ in range(repeat):
+            function()
+        e_h = time.time()
+        times.append((e_h - s_h) / repeat)
+    return median(times)
+
+def test_performance(simulations=20, bits=2048):
+    # the six values hashed by the conjunction and disjunction protocols
+    p = randprime(2**(bits - 1), 2**bits)
+    ints = [random.randrange(p) for _ in range(6)]
+    curve = get_curve('secp256r1')
+    points = curve.get_generators(6)
+
+    rows = []
+    for hash_function in HASH_FUNCTIONS:
+        curve.hash_function = hash_function
+        t_str = measure(lambda: hash_str(hash_function, ints) % p, simulations)
+        t_ints = measure(lambda: transcript_ints(hash_function, ints[:4], ints[4:], p - 1), simulations)
+        t_points_str = measure(lambda: hash_points_str(curve, points), simulations)
+        t_points = measure(lambda: transcript_points(curve, points[:4], points[4:]), simulations)
+        rows.append((t_str, t_ints, t_points_str, t_points))
+        print(f"{hash_function}: mod p {bits} bits str {t_str * 1e6:.2f} us, transcript {t_ints * 1e6:.2f} us "
+              f"({t_str / t_ints:.2f}x); ECC str {t_points_str * 1e6:.2f} us, "
+              f"transcript {t_points * 1e6:.2f} us ({t_points_str / t_points:.2f}x)")
+    curve.hash_function = 'sha256'
+
+    x = range(len(HASH_FUNCTIONS))
+    labels = [f'{bits}-bit ints, str', f'{bits}-bit ints, transcript', 'points, str', 'points, transcript']
+    plt.figure(figsize=(10, 5))
+    for i, label in enumerate(labels):
+        plt.bar([j - 0.3 + 0.2 * i for j in x], [row[i] * 1e6 for row in rows], width=0.2, label=label)
+    plt.xticks(list(x), HASH_FUNCTIONS)
+    plt.title('Median challenge hashing time of six values')
+    plt.ylabel('Median execution time (microseconds)')
+    plt.legend()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/transcript.png')
+
+class ModP(Base):
+    pass
+
+class Ecc(BaseEcc):
+    curve = get_curve('secp256r1')
+
+def test_prefix_cache(simulations=20, bits=2048):
+    # statements of the conjunction (4 values) and Pedersen equality (6 values)
+    # protocols, two fresh commitments per proof
+    p = randprime(2**(bits - 1), 2**bits)
+    ints = [random.randrange(p) for _ in range(8)]
+    points = Ecc.curve.get_generators(8)
+    verifier = ModP()
+    for size in [4, 6]:
+        statement, commitments = ints[:size], ints[size:size + 2]
+        t_full = measure(lambda: transcript_ints('sha256', statement, commitments, p - 1), simulations)
+        t_cached = measure(lambda: verifier._challenge(statement, commitments, p - 1), simulations)
+        print(f"mod p {bits} bits, statement of {size}: full {t_full * 1e6:.2f} us, "
+              f"cached prefix {t_cached * 1e6:.2f} us ({t_full / t_cached:.2f}x)")
+        statement, commitments = points[:size], points[size:size + 2]
+        t_full = measure(lambda: transcript_points(Ecc.curve, statement, commitments), simulations)
+        t_cached = measure(lambda: Ecc._challenge(statement, commitments), simulations)
+        print(f"secp256r1, statement of {size}: full {t_full * 1e6:.2f} us, "
+              f"cached prefix {t_cached * 1e6:.2f} us ({t_full / t_cached:.2f}x)")
+
+
+if __name__ == "__main__":
+    test_performance(simulations=20)
+    test_prefix_cache(simulations=20)
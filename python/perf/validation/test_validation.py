@@ -0,0 +1,150 @@
+import os
+import time
+import matplotlib.pyplot as plt
+from statistics import median
+from zkps.zkp_log_discrete import DiscreteLogEcc
+from zkps.zkp_log_conjunction import DiscreteLogConjunctionEcc
+from zkps.zkp_log_disjunction import DiscreteLogDisjunctionEcc
+from zkps.zkp_log_equality import DiscreteLogEqualityEcc
+from zkps.zkp_pederesen_commitment import PedersenCommitmentEcc
+from zkps.zkp_pederesen_commitments import PederesenCommitmentsEqualEcc
+from zkps.zkp_pederesen_commitments_messages import PederesenCommitmentsEqualMessagesEcc
+
+X, Y, Z = 5, 7, 11
+
+
+def discrete_log(curve):
+    t, s = DiscreteLogEcc(X).response()
+    return lambda: DiscreteLogEcc().verify(s, t)
+
+def conjunction(curve):
+    g, h = curve.get_generators(2)
+    P, Q = curve.mult_point(X, g), curve.mult_point(Y, h)
+    t1s1, t2s2 = DiscreteLogConjunctionEcc(X, Y).response(g, h, P, Q)
+    return lambda: DiscreteLogConjunctionEcc().verify(g, h, P, Q, t1s1, t2s2)
+
+def disjunction(curve):
+    g, h = curve.get_generators(2)
+    P, Q = curve.mult_point(X, g), curve.mult_point(Y, h)
+    t1c1s1, t2c2s2 = DiscreteLogDisjunctionEcc(X).response(g, h, P, Q)
+    return lambda: DiscreteLogDisjunctionEcc().verify(g, h, P, Q, t1c1s1, t2c2s2)
+
+def equality(curve):
+    g, h = curve.get_generators(2)
+    P, Q = curve.mult_point(X, g), curve.mult_point(X, h)
+    t1, t2, s = DiscreteLogEqualityEcc(X).response(g, h, P, Q)
+    return lambda: DiscreteLogEqualityEcc().verify(g, h, P, Q, t1, t2, s)
+
+def pedersen_commitment(curve):
+    g, h = curve.get_generators(2)
+    P = curve.multi_mult([(X, g), (Y, h)])
+    t, s1, s2 = PedersenCommitmentEcc(X, Y).response(g, h, P)
+    return lambda: PedersenCommitmentEcc().verify(g, h, P, t, s1, s2)
+
+def pedersen_commitments(curve):
+    g1, h1, g2, h2 = curve.get_generators(4)
+    P = curve.multi_mult([(X, g1), (Y, h1)])
+    Q = curve.multi_mult([(X, g2), (Y, h2)])
+    t1s1, t2s2 = PederesenCommitmentsEqualEcc(X, Y).response(g1, h1, g2, h2, P, Q)
+    return lambda: PederesenCommitmentsEqualEcc().verify(g1, h1, g2, h2, P, Q, t1s1, t2s2)
+
+def pedersen_commitments_messages(curve):
+    g1, h1, g2, h2 = curve.get_generators(4)
+    P = curve.multi_mult([(X, g1), (Y, h1)])
+    Q = curve.multi_mult([(X, g2), (Z, h2)])
+    t1s1, t2s2, s3 = PederesenCommitmentsEqualMessagesEcc(X, Y, Z).response(g1, h1, g2, h2, P, Q)
+    return lambda: PederesenCommitmentsEqualMessagesEcc().verify(g1, h1, g2, h2, P, Q, t1s1, t2s2, s3)
+
+CASES = {
+    DiscreteLogEcc: discrete_log,
+    DiscreteLogConjunctionEcc: conjunction,
+    DiscreteLogDisjunctionEcc: disjunction,
+    DiscreteLogEqualityEcc: equality,
+    PedersenCommitmentEcc: pedersen_commitment,
+    PederesenCommitmentsEqualEcc: pedersen_commitments,
+    PederesenCommitmentsEqualMessagesEcc: pedersen_commitments_messages,
+}
+
+
+JACOBIAN_OPERATIONS = ('_jacobian_double', '_jacobian_add', '_jacobian_add_mixed')
+
+def on_curve_jacobian(curve, jpoint):
+    # Y^2 = X^3 + a * X * Z^4 + b * Z^6, the curve equation in Jacobian
+    # coordinates, checked without an inversion
+    X, Y, Z = jpoint
+    if curve._is_infinity(jpoint):
+        return True
+    p = curve.p
+    ZZ = Z * Z % p
+    ZZZZ = ZZ * ZZ % p
+    return (Y * Y - X * X * X - curve.a * X * ZZZZ - curve.b * ZZZZ * ZZ) % p == 0
+
+def checked_arithmetic(curve):
+    """Checks the operands of every doubling and addition inside the
+    multiplications of curve, as the affine arithmetic did on every
+    operation before the points were only checked at the protocol boundary."""
+    def check(method):
+        def wrapper(*jpoints):
+            assert all(on_curve_jacobian(curve, jpoint) for jpoint in jpoints)
+            return method(*jpoints)
+        return wrapper
+
+    def check_mixed(method):
+        def wrapper(jpoint, point):
+            assert on_curve_jacobian(curve, jpoint) and curve.is_on_curve(point)
+            return method(jpoint, point)
+        return wrapper
+
+    curve._jacobian_double = check(curve._jacobian_double)
+    curve._jacobian_add = check(curve._jacobian_add)
+    curve._jacobian_add_mixed = check_mixed(curve._jacobian_add_mixed)
+
+def trusted_arithmetic(curve):
+    for name in JACOBIAN_OPERATIONS:
+        curve.__dict__.pop(name, None)
+
+def measure(verify, simulations):
+    times = []
+    for _ in range(simulations):
+        s_v = time.time()
+        verify()
+        e_v = time.time()
+        times.append(e_v - s_v)
+    return median(times)
+
+def test_performance(simulations=50):
+    names = []
+    y_checked = []
+    y_trusted = []
+
+    for zkp_class, case in CASES.items():
+        print(f"Running {simulations} simulations for {zkp_class.__name__}")
+        verify = case(zkp_class.curve)
+
+        checked_arithmetic(zkp_class.curve)
+        checked = measure(verify, simulations)
+        trusted_arithmetic(zkp_class.curve)
+        trusted = measure(verify, simulations)
+
+        names.append(zkp_class.__name__)
+        y_checked.append(checked * 1000)
+        y_trusted.append(trusted * 1000)
+        print(f"{zkp_class.__name__}: checked {checked * 1000:.3f} ms, "
+              f"trusted {trusted * 1000:.3f} ms, saved {(checked - trusted) * 1000:.3f} ms")
+
+    positions = range(len(names))
+    plt.figure(figsize=(12, 5))
+    plt.barh([i - 0.2 for i in positions], y_checked, height=0.4, label='checked')
+    plt.barh([i + 0.2 for i in positions], y_trusted, height=0.4, label='trusted')
+    plt.yticks(list(positions), names)
+    plt.title('Median verify time with per operation and boundary point checks')
+    plt.xlabel('Median execution time (miliseconds)')
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    os.makedirs('images', exist_ok=True)
+    plt.savefig('images/validation.png')
+
+
+if __name__ == "__main__":
+    test_performance(simulations=200)
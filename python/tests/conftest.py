@@ -2,9 +2,11 @@ import time
 from datetime import datetime
 import pytest
 from zkps.elliptic_curve import get_curve
+from zkps.backend import get_backend
 from hashlib import sha512 as hash_f
 
 DATE = datetime.now().strftime("%d-%m-%Y %H%M%S")
+BACKEND = get_backend().name
 
 X = 5
 Y = 7
@@ -15,6 +17,8 @@ G2 = 5
 H2 = 7
 
 MODULO = 13
+# safe prime p = 2q + 1, 4 generates the subgroup of prime order q
+SAFE_PRIME = 170141183460469231731687303715884114527
 
 XP = pow(G, X, MODULO)
 XQ = pow(H, X, MODULO) #for test log equality
@@ -25,6 +29,9 @@ G1C, H1C, G2C, H2C = CURVE.get_generators(4)
 XPC = CURVE.scalar_mult(X, G1C)
 YQC = CURVE.scalar_mult(Y, H1C)
 
+def pytest_report_header(config):
+    return f"zkps big integer backend: {BACKEND}"
+
 @pytest.fixture(scope="session")
 def hash_function():
     return hash_f
@@ -80,6 +87,11 @@ def Q():
 def p():
     return MODULO
 
+# modulo of the batch and compact tests
+@pytest.fixture(scope="session")
+def safe_prime():
+    return SAFE_PRIME
+
 # h^y
 @pytest.fixture(scope="session") 
 def g1c():
@@ -173,6 +185,6 @@ def time_test(request):
     yield
     # After the test has finished, calculate the time taken and print it
     duration = ( time.time() - start_time ) * 1000
-    with open(f"../results/results_{DATE}.txt", 'a') as file_:
+    with open(f"../results/results_{DATE}_{BACKEND}.txt", 'a') as file_:
         file_.write(f"{request.node.name}: {duration:.2f} miliseconds\n")
     print(f"\n{request.node.name}: {duration:.2f} miliseconds")
\ No newline at end of file
@@ -0,0 +1,34 @@
+import pytest
+from zkps import backend
+from zkps.elliptic_curve import EllipticCurve, get_curve
+from zkps.field import PrimeField
+
+BACKENDS = ['python']
+try:
+    BACKENDS.append(backend.Gmpy2Backend().name)
+except ImportError:
+    pass
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backend(name):
+    big_integers = backend.BACKENDS[name]()
+    p = 2**127 - 1
+
+    assert big_integers.powmod(3, p - 1, p) == 1
+    assert big_integers.powmod(3, -1, p) == big_integers.invert(3, p)
+    assert type(big_integers.powmod(3, 5, p)) is int
+    assert big_integers.jacobi(4, p) == 1 and big_integers.jacobi(p - 1, p) == -1
+    assert type(big_integers.jacobi(3, p)) is int
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("name", BACKENDS)
+def test_curve_backend(name):
+    curve = get_curve('secp256r1')
+    field = PrimeField(curve.p, backend.BACKENDS[name]())
+    other = EllipticCurve('secp256r1', curve.a, curve.b, curve.G, curve.p, curve.n, field=field)
+    point = curve.get_generators(1)[0]
+    k = curve.get_random()
+
+    result = other.mult_point(k, point)
+    assert result == curve.mult_point(k, point)
+    assert all(type(coordinate) is int for coordinate in result)
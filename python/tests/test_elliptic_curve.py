@@ -0,0 +1,197 @@
+import pytest
+from zkps.elliptic_curve import EllipticCurve, get_curve, get_curve_for_security, supported_curves
+
+
+def affine_mult(curve, k, point):
+    result = None
+    for _ in range(k):
+        result = curve.point_add(result, point)
+    return result
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("curve_name", ["secp256k1", "secp256r1", "ed25519"])
+def test_mult_point_jacobian(curve_name):
+    curve = get_curve(curve_name)
+
+    for k in range(1, 20):
+        assert curve.mult_point(k, curve.g) == affine_mult(curve, k, curve.g)
+    assert curve.mult_point(curve.n - 1, curve.g) == curve.point_neg(curve.g)
+    assert curve.mult_point(curve.n, curve.g) is None
+    assert curve.mult_point(-3, curve.g) == curve.point_neg(affine_mult(curve, 3, curve.g))
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("window", [1, 3, 5])
+def test_mult_point_fixed_base(window):
+    # a private copy, get_curve returns the curve shared by all protocols
+    shared = get_curve('secp256r1')
+    curve = EllipticCurve('secp256r1', shared.a, shared.b, shared.G, shared.p, shared.n,
+                          fixed_base_window=window)
+
+    for k in [1, 2, 15, 16, 17, curve.n - 1, curve.get_random()]:
+        expected = curve._to_affine(curve._mult_jacobian(k, curve.g))
+        assert curve.mult_point(k, curve.g) == expected
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("size", [1, 2, 5])
+def test_multi_mult(size):
+    curve = get_curve('secp256r1')
+    pairs = [(curve.get_random(), point) for point in curve.get_generators(size)]
+    pairs.append((curve.get_random(), curve.g))
+
+    expected = None
+    for k, point in pairs:
+        expected = curve.point_add(expected, curve.mult_point(k, point))
+    assert curve.multi_mult(pairs) == expected
+    assert curve.multi_mult(pairs + [(-k, point) for k, point in pairs]) is None
+    assert curve.multi_mult(pairs + pairs) == curve.point_add(expected, expected)
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("size", [1, 7, 60])
+@pytest.mark.parametrize("curve_name", ["secp256r1", "ed25519"])
+def test_multi_mult_pippenger(size, curve_name):
+    curve = get_curve(curve_name)
+    pairs = [(curve.get_random(), point) for point in curve.get_generators(size)]
+
+    assert curve.multi_mult(pairs, method='pippenger') == \
+        curve.multi_mult(pairs, method='straus')
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("window", [2, 4, 5])
+def test_wnaf(window):
+    curve = get_curve('secp256r1')
+    point = curve.get_generators(1)[0]
+
+    for k in [1, 2, 3, 31, 32, curve.n - 1, curve.get_random()]:
+        digits = EllipticCurve._wnaf(k, window)
+        assert sum(d << i for i, d in enumerate(digits)) == k
+        assert all(d % 2 and abs(d) < 1 << (window - 1) for d in digits if d)
+        assert curve.mult_point(k, point) == \
+            curve.multi_mult([(k // 2, point), (k - k // 2, point)])
+
+@pytest.mark.ecc
+def test_validate_points():
+    curve = get_curve('secp256r1')
+    x, y = curve.g
+
+    assert curve.validate_points([None, curve.g, curve.point_neg(curve.g)])
+    assert not curve.validate_points([curve.g, (x, y + 1)])
+    assert not curve.validate_points([(x + curve.p, y)])
+    assert not curve.validate_points([(x, y, 1)])
+
+@pytest.mark.ecc
+def test_glv_secp256k1():
+    curve = get_curve('secp256k1')
+    generic = EllipticCurve('secp256k1', curve.a, curve.b, curve.G, curve.p, curve.n)
+    beta, lam, _ = curve._endomorphism
+    x, y = curve.g
+    assert curve.mult_point(lam, curve.g) == (beta * x % curve.p, y)
+
+    points = curve.get_generators(3)
+    for k in [1, 2, curve.n - 1, curve.get_random()]:
+        k1, k2 = curve._glv_decompose(k)
+        assert (k1 + k2 * lam - k) % curve.n == 0
+        assert max(abs(k1), abs(k2)).bit_length() <= 129
+        assert curve.mult_point(k, points[0]) == generic.mult_point(k, points[0])
+
+    pairs = [(curve.get_random(), point) for point in points]
+    assert curve.multi_mult(pairs) == generic.multi_mult(pairs)
+    assert curve.multi_mult(pairs, method='pippenger') == generic.multi_mult(pairs)
+
+@pytest.mark.ecc
+def test_normalize_batch():
+    curve = get_curve('secp256r1')
+    points = curve.get_generators(5) + [None]
+    jpoints = [curve._mult_jacobian(3, point) if point else curve._JACOBIAN_INFINITY
+               for point in points]
+
+    assert curve.normalize_batch(jpoints) == [curve._to_affine(jp) for jp in jpoints]
+    assert curve.normalize_batch([]) == []
+
+    sums = [[(2, point), (3, curve.g)] for point in points[:3]]
+    assert curve.multi_mult_batch(sums) == [curve.multi_mult(pairs) for pairs in sums]
+
+@pytest.mark.ecc
+def test_get_curve_shared():
+    curve = get_curve('secp256r1')
+
+    assert get_curve('secp256r1') is curve
+    assert get_curve('secp256k1') is not curve
+    with pytest.raises(ValueError):
+        get_curve('curve25519')
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("curve_name", [name for name in supported_curves if name != 'ed25519'])
+def test_encode_point(curve_name):
+    curve = get_curve(curve_name)
+    points = curve.get_generators(10) + [curve.g, None]
+
+    for point in points:
+        for compressed in [True, False]:
+            data = curve.encode_point(point, compressed)
+            assert curve.decode_point(data) == point
+    assert len(curve.encode_point(curve.g)) == 1 + (curve.p.bit_length() + 7) // 8
+    x, y = curve.g
+    with pytest.raises(ValueError):
+        curve.decode_point(curve.encode_point((x, y + 1), compressed=False))
+    with pytest.raises(ValueError):
+        curve.decode_point(b'\x05' + curve.encode_point(curve.g)[1:])
+
+@pytest.mark.ecc
+def test_edwards_curve():
+    curve = get_curve('ed25519')
+    point = curve.get_generators(1)[0]
+
+    assert curve.point_add(point, point) == affine_mult(curve, 2, point)
+    assert curve.point_add(point, None) == point
+    assert curve.point_add(point, curve.point_neg(point)) is None
+    assert curve.multi_mult([(3, point), (-3, point)]) is None
+    # RFC 8032 encoding of the base point
+    assert curve.encode_point(curve.g).hex() == '58' + '66' * 31
+    for compressed in [True, False]:
+        assert curve.decode_point(curve.encode_point(point, compressed)) == point
+        assert curve.decode_point(curve.encode_point(None, compressed)) is None
+    # (0, -1) has order 2, it is on the curve but not in the subgroup
+    torsion = (0, curve.p - 1)
+    assert curve.is_on_curve(torsion)
+    assert curve.validate_points([point, None])
+    assert not curve.validate_points([point, curve.point_add(point, torsion)])
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("curve_name", supported_curves)
+def test_curve_parameters(curve_name):
+    curve = get_curve(curve_name)
+
+    assert curve.validate_parameters()
+    k = curve.get_random()
+    assert curve.multi_mult([(k, curve.g)]) == curve._to_affine(curve._mult_jacobian(k, curve.g))
+
+@pytest.mark.ecc
+def test_get_curve_for_security():
+    assert get_curve_for_security(80) is get_curve('brainpoolP160r1')
+    assert get_curve_for_security(128) is get_curve('ed25519')
+    assert get_curve('BN256').security_bits < 128
+    assert get_curve_for_security(192) is get_curve('P384')
+    with pytest.raises(ValueError):
+        get_curve_for_security(300)
+    broken = get_curve('secp256r1')
+    x, y = broken.g
+    assert not EllipticCurve('broken', broken.a, broken.b, (x, y + 1), broken.p, broken.n).validate_parameters()
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("curve_name", ["secp256r1", "secp256k1", "ed25519"])
+def test_multi_mult_projective_checks(curve_name):
+    curve = get_curve(curve_name)
+    P, Q = curve.get_generators(2)
+    k, l = curve.get_random(), curve.get_random()
+    R = curve.multi_mult([(k, P), (l, Q)])
+
+    assert curve.multi_mult_equals([(k, P), (l, Q)], R)
+    assert not curve.multi_mult_equals([(k, P), (l, Q)], P)
+    assert not curve.multi_mult_equals([(k, P), (l, Q)], None)
+    assert curve.multi_mult_equals([(k, P), (-k, P)], None)
+    assert curve.multi_mult_is_infinity([(k, P), (l, Q), (-1, R)])
+    assert not curve.multi_mult_is_infinity([(k, P), (l, Q), (-2, R)])
+    # scalars above n / 2 run as short negative ones
+    assert curve.multi_mult([(-1, P)]) == curve.point_neg(P)
+    assert curve.multi_mult([(curve.n - 3, P), (5, P)], method='pippenger') == \
+        curve.mult_point(2, P)
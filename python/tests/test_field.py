@@ -0,0 +1,43 @@
+import random
+import pytest
+from zkps.field import PrimeField, MersenneField, PseudoMersenneField, special_fields
+
+FIELDS = [
+    MersenneField(521),
+    PseudoMersenneField(256, 2**32 + 977),
+] + special_fields(2**256 - 2**224 + 2**192 + 2**96 - 1) \
+  + special_fields(2**192 - 2**64 - 1)
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("field", FIELDS, ids=lambda field: f'{field.name}{field.p.bit_length()}')
+def test_reduce(field):
+    generic = PrimeField(field.p)
+
+    values = [0, 1, field.p - 1, field.p, field.p + 1, -1, -field.p - 5]
+    values += [random.randrange(field.p) * random.randrange(field.p) for _ in range(100)]
+    values += [-8 * random.randrange(field.p) * random.randrange(field.p) for _ in range(100)]
+    for x in values:
+        assert field.reduce(x) == generic.reduce(x) == x % field.p
+
+    a = random.randrange(1, field.p)
+    assert field.mul(a, field.inv(a)) == 1
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("field", FIELDS[:2], ids=lambda field: field.name)
+def test_batch_inv(field):
+    values = [random.randrange(1, field.p) for _ in range(20)]
+
+    assert field.batch_inv(values) == [field.inv(value) for value in values]
+    assert field.batch_inv([]) == []
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("p", [2**256 - 2**224 + 2**192 + 2**96 - 1, 2**224 - 2**96 + 1, 13, 17])
+def test_sqrt(p):
+    field = PrimeField(p)
+
+    for _ in range(20):
+        a = random.randrange(p)
+        root = field.sqrt(a * a)
+        assert root * root % p == a * a % p
+    non_residue = next(x for x in range(2, p) if pow(x, (p - 1) // 2, p) != 1)
+    assert field.sqrt(non_residue) is None
@@ -0,0 +1,102 @@
+import pytest
+from zkps.group import SchnorrGroup, get_group
+from zkps.zkp_log_discrete import DiscreteLog, DiscreteLogInteractive
+from zkps.zkp_log_conjunction import DiscreteLogConjunction
+from zkps.zkp_log_disjunction import DiscreteLogDisjunction
+from zkps.zkp_pederesen_commitment import PedersenCommitment
+from zkps.zkp_pederesen_commitments import PedersenCommitmentsEqual
+
+@pytest.fixture(scope="module")
+def group(safe_prime):
+    return SchnorrGroup.from_safe_prime(safe_prime)
+
+@pytest.mark.noninteractive
+def test_group_parameters(group):
+    p = group.p
+    assert group.validate()
+    assert group.q == (p - 1) // 2
+    assert group.is_element(pow(group.g, 12345, p))
+    assert not group.is_element(p - 1)
+    assert not SchnorrGroup(p, group.q, p - 1).validate()
+    assert all(group.is_element(g) and g != 1 for g in group.get_generators(3))
+    assert 0 < group.get_random() < group.q
+
+    assert get_group(group) is group
+    assert get_group(13).q == 12
+
+@pytest.mark.noninteractive
+def test_group_generate():
+    group = SchnorrGroup.generate(512, 160)
+
+    assert group.validate()
+    assert group.p.bit_length() == 512
+    assert group.q.bit_length() == 160
+
+@pytest.mark.noninteractive
+def test_group_protocols(group):
+    p = group.p
+    g, h = group.get_generators(2)
+    x, y = group.get_random(), group.get_random()
+    X, Y = pow(g, x, p), pow(h, y, p)
+    C = X * Y % p
+
+    t, s = DiscreteLog(g, X, group, x).response()
+    assert s < group.q
+    DiscreteLog(g, X, group).verify(s, t)
+    DiscreteLog(g, X, group).verify_compact(*DiscreteLog(g, X, group, x).response(compact=True))
+    assert DiscreteLog(g, X, group).verify_batch([DiscreteLog(g, X, group, x).response()
+                                                  for _ in range(4)]) == []
+
+    proof = DiscreteLogConjunction(g, h, X, Y, group, x, y).response()
+    DiscreteLogConjunction(g, h, X, Y, group).verify(*proof)
+
+    proof = DiscreteLogDisjunction(g, h, X, Y, group, x).response()
+    DiscreteLogDisjunction(g, h, X, Y, group).verify(g, h, X, Y, *proof)
+
+    proof = PedersenCommitment(g, h, group, x, y).response(C)
+    PedersenCommitment(g, h, group).verify(g, h, C, *proof)
+
+    g2, h2 = group.get_generators(2)
+    Q = pow(g2, x, p) * pow(h2, y, p) % p
+    proof = PedersenCommitmentsEqual(group, x, y).response(g, h, g2, h2, C, Q)
+    PedersenCommitmentsEqual(group).verify(g, h, g2, h2, C, Q, *proof)
+    with pytest.raises(AssertionError):
+        (t1, s1), (t2, s2) = proof
+        PedersenCommitmentsEqual(group).verify(g, h, g2, h2, C, Q, (t1, s1 + 1), (t2, s2))
+
+@pytest.mark.interactive
+def test_group_interactive(group):
+    p = group.p
+    g = group.g
+    x = group.get_random()
+    client_a = DiscreteLogInteractive(g, pow(g, x, p), group, x)
+    client_b = DiscreteLogInteractive(g, pow(g, x, p), group)
+
+    t = client_a.commitment()
+    s = client_a.response(client_b.challenge())
+    client_b.verify(s, t)
+    with pytest.raises(AssertionError):
+        client_b.verify(s + 1, t)
+
+@pytest.mark.noninteractive
+def test_group_statement_validation(group):
+    # -X has order 2q, exponents mod q do not apply to it
+    p = group.p
+    g, h = group.get_generators(2)
+    x = group.get_random()
+    X = pow(g, x, p)
+
+    with pytest.raises(ValueError):
+        DiscreteLog(g, p - X, group)
+    with pytest.raises(ValueError):
+        DiscreteLogInteractive(p - g, X, group)
+    with pytest.raises(ValueError):
+        DiscreteLogDisjunction(g, h, X, 0, group)
+    DiscreteLog(g, p - X, p)
+
+    client_b = DiscreteLogDisjunction(g, h, X, pow(h, 5, p), group)
+    proof = DiscreteLogDisjunction(g, h, X, pow(h, 5, p), group, x).response()
+    with pytest.raises(AssertionError):
+        client_b.verify(g, h, p - X, pow(h, 5, p), *proof)
+    with pytest.raises(AssertionError):
+        PedersenCommitment(g, h, group).verify(g, h, p - X, X, 1, 1)
@@ -31,4 +31,26 @@ def test_discrete_log_conjunction_ecc(x, y, g1c, h1c, PC, QC):
     client_b = DiscreteLogConjunctionEcc()
     
     (t1, s1), (t2, s2) = client_a.response(g1c, h1c, PC, QC)
-    client_b.verify(g1c, h1c, PC, QC, (t1, s1), (t2, s2))
\ No newline at end of file
+    client_b.verify(g1c, h1c, PC, QC, (t1, s1), (t2, s2))
+
+@pytest.mark.noninteractive
+def test_discrete_log_conjunction_compact(x, y, safe_prime):
+    p = safe_prime
+    g, h = 4, 9
+    client_a = DiscreteLogConjunction(g, h, pow(g, x, p), pow(h, y, p), p, x, y)
+    client_b = DiscreteLogConjunction(g, h, pow(g, x, p), pow(h, y, p), p)
+
+    c, s1, s2 = client_a.response(compact=True)
+    client_b.verify_compact(c, s1, s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(c, s1, s2 + 1)
+
+@pytest.mark.ecc
+def test_discrete_log_conjunction_ecc_compact(x, y, g1c, h1c, PC, QC):
+    client_a = DiscreteLogConjunctionEcc(x, y)
+    client_b = DiscreteLogConjunctionEcc()
+
+    c, s1, s2 = client_a.response(g1c, h1c, PC, QC, compact=True)
+    client_b.verify_compact(g1c, h1c, PC, QC, c, s1, s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1c, h1c, QC, PC, c, s1, s2)
@@ -1,5 +1,7 @@
 import pytest
 from zkps.zkp_log_discrete import *
+from zkps.elliptic_curve import get_curve
+from zkps.group import SchnorrGroup
 
 @pytest.mark.interactive
 def test_discrete_log_interactive(x, g, p, P):
@@ -24,10 +26,139 @@ def test_discrete_log(x, g, p, P, hash_function):
     t, s = client_a.response()
     client_b.verify(s, t)
     
+@pytest.mark.noninteractive
+def test_discrete_log_batch(safe_prime):
+    # safe prime p = 2q + 1, g = 4 generates the subgroup of prime order q
+    p = safe_prime
+    g = 4
+    x1, x2 = 123456789, 987654321
+    y1, y2 = pow(g, x1, p), pow(g, x2, p)
+    client_a = DiscreteLog(g, y1, p, x1)
+    client_c = DiscreteLog(g, y2, p, x2)
+    client_b = DiscreteLog(g, y1, p)
+
+    proofs = [client_a.response() for _ in range(6)]
+    proofs += [client_c.response() + (y2,) for _ in range(4)]
+    assert client_b.verify_batch(proofs) == []
+    t, s = proofs[2]
+    proofs[2] = (t, s + 1)
+    t, s, y = proofs[8]
+    proofs[8] = (proofs[7][0], s, y)
+    proofs[9] = (0, proofs[9][1], y2)
+    assert client_b.verify_batch(proofs) == [2, 8, 9]
+
+@pytest.mark.noninteractive
+@pytest.mark.parametrize("subgroup", [False, True])
+def test_discrete_log_batch_negated_commitment(x, safe_prime, subgroup):
+    # t = -g^r passes an even weight, s is computed for g^r
+    p = SchnorrGroup.from_safe_prime(safe_prime) if subgroup else safe_prime
+    q = (safe_prime - 1) // 2 if subgroup else safe_prime - 1
+    g = 4
+    y = pow(g, x, safe_prime)
+    client_a = DiscreteLog(g, y, p, x)
+    client_b = DiscreteLog(g, y, p)
+    r = 1234567
+    t = safe_prime - pow(g, r, safe_prime)
+    s = (r - client_b._challenge([g, y], [t], q) * x) % q
+
+    with pytest.raises(AssertionError):
+        client_b.verify(s, t)
+    proofs = [client_a.response() for _ in range(3)] + [(t, s)]
+    for _ in range(20):
+        assert client_b.verify_batch(proofs) == [3]
+
 @pytest.mark.ecc
 def test_discrete_log_ecc():
     client_a = DiscreteLogEcc(5)
     client_b = DiscreteLogEcc()
     
     (t, s) = client_a.response()
-    client_b.verify(s, t)
\ No newline at end of file
+    client_b.verify(s, t)
+
+@pytest.mark.ecc
+def test_discrete_log_ecc_ed25519(monkeypatch):
+    monkeypatch.setattr(DiscreteLogEcc, 'curve', get_curve('ed25519'))
+    client_a = DiscreteLogEcc(5)
+    client_b = DiscreteLogEcc()
+
+    (t, s) = client_a.response()
+    client_b.verify(s, t)
+    with pytest.raises(AssertionError):
+        client_b.verify(s + 1, t)
+
+@pytest.mark.ecc
+def test_discrete_log_ecc_batch():
+    client_a = DiscreteLogEcc(5)
+    client_b = DiscreteLogEcc()
+
+    proofs = [client_a.response() for _ in range(10)]
+    assert client_b.verify_batch(proofs) == []
+    assert client_b.verify_batch([]) == []
+    t, s = proofs[3]
+    proofs[3] = (t, s + 1)
+    proofs[7] = (proofs[8][0], proofs[7][1])
+    proofs[9] = ((1, 2), proofs[9][1])
+    assert client_b.verify_batch(proofs) == [3, 7, 9]
+
+@pytest.mark.noninteractive
+def test_discrete_log_compact(x, safe_prime):
+    p = safe_prime
+    g = 4
+    client_a = DiscreteLog(g, pow(g, x, p), p, x)
+    client_b = DiscreteLog(g, pow(g, x, p), p)
+
+    c, s = client_a.response(compact=True)
+    client_b.verify_compact(c, s)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(c, s + 1)
+
+@pytest.mark.ecc
+def test_discrete_log_ecc_compact(x):
+    client_a = DiscreteLogEcc(x)
+    client_b = DiscreteLogEcc()
+
+    c, s = client_a.response(compact=True)
+    client_b.verify_compact(c, s)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(c + 1, s)
+
+@pytest.mark.ecc
+@pytest.mark.parametrize("compact", [False, True])
+def test_discrete_log_ecc_challenge_bits(x, monkeypatch, compact):
+    monkeypatch.setattr(DiscreteLogEcc, 'challenge_bits', 128)
+    client_a = DiscreteLogEcc(x)
+    client_b = DiscreteLogEcc()
+
+    if compact:
+        c, s = client_a.response(compact=True)
+        assert c < 2**128
+        client_b.verify_compact(c, s)
+    else:
+        t, s = client_a.response()
+        client_b.verify(s, t)
+        assert client_b.verify_batch([client_a.response() for _ in range(4)]) == []
+
+@pytest.mark.noninteractive
+def test_discrete_log_challenge_bits(x, monkeypatch, safe_prime):
+    monkeypatch.setattr(DiscreteLog, 'challenge_bits', 128)
+    p = safe_prime
+    g = 4
+    client_a = DiscreteLog(g, pow(g, x, p), p, x)
+    client_b = DiscreteLog(g, pow(g, x, p), p)
+
+    c, s = client_a.response(compact=True)
+    assert c < 2**128
+    client_b.verify_compact(c, s)
+
+@pytest.mark.interactive
+def test_discrete_log_interactive_challenge_bits(x, monkeypatch, safe_prime):
+    monkeypatch.setattr(DiscreteLogInteractive, 'challenge_bits', 64)
+    p = safe_prime
+    g = 4
+    client_a = DiscreteLogInteractive(g, pow(g, x, p), p, x)
+    client_b = DiscreteLogInteractive(g, pow(g, x, p), p)
+
+    t = client_a.commitment()
+    c = client_b.challenge()
+    assert 0 < c < 2**64
+    client_b.verify(client_a.response(c), t)
@@ -1,5 +1,6 @@
 import pytest
 from zkps.zkp_log_disjunction import *
+from zkps.group import SchnorrGroup
 
 @pytest.mark.interactive
 def test_discrete_log_disjuntion_interactive(x, g, h, p, P, Q):
@@ -31,4 +32,82 @@ def test_discrete_log_disjunction_ecc(x, h1c, g1c, PC, QC):
     client_b = DiscreteLogDisjunctionEcc()
     
     t1c1s1, t2c2s2 = client_a.response(g1c, h1c, PC, QC)
-    client_b.verify(g1c, h1c, PC, QC, t1c1s1, t2c2s2)
\ No newline at end of file
+    client_b.verify(g1c, h1c, PC, QC, t1c1s1, t2c2s2)
+
+@pytest.mark.noninteractive
+def test_discrete_log_disjunction_batch(x, safe_prime):
+    # safe prime p = 2q + 1, g and h generate the subgroup of prime order q
+    p = safe_prime
+    g, h = 4, 9
+    P, Q = pow(g, x, p), pow(h, 987654321, p)
+    client_a = DiscreteLogDisjunction(g, h, P, Q, p, x)
+    client_b = DiscreteLogDisjunction(g, h, P, Q, p)
+
+    proofs = [(g, h, P, Q) + client_a.response() for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    # c1 + c2 no longer matches the hash
+    (t1, c1, s1), t2c2s2 = proofs[2][4:]
+    proofs[2] = (g, h, P, Q, (t1, c1 + 1, s1), t2c2s2)
+    # the split still matches, the branch equations do not
+    (t1, c1, s1), (t2, c2, s2) = proofs[5][4:]
+    proofs[5] = (g, h, P, Q, (t1, c1 + 1, s1), (t2, c2 - 1, s2))
+    assert client_b.verify_batch(proofs) == [2, 5]
+
+@pytest.mark.noninteractive
+@pytest.mark.parametrize("subgroup", [False, True])
+def test_discrete_log_disjunction_batch_negated_commitment(x, safe_prime, subgroup):
+    # t1 = -g^r1 passes an even weight, s1 is computed for g^r1
+    p = SchnorrGroup.from_safe_prime(safe_prime) if subgroup else safe_prime
+    q = (safe_prime - 1) // 2 if subgroup else safe_prime - 1
+    g, h = 4, 9
+    P, Q = pow(g, x, safe_prime), pow(h, 987654321, safe_prime)
+    client_a = DiscreteLogDisjunction(g, h, P, Q, p, x)
+    client_b = DiscreteLogDisjunction(g, h, P, Q, p)
+    r1, c2, s2 = 1234567, 7654321, 2345678
+    t1 = safe_prime - pow(g, r1, safe_prime)
+    t2 = pow(h, s2, safe_prime) * pow(Q, -c2, safe_prime) % safe_prime
+    c1 = (client_b._challenge([g, h, P, Q], [t1, t2], q) - c2) % q
+    s1 = (r1 + c1 * x) % q
+    forged = (g, h, P, Q, (t1, c1, s1), (t2, c2, s2))
+
+    with pytest.raises(AssertionError):
+        client_b.verify(*forged)
+    proofs = [(g, h, P, Q) + client_a.response() for _ in range(3)] + [forged]
+    for _ in range(20):
+        assert client_b.verify_batch(proofs) == [3]
+
+@pytest.mark.ecc
+def test_discrete_log_disjunction_ecc_batch(x, h1c, g1c, PC, QC):
+    client_a = DiscreteLogDisjunctionEcc(x)
+    client_b = DiscreteLogDisjunctionEcc()
+
+    proofs = [(g1c, h1c, PC, QC) + client_a.response(g1c, h1c, PC, QC) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    (t1, c1, s1), t2c2s2 = proofs[0][4:]
+    proofs[0] = (g1c, h1c, PC, QC, (t1, c1 + 1, s1), t2c2s2)
+    (t1, c1, s1), (t2, c2, s2) = proofs[7][4:]
+    proofs[7] = (g1c, h1c, PC, QC, (t1, c1 + 1, s1), (t2, c2 - 1, s2))
+    assert client_b.verify_batch(proofs) == [0, 7]
+
+@pytest.mark.noninteractive
+def test_discrete_log_disjunction_compact(x, safe_prime):
+    p = safe_prime
+    g, h = 4, 9
+    P, Q = pow(g, x, p), pow(h, 987654321, p)
+    client_a = DiscreteLogDisjunction(g, h, P, Q, p, x)
+    client_b = DiscreteLogDisjunction(g, h, P, Q, p)
+
+    (c1, s1), (c2, s2) = client_a.response(compact=True)
+    client_b.verify_compact(g, h, P, Q, (c1, s1), (c2, s2))
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g, h, P, Q, (c1 + 1, s1), (c2 - 1, s2))
+
+@pytest.mark.ecc
+def test_discrete_log_disjunction_ecc_compact(x, h1c, g1c, PC, QC):
+    client_a = DiscreteLogDisjunctionEcc(x)
+    client_b = DiscreteLogDisjunctionEcc()
+
+    c1s1, c2s2 = client_a.response(g1c, h1c, PC, QC, compact=True)
+    client_b.verify_compact(g1c, h1c, PC, QC, c1s1, c2s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1c, h1c, PC, QC, c2s2, c1s1)
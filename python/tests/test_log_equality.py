@@ -1,5 +1,6 @@
 import pytest
 from zkps.zkp_log_equality import *
+from zkps.group import SchnorrGroup
 
 @pytest.mark.interactive
 def test_discrete_log_equality_interactive(x, g, h, p, P, q_discrete_log_equality):
@@ -32,4 +33,70 @@ def test_discrete_log_equality_ecc(x, g1c, h1c, p_ecc_log_equality, \
     client_b = DiscreteLogEqualityEcc()
     
     (t1, t2, s) = client_a.response(g1c, h1c, p_ecc_log_equality, q_ecc_log_equality)
-    client_b.verify(g1c, h1c, p_ecc_log_equality, q_ecc_log_equality, t1, t2, s)
\ No newline at end of file
+    client_b.verify(g1c, h1c, p_ecc_log_equality, q_ecc_log_equality, t1, t2, s)
+
+@pytest.mark.noninteractive
+def test_discrete_log_equality_batch(safe_prime):
+    # safe prime p = 2q + 1, g and h generate the subgroup of prime order q
+    p = safe_prime
+    g, h = 4, 9
+    x = 123456789
+    client_a = DiscreteLogEquality(g, h, pow(g, x, p), pow(h, x, p), p, x)
+    client_b = DiscreteLogEquality(g, h, pow(g, x, p), pow(h, x, p), p)
+
+    proofs = [client_a.response(commitments=True) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    vG, vH, r = proofs[1]
+    proofs[1] = (vG, vH, r + 1)
+    proofs[6] = (vG, proofs[6][1], proofs[6][2])
+    assert client_b.verify_batch(proofs) == [1, 6]
+
+@pytest.mark.noninteractive
+@pytest.mark.parametrize("subgroup", [False, True])
+def test_discrete_log_equality_batch_negated_commitment(safe_prime, subgroup):
+    # vG = -g^v passes an even weight, r is computed for g^v
+    p = SchnorrGroup.from_safe_prime(safe_prime) if subgroup else safe_prime
+    q = (safe_prime - 1) // 2 if subgroup else safe_prime - 1
+    g, h = 4, 9
+    x, v = 123456789, 1234567
+    P, Q = pow(g, x, safe_prime), pow(h, x, safe_prime)
+    client_a = DiscreteLogEquality(g, h, P, Q, p, x)
+    client_b = DiscreteLogEquality(g, h, P, Q, p)
+    vG, vH = safe_prime - pow(g, v, safe_prime), pow(h, v, safe_prime)
+    c = client_b._challenge([g, h, P, Q], [vG, vH], q)
+    r = (v - x * c) % q
+
+    with pytest.raises(AssertionError):
+        client_b.verify(c, r)
+    proofs = [client_a.response(commitments=True) for _ in range(3)] + [(vG, vH, r)]
+    for _ in range(20):
+        assert client_b.verify_batch(proofs) == [3]
+
+@pytest.mark.ecc
+def test_discrete_log_equality_ecc_batch(x, g1c):
+    curve = DiscreteLogEqualityEcc.curve
+    client_a = DiscreteLogEqualityEcc(x)
+    client_b = DiscreteLogEqualityEcc()
+    P = curve.mult_point(x, g1c)
+
+    # one key, a different h for every proof as for VRF outputs
+    proofs = []
+    for h in curve.get_generators(6):
+        Q = curve.mult_point(x, h)
+        proofs.append((g1c, h, P, Q) + client_a.response(g1c, h, P, Q))
+    assert client_b.verify_batch(proofs) == []
+    g, h, P, Q, t1, t2, s = proofs[2]
+    proofs[2] = (g, h, P, Q, t1, t2, s + 1)
+    g, h, P, Q, t1, t2, s = proofs[5]
+    proofs[5] = (g, h, P, curve.point_add(Q, g), t1, t2, s)
+    assert client_b.verify_batch(proofs) == [2, 5]
+
+@pytest.mark.ecc
+def test_discrete_log_equality_ecc_compact(x, g1c, h1c, p_ecc_log_equality, q_ecc_log_equality):
+    client_a = DiscreteLogEqualityEcc(x)
+    client_b = DiscreteLogEqualityEcc()
+
+    c, s = client_a.response(g1c, h1c, p_ecc_log_equality, q_ecc_log_equality, compact=True)
+    client_b.verify_compact(g1c, h1c, p_ecc_log_equality, q_ecc_log_equality, c, s)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1c, h1c, p_ecc_log_equality, g1c, c, s)
@@ -1,5 +1,6 @@
 import pytest
 from zkps.zkp_pederesen_commitment import *
+from zkps.group import SchnorrGroup
 
 
 @pytest.mark.interactive
@@ -32,4 +33,81 @@ def test_pederesen_commitment_ecc(x, y, g1c, h1c, p_ecc_pederesen_commitment):
     client_b = PedersenCommitmentEcc()
     
     (t, s1, s2) = client_a.response(g1c, h1c, p_ecc_pederesen_commitment)
-    client_b.verify(g1c, h1c, p_ecc_pederesen_commitment, t, s1, s2)
\ No newline at end of file
+    client_b.verify(g1c, h1c, p_ecc_pederesen_commitment, t, s1, s2)
+
+@pytest.mark.noninteractive
+def test_pedersen_commitment_batch(x, y, safe_prime):
+    # safe prime p = 2q + 1, all bases lie in the subgroup of prime order q
+    p = safe_prime
+    g, h = 4, 9
+    P = pow(g, x, p) * pow(h, y, p) % p
+    client_a = PedersenCommitment(g, h, p, x, y)
+    client_b = PedersenCommitment(g, h, p)
+
+    proofs = [(g, h, P) + client_a.response(P) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    g_, h_, P_, t, s1, s2 = proofs[3]
+    proofs[3] = (g_, h_, P_, t, s1, s2 + 1)
+    proofs[5] = (g, h, P * g % p) + proofs[5][3:]
+    assert client_b.verify_batch(proofs) == [3, 5]
+
+@pytest.mark.noninteractive
+@pytest.mark.parametrize("subgroup", [False, True])
+def test_pedersen_commitment_batch_negated_commitment(x, y, safe_prime, subgroup):
+    # t = -(g^r1 * h^r2) passes an even weight, s1 and s2 are computed for r1, r2
+    p = SchnorrGroup.from_safe_prime(safe_prime) if subgroup else safe_prime
+    q = (safe_prime - 1) // 2 if subgroup else safe_prime - 1
+    g, h = 4, 9
+    P = pow(g, x, safe_prime) * pow(h, y, safe_prime) % safe_prime
+    client_a = PedersenCommitment(g, h, p, x, y)
+    client_b = PedersenCommitment(g, h, p)
+    r1, r2 = 1234567, 7654321
+    t = safe_prime - pow(g, r1, safe_prime) * pow(h, r2, safe_prime) % safe_prime
+    c = client_b._challenge([g, h, P], [t], q)
+    s1, s2 = (r1 + c * x) % q, (r2 + c * y) % q
+
+    with pytest.raises(AssertionError):
+        client_b.verify(g, h, P, t, s1, s2)
+    proofs = [(g, h, P) + client_a.response(P) for _ in range(3)] + [(g, h, P, t, s1, s2)]
+    for _ in range(20):
+        assert client_b.verify_batch(proofs) == [3]
+
+@pytest.mark.ecc
+def test_pederesen_commitment_ecc_batch(x, y, g1c, h1c):
+    curve = PedersenCommitmentEcc.curve
+    client_b = PedersenCommitmentEcc()
+
+    # shared generators, a commitment to other randomness in every proof
+    proofs = []
+    for i in range(8):
+        P = curve.multi_mult([(x, g1c), (y + i, h1c)])
+        proofs.append((g1c, h1c, P) + PedersenCommitmentEcc(x, y + i).response(g1c, h1c, P))
+    assert client_b.verify_batch(proofs) == []
+    g, h, P, t, s1, s2 = proofs[0]
+    proofs[0] = (g, h, P, t, s1 + 1, s2)
+    g, h, P, t, s1, s2 = proofs[6]
+    proofs[6] = (g, h, P, curve.point_add(t, g), s1, s2)
+    assert client_b.verify_batch(proofs) == [0, 6]
+
+@pytest.mark.noninteractive
+def test_pedersen_commitment_compact(x, y, safe_prime):
+    p = safe_prime
+    g, h = 4, 9
+    P = pow(g, x, p) * pow(h, y, p) % p
+    client_a = PedersenCommitment(g, h, p, x, y)
+    client_b = PedersenCommitment(g, h, p)
+
+    c, s1, s2 = client_a.response(P, compact=True)
+    client_b.verify_compact(g, h, P, c, s1, s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g, h, P, c, s2, s1)
+
+@pytest.mark.ecc
+def test_pederesen_commitment_ecc_compact(x, y, g1c, h1c, p_ecc_pederesen_commitment):
+    client_a = PedersenCommitmentEcc(x, y)
+    client_b = PedersenCommitmentEcc()
+
+    c, s1, s2 = client_a.response(g1c, h1c, p_ecc_pederesen_commitment, compact=True)
+    client_b.verify_compact(g1c, h1c, p_ecc_pederesen_commitment, c, s1, s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1c, h1c, p_ecc_pederesen_commitment, c, s1 + 1, s2)
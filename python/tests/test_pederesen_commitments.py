@@ -37,4 +37,62 @@ def test_pederesen_commitment_eq_msg_rnd_ecc(x, y, g1c, h1c, g2c, h2c, \
     (t1, s1), (t2, s2) = client_a.response(g1c, h1c, g2c, h2c, p_test_ecc_pederesnen_commitment_eq_message_randomness, \
         q_test_ecc_pederesnen_commitment_eq_message_randomness)
     client_b.verify(g1c, h1c, g2c, h2c, p_test_ecc_pederesnen_commitment_eq_message_randomness, \
-        q_test_ecc_pederesnen_commitment_eq_message_randomness, (t1, s1), (t2, s2))
\ No newline at end of file
+        q_test_ecc_pederesnen_commitment_eq_message_randomness, (t1, s1), (t2, s2))
+
+@pytest.mark.noninteractive
+def test_pedersen_commitment_eq_msg_rnd_batch(x, y, safe_prime):
+    # safe prime p = 2q + 1, all bases lie in the subgroup of prime order q
+    p = safe_prime
+    g1, h1, g2, h2 = 4, 9, 16, 25
+    P = pow(g1, x, p) * pow(h1, y, p) % p
+    Q = pow(g2, x, p) * pow(h2, y, p) % p
+    client_a = PedersenCommitmentsEqual(p, x, y)
+    client_b = PedersenCommitmentsEqual(p)
+
+    proofs = [(g1, h1, g2, h2, P, Q) + client_a.response(g1, h1, g2, h2, P, Q) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    (t1, s1), (t2, s2) = proofs[2][6:]
+    proofs[2] = (g1, h1, g2, h2, P, Q, (t1, s1), (t2 * g2 % p, s2))
+    proofs[7] = (g1, h1, g2, h2, P, Q * h2 % p) + proofs[7][6:]
+    assert client_b.verify_batch(proofs) == [2, 7]
+
+@pytest.mark.ecc
+def test_pederesen_commitment_eq_msg_rnd_ecc_batch(x, y, g1c, h1c, g2c, h2c, \
+    p_test_ecc_pederesnen_commitment_eq_message_randomness, q_test_ecc_pederesnen_commitment_eq_message_randomness):
+    P = p_test_ecc_pederesnen_commitment_eq_message_randomness
+    Q = q_test_ecc_pederesnen_commitment_eq_message_randomness
+    client_a = PederesenCommitmentsEqualEcc(x, y)
+    client_b = PederesenCommitmentsEqualEcc()
+
+    proofs = [(g1c, h1c, g2c, h2c, P, Q) + client_a.response(g1c, h1c, g2c, h2c, P, Q) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    (t1, s1), (t2, s2) = proofs[4][6:]
+    proofs[4] = (g1c, h1c, g2c, h2c, P, Q, (t1, s1), (t2, s2 + 1))
+    assert client_b.verify_batch(proofs) == [4]
+
+@pytest.mark.noninteractive
+def test_pedersen_commitment_eq_msg_rnd_compact(x, y, safe_prime):
+    p = safe_prime
+    g1, h1, g2, h2 = 4, 9, 16, 25
+    P = pow(g1, x, p) * pow(h1, y, p) % p
+    Q = pow(g2, x, p) * pow(h2, y, p) % p
+    client_a = PedersenCommitmentsEqual(p, x, y)
+    client_b = PedersenCommitmentsEqual(p)
+
+    c, s1, s2 = client_a.response(g1, h1, g2, h2, P, Q, compact=True)
+    client_b.verify_compact(g1, h1, g2, h2, P, Q, c, s1, s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1, h1, g2, h2, P, Q * h2 % p, c, s1, s2)
+
+@pytest.mark.ecc
+def test_pederesen_commitment_eq_msg_rnd_ecc_compact(x, y, g1c, h1c, g2c, h2c, \
+    p_test_ecc_pederesnen_commitment_eq_message_randomness, q_test_ecc_pederesnen_commitment_eq_message_randomness):
+    P = p_test_ecc_pederesnen_commitment_eq_message_randomness
+    Q = q_test_ecc_pederesnen_commitment_eq_message_randomness
+    client_a = PederesenCommitmentsEqualEcc(x, y)
+    client_b = PederesenCommitmentsEqualEcc()
+
+    c, s1, s2 = client_a.response(g1c, h1c, g2c, h2c, P, Q, compact=True)
+    client_b.verify_compact(g1c, h1c, g2c, h2c, P, Q, c, s1, s2)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1c, h1c, g2c, h2c, P, Q, c, s1, s2 + 1)
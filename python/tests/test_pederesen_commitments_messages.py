@@ -35,4 +35,60 @@ def test_pederesen_commitments_ecc(x, y, z, g1c, h1c, g2c, h2c, p_ecc_pederesen_
     (t1, s1), (t2, s2), s3 = client_a.response(g1c, h1c, g2c, h2c, \
         p_ecc_pederesen_commitments_messages, q_ecc_pederesen_commitments_messages)
     client_b.verify(g1c, h1c, g2c, h2c, \
-        p_ecc_pederesen_commitments_messages, q_ecc_pederesen_commitments_messages, (t1, s1), (t2, s2), s3)
\ No newline at end of file
+        p_ecc_pederesen_commitments_messages, q_ecc_pederesen_commitments_messages, (t1, s1), (t2, s2), s3)
+
+@pytest.mark.noninteractive
+def test_pederesen_commitments_batch(x, y, z, safe_prime):
+    # safe prime p = 2q + 1, all bases lie in the subgroup of prime order q
+    p = safe_prime
+    g, h = 4, 9
+    P = pow(g, x, p) * pow(h, y, p) % p
+    Q = pow(g, x, p) * pow(h, z, p) % p
+    client_a = PederesenCommitmentsEqualMessages(p, g, h, x, y, z)
+    client_b = PederesenCommitmentsEqualMessages(p, g, h)
+
+    proofs = [(P, Q) + client_a.response(P, Q) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    proofs[1] = proofs[1][:4] + (proofs[1][4] + 1,)
+    assert client_b.verify_batch(proofs) == [1]
+
+@pytest.mark.ecc
+def test_pederesen_commitments_ecc_batch(x, y, z, g1c, h1c, g2c, h2c, p_ecc_pederesen_commitments_messages, \
+    q_ecc_pederesen_commitments_messages):
+    P = p_ecc_pederesen_commitments_messages
+    Q = q_ecc_pederesen_commitments_messages
+    client_a = PederesenCommitmentsEqualMessagesEcc(x, y, z)
+    client_b = PederesenCommitmentsEqualMessagesEcc()
+
+    proofs = [(g1c, h1c, g2c, h2c, P, Q) + client_a.response(g1c, h1c, g2c, h2c, P, Q) for _ in range(8)]
+    assert client_b.verify_batch(proofs) == []
+    proofs[3] = proofs[3][:8] + (proofs[3][8] + 1,)
+    proofs[5] = (g1c, h1c, g2c, h2c, Q, P) + proofs[5][6:]
+    assert client_b.verify_batch(proofs) == [3, 5]
+
+@pytest.mark.noninteractive
+def test_pederesen_commitments_compact(x, y, z, safe_prime):
+    p = safe_prime
+    g, h = 4, 9
+    P = pow(g, x, p) * pow(h, y, p) % p
+    Q = pow(g, x, p) * pow(h, z, p) % p
+    client_a = PederesenCommitmentsEqualMessages(p, g, h, x, y, z)
+    client_b = PederesenCommitmentsEqualMessages(p, g, h)
+
+    c, s1, s2, s3 = client_a.response(P, Q, compact=True)
+    client_b.verify_compact(P, Q, c, s1, s2, s3)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(P, Q, c, s1, s3, s2)
+
+@pytest.mark.ecc
+def test_pederesen_commitments_ecc_compact(x, y, z, g1c, h1c, g2c, h2c, p_ecc_pederesen_commitments_messages, \
+    q_ecc_pederesen_commitments_messages):
+    P = p_ecc_pederesen_commitments_messages
+    Q = q_ecc_pederesen_commitments_messages
+    client_a = PederesenCommitmentsEqualMessagesEcc(x, y, z)
+    client_b = PederesenCommitmentsEqualMessagesEcc()
+
+    c, s1, s2, s3 = client_a.response(g1c, h1c, g2c, h2c, P, Q, compact=True)
+    client_b.verify_compact(g1c, h1c, g2c, h2c, P, Q, c, s1, s2, s3)
+    with pytest.raises(AssertionError):
+        client_b.verify_compact(g1c, h1c, g2c, h2c, Q, P, c, s1, s2, s3)
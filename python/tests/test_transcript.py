@@ -0,0 +1,76 @@
+import pytest
+from zkps.transcript import Transcript
+from zkps.elliptic_curve import get_curve
+
+ORDER = 2**255 - 19
+
+def challenge(label, ints, hash_function='sha256'):
+    return Transcript(label, hash_function).append_ints(b'x', ints).challenge(b'c', ORDER)
+
+@pytest.mark.noninteractive
+@pytest.mark.parametrize("hash_function", ["sha1", "md5", "sha256", "sha512"])
+def test_transcript_challenge(hash_function):
+    c = challenge(b'test', [1, 2, 3], hash_function)
+
+    assert c == challenge('test', [1, 2, 3], hash_function)
+    assert 0 <= c < ORDER
+    assert Transcript(b'test', hash_function).challenge(b'c', 7) < 7
+
+@pytest.mark.noninteractive
+def test_transcript_encoding():
+    # the length prefixes keep differently split messages apart
+    assert challenge(b'test', [1, 2]) != challenge(b'test', [0x0102])
+    assert challenge(b'test', [0, 1]) != challenge(b'test', [1])
+    assert challenge(b'test', [1]) != challenge(b'other', [1])
+    assert Transcript(b'test').append_message(b'ab', b'c').challenge(b'c', ORDER) != \
+        Transcript(b'test').append_message(b'a', b'bc').challenge(b'c', ORDER)
+
+    transcript = Transcript(b'test')
+    assert transcript.challenge(b'c', ORDER) != transcript.challenge(b'c', ORDER)
+
+    with pytest.raises(ValueError):
+        Transcript(b'test', 'sha3')
+
+@pytest.mark.ecc
+def test_transcript_points():
+    curve = get_curve('secp256r1')
+    g, h = curve.get_generators(2)
+
+    c = Transcript(b'test', curve=curve).append_points(b'P', [g, h]).challenge(b'c', curve.order)
+    assert c == Transcript(b'test', curve=curve).append_points(b'P', [g, h]).challenge(b'c', curve.order)
+    assert c != Transcript(b'test', curve=curve).append_points(b'P', [h, g]).challenge(b'c', curve.order)
+
+@pytest.mark.noninteractive
+def test_transcript_copy():
+    transcript = Transcript(b'test').append_ints(b'statement', [4, 9])
+    copy = transcript.copy()
+    copy.append_ints(b'commitment', [5])
+
+    assert copy.challenge(b'c', ORDER) == \
+        Transcript(b'test').append_ints(b'statement', [4, 9]).append_ints(b'commitment', [5]).challenge(b'c', ORDER)
+    assert transcript.challenge(b'c', ORDER) == Transcript(b'test').append_ints(b'statement', [4, 9]).challenge(b'c', ORDER)
+
+@pytest.mark.ecc
+def test_statement_prefix_cache():
+    from zkps.zkp_log_conjunction import DiscreteLogConjunctionEcc
+    curve = DiscreteLogConjunctionEcc.curve
+    statement = curve.get_generators(4)
+    commitments = curve.get_generators(2)
+
+    expected = Transcript('DiscreteLogConjunctionEcc', curve.hash_function, curve) \
+        .append_points(b'statement', statement) \
+        .append_points(b'commitment', commitments).challenge(b'challenge', curve.order)
+    # the first call fills the cache, the second starts from a copy of it
+    assert DiscreteLogConjunctionEcc._challenge(statement, commitments) == expected
+    assert DiscreteLogConjunctionEcc._challenge(statement, commitments) == expected
+    assert DiscreteLogConjunctionEcc._challenge(statement, commitments[::-1]) != expected
+
+@pytest.mark.noninteractive
+@pytest.mark.parametrize("hash_function", ["md5", "sha256", "sha512"])
+def test_transcript_challenge_bits(hash_function):
+    full = Transcript(b'test', hash_function).challenge(b'c', 2**512)
+    short = Transcript(b'test', hash_function).challenge(b'c', 2**512, bits=128)
+
+    assert short == full >> (8 * Transcript.hashes[hash_function]().digest_size - 128)
+    with pytest.raises(ValueError):
+        Transcript(b'test', hash_function).challenge(b'c', ORDER, bits=513)
@@ -5,4 +5,8 @@ setup(
     author='Bartosz Kosciug',
     version='0.2',
     packages=['zkps'],
+    extras_require={
+        # optional GMP backend for the big integer arithmetic, see zkps/backend.py
+        'gmpy2': ['gmpy2'],
+    },
 )
\ No newline at end of file
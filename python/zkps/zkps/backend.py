@@ -0,0 +1,113 @@
+import os
+import libnum
+
+
+class PythonBackend():
+    """
+    Big integer arithmetic on CPython ints, always available.
+    """
+
+    name = 'python'
+
+    def mpz(self, x):
+        """Converts x to the integer type the backend computes with."""
+        return int(x)
+
+    def to_int(self, x):
+        """Converts a backend integer back to a Python int."""
+        return int(x)
+
+    def mul(self, a, b):
+        return a * b
+
+    def sqr(self, a):
+        return a * a
+
+    def mod(self, a, m):
+        return a % m
+
+    def invert(self, a, m):
+        """Returns the inverse of a modulo m, a must be coprime to m."""
+        return pow(a, -1, m)
+
+    def powmod(self, base, exponent, modulus):
+        """Returns base^exponent mod modulus, a negative exponent inverts."""
+        return pow(base, exponent, modulus)
+
+    def jacobi(self, a, n):
+        """Returns the Jacobi symbol (a/n) of an odd positive n."""
+        return libnum.jacobi(a, n)
+
+
+class Gmpy2Backend(PythonBackend):
+    """
+    Big integer arithmetic on GMP through gmpy2. Values computed inside the
+    curve stay mpz, results leaving the library are converted back to int so
+    proofs and hashes are the same on both backends.
+    """
+
+    name = 'gmpy2'
+
+    def __init__(self):
+        import gmpy2
+        self._gmpy2 = gmpy2
+        self.mpz = gmpy2.mpz
+
+    def invert(self, a, m):
+        return self._gmpy2.invert(a, m)
+
+    def powmod(self, base, exponent, modulus):
+        return int(self._gmpy2.powmod(base, exponent, modulus))
+
+    def jacobi(self, a, n):
+        return int(self._gmpy2.jacobi(a, n))
+
+
+BACKENDS = {
+    'python': PythonBackend,
+    'gmpy2': Gmpy2Backend,
+}
+
+_backend = None
+
+
+def get_backend():
+    """
+    Returns the active backend. On first use it is taken from the
+    ZKPS_BACKEND environment variable, otherwise gmpy2 when it can be
+    imported and pure Python as the fallback.
+    """
+    global _backend
+    if _backend is None:
+        name = os.environ.get('ZKPS_BACKEND')
+        if name:
+            set_backend(name)
+        else:
+            try:
+                _backend = Gmpy2Backend()
+            except ImportError:
+                _backend = PythonBackend()
+    return _backend
+
+
+def set_backend(name):
+    """
+    Selects the backend by name. Curves keep the backend they were created
+    with, get_curve caches one curve per backend so select it before
+    calling get_curve.
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f'Unsupported backend: {name}')
+    _backend = BACKENDS[name]()
+    return _backend
+
+
+def powmod(base, exponent, modulus):
+    """Returns base^exponent mod modulus on the active backend."""
+    return get_backend().powmod(base, exponent, modulus)
+
+
+def jacobi(a, n):
+    """Returns the Jacobi symbol (a/n) on the active backend."""
+    return get_backend().jacobi(a, n)
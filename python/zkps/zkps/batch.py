@@ -0,0 +1,125 @@
+import random
+
+from .backend import powmod
+from .group import is_element
+
+_random = random.SystemRandom()
+
+
+def failing_indices(indices, check):
+    """
+    Returns the indices whose proofs fail, given check(indices) that verifies
+    a group of proofs at once and returns True if all of them are valid.
+
+    A failing group is split in halves until the invalid proofs are isolated,
+    with f invalid proofs among N this costs about 2 * f * log2(N) extra
+    group checks, when all proofs are valid only the first one.
+    """
+    indices = list(indices)
+    if not indices or check(indices):
+        return []
+    if len(indices) == 1:
+        return indices
+    middle = len(indices) // 2
+    return failing_indices(indices[:middle], check) + \
+        failing_indices(indices[middle:], check)
+
+
+def ecc_failing_indices(curve, proofs, points, equations):
+    """
+    Returns the indices of the invalid proofs, checking all of them with one
+    multi-scalar multiplication.
+
+    points(proof) returns the points of a proof, they are validated once per
+    distinct point. equations(proof) returns the verification equations of
+    a proof with valid points, each a list of (scalar, point) pairs summing
+    to the point at infinity, or None if the proof fails a check that needs
+    no scalar multiplication. Every equation is multiplied by a random
+    128-bit weight, the multi_mult merges the terms of points shared between
+    proofs.
+    """
+    valid_points = {}
+    proof_equations = {}
+    invalid = []
+    for i, proof in enumerate(proofs):
+        proof_points = points(proof)
+        for point in proof_points:
+            if point not in valid_points:
+                valid_points[point] = curve.validate_points([point])
+        if all(valid_points[point] for point in proof_points):
+            proof_equations[i] = equations(proof)
+        if proof_equations.get(i) is None:
+            proof_equations.pop(i, None)
+            invalid.append(i)
+
+    def check(indices):
+        pairs = []
+        for i in indices:
+            for equation in proof_equations[i]:
+                w = curve.get_random_weight()
+                pairs += [(w * k, point) for k, point in equation]
+        return curve.multi_mult_is_infinity(pairs, validate=False)
+
+    return sorted(invalid + failing_indices(proof_equations, check))
+
+
+def modp_failing_indices(p, proofs, equations, weight_bits=128, order=None):
+    """
+    Returns the indices of the invalid proofs, checking all of them with
+    small random exponents.
+
+    equations(proof) returns the verification equations of a proof, each a
+    pair (terms, commitments) standing for prod(base^e for e, base in terms)
+    == prod(commitments) mod p, or None if the proof fails a check that
+    needs no exponentiation. Every equation is raised to a random weight
+    of weight_bits bits, the exponents of a base shared between equations
+    are added up so each distinct base costs one full exponentiation and
+    each commitment one of weight_bits bits. Exponents are reduced modulo
+    order, p - 1 by default.
+
+    The weights are odd, so a commitment off by a factor of order 2 (such as
+    p - t for a valid t) always fails. Given the prime order q of a subgroup
+    every base and commitment must lie in it (see group.is_element) and a
+    forged proof passes with probability 2^-weight_bits. In Z_p^* with order
+    p - 1 a factor of another small order in a commitment can go unnoticed.
+    """
+    order = order or p - 1
+    subgroup = order != p - 1
+    valid_bases = {}
+
+    def valid(proof_equations):
+        for terms, commitments in proof_equations:
+            for _, base in terms:
+                if base not in valid_bases:
+                    valid_bases[base] = not subgroup or is_element(base, p, order)
+                if not valid_bases[base]:
+                    return False
+            for t in commitments:
+                if not (is_element(t, p, order) if subgroup else 0 < t < p):
+                    return False
+        return True
+
+    proof_equations = {}
+    invalid = []
+    for i, proof in enumerate(proofs):
+        proof_equations[i] = equations(proof)
+        if proof_equations[i] is None or not valid(proof_equations[i]):
+            del proof_equations[i]
+            invalid.append(i)
+
+    def check(indices):
+        exponents = {}
+        rhs = 1
+        for i in indices:
+            for terms, commitments in proof_equations[i]:
+                w = _random.getrandbits(weight_bits) | 1
+                for e, base in terms:
+                    exponents[base] = exponents.get(base, 0) + w * e
+                for t in commitments:
+                    rhs = rhs * powmod(t, w, p) % p
+        lhs = 1
+        for base, exponent in exponents.items():
+            lhs = lhs * powmod(base, exponent % order, p) % p
+        return lhs == rhs
+
+    return sorted(invalid + failing_indices(proof_equations, check))
@@ -1,7 +1,10 @@
 import random
-from re import S
+import libnum
 from libnum import ecc
 from hashlib import sha512, sha256, md5, sha1
+from functools import partial
+from .backend import get_backend
+from .field import PrimeField, MersenneField
 
 
 class EllipticCurve(ecc.Curve):
@@ -9,8 +12,10 @@ class EllipticCurve(ecc.Curve):
     supported_hash_functions = {
         'md5': md5, 'sha1': sha1, 'sha256': sha256, 'sha512': sha512}
 
-    def __init__(self, type_, a, b, G, p, n, hash_function='sha256'):
-        super().__init__(a, b, p, G, order=n)
+    def __init__(self, type_, a, b, G, p, n, hash_function='sha256',
+                 fixed_base_window=4, field=None, endomorphism=None, cofactor=1,
+                 security_bits=None):
+        super().__init__(a, b, p, G, order=n, cofactor=cofactor)
         self._type = type_
         self.a = a
         self.b = b
@@ -19,6 +24,21 @@ class EllipticCurve(ecc.Curve):
         self.n = n
         self._hash_function = hash_function
         self._random = random.SystemRandom()
+        # Coordinate size of the SEC1 point encoding.
+        self._byte_length = (p.bit_length() + 7) // 8
+        # Coordinate arithmetic, a special form field where it beats % p.
+        self.field = field or PrimeField(p)
+        self._a_is_zero = a % p == 0
+        self._a_is_minus_3 = a % p == p - 3
+        self._fixed_base_window = fixed_base_window
+        self._fixed_base_table = None
+        # GLV endomorphism (beta, lambda, (a1, b1, a2, b2)) with
+        # lambda * (x, y) = (beta * x, y) and a short basis of the lattice
+        # {(u, v): u + v * lambda = 0 mod n}.
+        self._endomorphism = endomorphism
+        # Pollard's rho needs about sqrt(n) steps unless the curve is known to
+        # be weaker (pairing friendly curves) or is rated by convention.
+        self._security_bits = security_bits or n.bit_length() // 2
 
     # def __str__(self):
     #     return f"Curve: {self._type}\nParameters:\n a={self.a}\n b={self.b}\n G={self.G}\n p={self.p}\n n={self.n}"
@@ -27,18 +47,36 @@ class EllipticCurve(ecc.Curve):
     def hash_function(self):
         return self._hash_function
     
-    @property.setter
+    @hash_function.setter
     def hash_function(self, hash_function):
         self._hash_function = hash_function
+
+    @property
+    def security_bits(self):
+        """Security level in bits of the discrete logarithm on the curve."""
+        return self._security_bits
+
+    @property
+    def fixed_base_window(self):
+        return self._fixed_base_window
+
+    @fixed_base_window.setter
+    def fixed_base_window(self, window):
+        """Sets the window width of the generator table, the table holds
+        ceil(bits(n) / window) * (2^window - 1) points and is rebuilt on the
+        next multiplication of the generator."""
+        if window < 1:
+            raise ValueError(f'Invalid fixed base window: {window}')
+        self._fixed_base_window = window
+        self._fixed_base_table = None
     
     def get_generators(self, n=1):
 
         gs = []
-        G = self.g
         for _ in range(n):
             s = self._random.randint(0, self.n-1)
-            gs.append(self.power(G, s))
-        return gs
+            gs.append(self._mult_generator_jacobian(s))
+        return self.normalize_batch(gs)
 
     def hash_list(self, list_):
         hash = EllipticCurve.supported_hash_functions.get(
@@ -51,11 +89,54 @@ class EllipticCurve(ecc.Curve):
         return int(hash.hexdigest(), 16)
 
     def hash_points(self, points):
-        return self.hash_list([str(point).encode() for point in points])
+        return self.hash_list([self.encode_point(point) for point in points])
+
+    def encode_point(self, point, compressed=True):
+        """Returns the SEC1 encoding of point: 0x02/0x03 and x for the
+        compressed form, 0x04, x and y for the uncompressed one and a single
+        0x00 byte for the point at infinity."""
+        if point is None:
+            return b'\x00'
+        x, y = point
+        size = self._byte_length
+        if compressed:
+            # the prefix byte goes above x, a single to_bytes
+            return (int(x) | (2 + (y & 1)) << (8 * size)).to_bytes(size + 1, 'big')
+        return b'\x04' + int(x).to_bytes(size, 'big') + int(y).to_bytes(size, 'big')
+
+    def decode_point(self, data):
+        """Returns the point of a SEC1 encoding, raises ValueError if data is
+        not an encoding of a point on the curve."""
+        size = self._byte_length
+        if data == b'\x00':
+            return None
+        if len(data) == 1 + size and data[0] in (2, 3):
+            x = int.from_bytes(data[1:], 'big')
+            if x >= self.p:
+                raise ValueError('Invalid point encoding')
+            y = self.field.sqrt(x * x * x + self.a * x + self.b)
+            if y is None:
+                raise ValueError('Point is not on the curve')
+            y = int(y)
+            if y & 1 != data[0] & 1:
+                y = (self.p - y) % self.p
+            return (x, y)
+        if len(data) == 1 + 2 * size and data[0] == 4:
+            point = (int.from_bytes(data[1:1 + size], 'big'),
+                     int.from_bytes(data[1 + size:], 'big'))
+            if not self.validate_points([point]):
+                raise ValueError('Point is not on the curve')
+            return point
+        raise ValueError('Invalid point encoding')
 
     def get_random(self):
         return self._random.randint(0, self.n - 1)
 
+    def get_random_weight(self, bits=128):
+        """Returns a random non-zero scalar of at most `bits` bits, used to fold
+        several verification equations into one."""
+        return self._random.getrandbits(bits) or 1
+
     def inverse_mod(self, k, p):
         """Returns the inverse of k modulo p.
         This function returns the only integer x such that (x * k) % p == 1.
@@ -86,10 +167,15 @@ class EllipticCurve(ecc.Curve):
 
         return x % p
 
-    def point_add(self, point1, point2):
-        """Returns the result of point1 + point2 according to the group law."""
-        assert self.is_on_curve(point1)
-        assert self.is_on_curve(point2)
+    def point_add(self, point1, point2, validate=True):
+        """Returns the result of point1 + point2 according to the group law.
+
+        With validate=False the operands are trusted to lie on the curve (see
+        validate_points) and neither they nor the result are checked.
+        """
+        if validate:
+            assert self.is_on_curve(point1)
+            assert self.is_on_curve(point2)
 
         if point1 is None:
             # 0 + point2 = point2
@@ -116,7 +202,8 @@ class EllipticCurve(ecc.Curve):
         y3 = y1 + m * (x3 - x1)
         result = (x3 % self.p, -y3 % self.p)
 
-        assert self.is_on_curve(result)
+        if validate:
+            assert self.is_on_curve(result)
 
         return result
 
@@ -129,37 +216,145 @@ class EllipticCurve(ecc.Curve):
 
         return (y * y - x * x * x - self.a * x - self.b) % self.p == 0
 
-    def mult_point(self, k, point):
-        """Returns k * point computed using the double and point_add algorithm."""
-        assert self.is_on_curve(point)
+    def validate_points(self, points):
+        """Returns True if every point is the point at infinity or a pair of
+        reduced coordinates on the curve.
+
+        Points coming from outside (proofs, public keys) are checked once with
+        it, the arithmetic on them then runs with validate=False.
+        """
+        for point in points:
+            if point is None:
+                continue
+            if not isinstance(point, tuple) or len(point) != 2:
+                return False
+            x, y = point
+            if not (0 <= x < self.p and 0 <= y < self.p):
+                return False
+            if not self.is_on_curve(point):
+                return False
+        return True
+
+    def validate_parameters(self):
+        """Returns True if the domain parameters define a usable group: p and
+        n prime, a non-singular curve, G of order n and n * cofactor within
+        the Hasse bound |#E - (p + 1)| <= 2 * sqrt(p)."""
+        p, n = self.p, self.n
+        if not (libnum.prime_test(p) and libnum.prime_test(n)):
+            return False
+        if not self._is_nonsingular():
+            return False
+        if not self.validate_points([self.g]) or self.g is None:
+            return False
+        if self._to_affine(self._mult_jacobian(n, self.g)) is not None:
+            return False
+        trace = n * self.cofactor - (p + 1)
+        return trace * trace <= 4 * p
+
+    def _is_nonsingular(self):
+        # 4a^3 + 27b^2 != 0 (mod p)
+        return (4 * self.a ** 3 + 27 * self.b ** 2) % self.p != 0
+
+    def mult_point(self, k, point, validate=True):
+        """Returns k * point computed using the double and add algorithm.
+
+        The ladder runs in Jacobian coordinates with mixed additions of the
+        affine input, so only the final conversion back to affine needs an
+        inversion. With validate=False point is trusted to lie on the curve.
+        """
+        if validate:
+            assert self.is_on_curve(point)
 
         if k % self.n == 0 or point is None:
             return None
 
+        if point == self.g:
+            # Fixed base: table lookups only, no doublings.
+            result = self._to_affine(self._mult_generator_jacobian(k % self.n))
+            if validate:
+                assert self.is_on_curve(result)
+            return result
+
         if k < 0:
             # k * point = -k * (-point)
-            return self.mult_point(-k, self.point_neg(point))
+            return self.mult_point(-k, self.point_neg(point, False), validate)
 
-        result = None
-        addend = point
+        if self._endomorphism:
+            result = self._to_affine(self._straus_jacobian([(k, point)]))
+        else:
+            result = self._to_affine(self._mult_jacobian(k, point))
 
-        while k:
-            if k & 1:
-                # Add.
-                result = self.point_add(result, addend)
+        if validate:
+            assert self.is_on_curve(result)
 
-            # Double.
-            addend = self.point_add(addend, addend)
+        return result
 
-            k >>= 1
+    def scalar_mult(self, k, point):
+        """Returns k * point, alias of mult_point."""
+        return self.mult_point(k, point)
+
+    def power(self, point, k):
+        """Returns k * point, overrides the affine ladder of ecc.Curve."""
+        return self.mult_point(k, point)
 
-        assert self.is_on_curve(result)
+    def multi_mult(self, pairs, method=None, validate=True):
+        """Returns k1 * P1 + k2 * P2 + ... for pairs [(k1, P1), (k2, P2), ...].
+
+        Small inputs use Straus' interleaved evaluation: every point gets a
+        small table of its multiples and the doublings are shared between all
+        of them. From PIPPENGER_THRESHOLD pairs on the bucket method takes
+        over, its cost per point shrinks as the batch grows.
+        :param method: 'straus' or 'pippenger' to force an algorithm.
+        :param validate: check the points and the result, False for points
+            already checked with validate_points.
+        """
+        if validate:
+            for _, point in pairs:
+                assert self.is_on_curve(point)
+
+        result = self._to_affine(self._multi_mult_jacobian(pairs, method))
+
+        if validate:
+            assert self.is_on_curve(result)
 
         return result
 
-    def point_neg(self, point):
+    def multi_mult_equals(self, pairs, point, validate=True):
+        """Returns multi_mult(pairs) == point. The sum stays in Jacobian
+        coordinates and is compared by cross multiplication, so unlike the
+        affine comparison it needs no inversion."""
+        if validate:
+            for _, term in pairs:
+                assert self.is_on_curve(term)
+            assert self.is_on_curve(point)
+
+        return self._jacobian_equal(
+            self._multi_mult_jacobian(pairs), self._to_jacobian(point))
+
+    def multi_mult_is_infinity(self, pairs, validate=True):
+        """Returns multi_mult(pairs) is None without leaving Jacobian
+        coordinates, for verification equations moved to one side."""
+        if validate:
+            for _, point in pairs:
+                assert self.is_on_curve(point)
+
+        return self._is_infinity(self._multi_mult_jacobian(pairs))
+
+    def multi_mult_batch(self, sums, validate=True):
+        """Returns [multi_mult(pairs) for pairs in sums] with one inversion for
+        all the results, for provers producing several points at once."""
+        if validate:
+            for pairs in sums:
+                for _, point in pairs:
+                    assert self.is_on_curve(point)
+
+        return self.normalize_batch(
+            [self._multi_mult_jacobian(pairs) for pairs in sums])
+
+    def point_neg(self, point, validate=True):
         """Returns -point."""
-        assert self.is_on_curve(point)
+        if validate:
+            assert self.is_on_curve(point)
 
         if point is None:
             # -0 = 0
@@ -168,125 +363,774 @@ class EllipticCurve(ecc.Curve):
         x, y = point
         result = (x, -y % self.p)
 
-        assert self.is_on_curve(result)
+        if validate:
+            assert self.is_on_curve(result)
+
+        return result
+
+    # Jacobian coordinates: (X, Y, Z) stands for the affine point
+    # (X / Z^2, Y / Z^3), the point at infinity is any triple with Z == 0.
+
+    _JACOBIAN_INFINITY = (1, 1, 0)
+
+    # Number of (scalar, point) pairs from which multi_mult switches from
+    # Straus to Pippenger, see perf/multi_mult/test_multi_mult.py.
+    PIPPENGER_THRESHOLD = 64
+
+    # Width of the signed digits used for variable base multiplications.
+    WNAF_WINDOW = 5
+
+    def _is_infinity(self, jpoint):
+        return jpoint[2] == 0
+
+    def _jacobian_equal(self, jpoint1, jpoint2):
+        """Returns True if two Jacobian triples are the same point:
+        X1 * Z2^2 == X2 * Z1^2 and Y1 * Z2^3 == Y2 * Z1^3."""
+        X1, Y1, Z1 = jpoint1
+        X2, Y2, Z2 = jpoint2
+        if Z1 == 0 or Z2 == 0:
+            return Z1 == 0 and Z2 == 0
+        red = self.field.reduce
+        Z1Z1 = red(Z1 * Z1)
+        Z2Z2 = red(Z2 * Z2)
+        return (red(X1 * Z2Z2 - X2 * Z1Z1) == 0
+                and red(Y1 * Z2 * Z2Z2 - Y2 * Z1 * Z1Z1) == 0)
+
+    def _to_jacobian(self, point):
+        """Returns the Jacobian triple of an affine point."""
+        if point is None:
+            return self._JACOBIAN_INFINITY
+        x, y = point
+        return (x, y, 1)
+
+    def _to_affine(self, jpoint):
+        """Returns the affine point of a Jacobian triple using one inversion."""
+        X, Y, Z = jpoint
+        if Z == 0:
+            return None
+        red = self.field.reduce
+        to_int = self.field.backend.to_int
+        z_inv = self.field.inv(Z)
+        z_inv2 = red(z_inv * z_inv)
+        return (to_int(red(X * z_inv2)), to_int(red(Y * z_inv2 * z_inv)))
+
+    def normalize_batch(self, jpoints):
+        """Returns the affine points of a list of Jacobian triples (X, Y, Z),
+        sharing one inversion between all of them (Montgomery's trick)."""
+        red = self.field.reduce
+        to_int = self.field.backend.to_int
+        z_invs = iter(self.field.batch_inv([Z for _, _, Z in jpoints if Z]))
+        points = []
+        for X, Y, Z in jpoints:
+            if Z == 0:
+                points.append(None)
+                continue
+            z_inv = next(z_invs)
+            z_inv2 = red(z_inv * z_inv)
+            points.append((to_int(red(X * z_inv2)), to_int(red(Y * z_inv2 * z_inv))))
+        return points
+
+    def _jacobian_double(self, jpoint):
+        """Returns 2 * jpoint in Jacobian coordinates."""
+        X1, Y1, Z1 = jpoint
+        red = self.field.reduce
+        if Z1 == 0 or Y1 == 0:
+            return self._JACOBIAN_INFINITY
+
+        YY = red(Y1 * Y1)
+        S = red(4 * X1 * YY)
+        if self._a_is_zero:
+            M = red(3 * X1 * X1)
+        elif self._a_is_minus_3:
+            ZZ = red(Z1 * Z1)
+            M = red(3 * (X1 - ZZ) * (X1 + ZZ))
+        else:
+            ZZ = red(Z1 * Z1)
+            M = red(3 * X1 * X1 + self.a * ZZ * ZZ)
+
+        X3 = red(M * M - 2 * S)
+        Y3 = red(M * (S - X3) - 8 * YY * YY)
+        Z3 = red(2 * Y1 * Z1)
+        return (X3, Y3, Z3)
+
+    def _jacobian_add(self, jpoint1, jpoint2):
+        """Returns jpoint1 + jpoint2 with both operands in Jacobian coordinates."""
+        X1, Y1, Z1 = jpoint1
+        X2, Y2, Z2 = jpoint2
+        red = self.field.reduce
+        if Z1 == 0:
+            return jpoint2
+        if Z2 == 0:
+            return jpoint1
+
+        Z1Z1 = red(Z1 * Z1)
+        Z2Z2 = red(Z2 * Z2)
+        U1 = red(X1 * Z2Z2)
+        U2 = red(X2 * Z1Z1)
+        S1 = red(Y1 * Z2 * Z2Z2)
+        S2 = red(Y2 * Z1 * Z1Z1)
+        H = red(U2 - U1)
+        r = red(S2 - S1)
 
+        if H == 0:
+            if r == 0:
+                return self._jacobian_double(jpoint1)
+            return self._JACOBIAN_INFINITY
+
+        HH = red(H * H)
+        HHH = red(H * HH)
+        V = red(U1 * HH)
+        X3 = red(r * r - HHH - 2 * V)
+        Y3 = red(r * (V - X3) - S1 * HHH)
+        Z3 = red(Z1 * Z2 * H)
+        return (X3, Y3, Z3)
+
+    def _jacobian_add_mixed(self, jpoint, point):
+        """Returns jpoint + point where point is affine (Z == 1 implied)."""
+        X1, Y1, Z1 = jpoint
+        red = self.field.reduce
+        if point is None:
+            return jpoint
+        x2, y2 = point
+        if Z1 == 0:
+            return (x2, y2, 1)
+
+        Z1Z1 = red(Z1 * Z1)
+        U2 = red(x2 * Z1Z1)
+        S2 = red(y2 * Z1 * Z1Z1)
+        H = red(U2 - X1)
+        r = red(S2 - Y1)
+
+        if H == 0:
+            if r == 0:
+                return self._jacobian_double(jpoint)
+            return self._JACOBIAN_INFINITY
+
+        HH = red(H * H)
+        HHH = red(H * HH)
+        V = red(X1 * HH)
+        X3 = red(r * r - HHH - 2 * V)
+        Y3 = red(r * (V - X3) - Y1 * HHH)
+        Z3 = red(Z1 * H)
+        return (X3, Y3, Z3)
+
+    @staticmethod
+    def _wnaf(k, window):
+        """Returns the width-w NAF digits of k > 0, least significant first.
+
+        Every non-zero digit is odd, lies in (-2^(w-1), 2^(w-1)) and is
+        followed by at least w-1 zeros.
+        """
+        digits = []
+        width = 1 << window
+        half = width >> 1
+        while k:
+            if k & 1:
+                digit = k & (width - 1)
+                if digit >= half:
+                    digit -= width
+                k -= digit
+            else:
+                digit = 0
+            digits.append(digit)
+            k >>= 1
+        return digits
+
+    def _odd_multiples(self, point, window):
+        """Returns [P, 3P, 5P, ..., (2^(w-1) - 1)P] as affine points, normalized
+        together so the main loop can use mixed additions."""
+        table = [self._to_jacobian(point)]
+        double = self._jacobian_double(table[0])
+        for _ in range((1 << (window - 2)) - 1):
+            table.append(self._jacobian_add(table[-1], double))
+        return self.normalize_batch(table)
+
+    def _neg_affine(self, point):
+        """Returns -point for an affine point other than infinity."""
+        x, y = point
+        return (x, self.p - y)
+
+    def _mult_jacobian(self, k, point, window=WNAF_WINDOW):
+        """Returns k * point (k > 0, point affine) as a Jacobian triple.
+
+        Signed-digit (wNAF) double and add: negating a point is free, so only
+        about bits / (w + 1) additions of precomputed odd multiples remain.
+        """
+        table = self._odd_multiples(point, window)
+        negated = [self._neg_affine(entry) for entry in table]
+        result = self._JACOBIAN_INFINITY
+        for digit in reversed(self._wnaf(k, window)):
+            result = self._jacobian_double(result)
+            if digit > 0:
+                result = self._jacobian_add_mixed(result, table[digit >> 1])
+            elif digit < 0:
+                result = self._jacobian_add_mixed(result, negated[-digit >> 1])
         return result
 
+    def _multi_mult_jacobian(self, pairs, method=None):
+        """Returns the sum of k * point over pairs as a Jacobian triple."""
+        # Scalars of a point appearing several times (shared generators and
+        # public keys in batch verification) are added up first.
+        scalars = {}
+        for k, point in pairs:
+            if point is not None:
+                scalars[point] = scalars.get(point, 0) + k
+        # Multiples of G are taken from the fixed base table.
+        generator_k = scalars.pop(self.g, 0)
+        terms = []
+        for point, k in scalars.items():
+            k %= self.n
+            if k > self.n >> 1:
+                # -k * P costs as much as k * P, so small negative scalars
+                # (-1, -c, -w in folded verification equations) stay short.
+                k, point = self.n - k, self._neg_affine(point)
+            if k:
+                terms.append((k, point))
+
+        if method is None:
+            method = 'pippenger' if len(terms) >= self.PIPPENGER_THRESHOLD else 'straus'
+        if method == 'straus':
+            result = self._straus_jacobian(terms)
+        elif method == 'pippenger':
+            if self._endomorphism:
+                terms = self._glv_split(terms)
+            result = self._pippenger_jacobian(terms)
+        else:
+            raise ValueError(f'Unsupported multi_mult method: {method}')
+
+        generator_k %= self.n
+        if generator_k:
+            result = self._jacobian_add(
+                result, self._mult_generator_jacobian(generator_k))
+        return result
+
+    def _glv_decompose(self, k):
+        """Returns signed (k1, k2) of about half the bits of n with
+        k = k1 + k2 * lambda (mod n)."""
+        _, _, (a1, b1, a2, b2) = self._endomorphism
+        n = self.n
+        # Babai rounding of (k, 0) onto the short lattice basis.
+        c1 = (b2 * k + n // 2) // n
+        c2 = (-b1 * k + n // 2) // n
+        return k - c1 * a1 - c2 * a2, -c1 * b1 - c2 * b2
+
+    def _glv_split(self, terms):
+        """Returns the terms with every k * P split into k1 * P + k2 * phi(P),
+        where phi(x, y) = (beta * x, y) = lambda * P."""
+        beta = self._endomorphism[0]
+        p = self.p
+        split = []
+        for k, point in terms:
+            k1, k2 = self._glv_decompose(k)
+            x, y = point
+            for ki, (xi, yi) in ((k1, point), (k2, (beta * x % p, y))):
+                if ki < 0:
+                    ki, yi = -ki, -yi % p
+                if ki:
+                    split.append((ki, (xi, yi)))
+        return split
+
+    def _straus_jacobian(self, terms, window=WNAF_WINDOW):
+        """Straus: interleaved wNAF digits of all scalars over shared doublings,
+        each point with its own table of odd multiples.
+
+        With an endomorphism every scalar is split in two halves, the table of
+        phi(P) is the table of P with X multiplied by beta, so the split halves
+        the doublings at the cost of one multiplication per table entry.
+        """
+        result = self._JACOBIAN_INFINITY
+        if not terms:
+            return result
+
+        nafs = []
+        tables = []
+        for k, point in terms:
+            table = self._odd_multiples(point, window)
+            if self._endomorphism:
+                beta = self._endomorphism[0]
+                red = self.field.reduce
+                k1, k2 = self._glv_decompose(k)
+                columns = ((k1, table), (k2, [(red(beta * x), y) for x, y in table]))
+            else:
+                columns = ((k, table),)
+            for ki, table in columns:
+                if ki:
+                    naf = self._wnaf(abs(ki), window)
+                    # -k * P: negate every digit instead of the table
+                    nafs.append([-d for d in naf] if ki < 0 else naf)
+                    tables.append((table, [self._neg_affine(entry) for entry in table]))
+
+        if not nafs:
+            return result
+
+        for i in range(max(len(naf) for naf in nafs) - 1, -1, -1):
+            result = self._jacobian_double(result)
+            for naf, (table, negated) in zip(nafs, tables):
+                if i < len(naf) and naf[i]:
+                    digit = naf[i]
+                    if digit > 0:
+                        result = self._jacobian_add_mixed(result, table[digit >> 1])
+                    else:
+                        result = self._jacobian_add_mixed(result, negated[-digit >> 1])
+        return result
+
+    @staticmethod
+    def _pippenger_window(size, bits):
+        """Returns the bucket width minimising (bits / w) * (size + 2^(w+1))
+        additions."""
+        return min(range(1, 17),
+                   key=lambda w: -(-bits // w) * (size + (2 << w)))
+
+    def _pippenger_jacobian(self, terms, window=None):
+        """Pippenger: per window every point is added once into the bucket of
+        its digit, the buckets are then summed with running sums."""
+        result = self._JACOBIAN_INFINITY
+        if not terms:
+            return result
+
+        bits = max(k.bit_length() for k, _ in terms)
+        if window is None:
+            window = self._pippenger_window(len(terms), bits)
+        mask = (1 << window) - 1
+
+        for shift in range(((bits - 1) // window) * window, -1, -window):
+            for _ in range(window):
+                result = self._jacobian_double(result)
+
+            buckets = [self._JACOBIAN_INFINITY] * (mask + 1)
+            for k, point in terms:
+                digit = (k >> shift) & mask
+                if digit:
+                    buckets[digit] = self._jacobian_add_mixed(buckets[digit], point)
+
+            # sum(d * bucket[d]) = sum over d of (bucket[d] + ... + bucket[mask])
+            running = self._JACOBIAN_INFINITY
+            window_sum = self._JACOBIAN_INFINITY
+            for digit in range(mask, 0, -1):
+                running = self._jacobian_add(running, buckets[digit])
+                window_sum = self._jacobian_add(window_sum, running)
+            result = self._jacobian_add(result, window_sum)
+        return result
+
+    def _generator_table(self):
+        """Returns the fixed base table of the generator, building it once.
+
+        Row i holds the affine points j * 2^(w*i) * G for j in [0, 2^w), so
+        k * G is the sum of one entry per w-bit digit of k.
+        """
+        if self._fixed_base_table is not None:
+            return self._fixed_base_table
+
+        w = self._fixed_base_window
+        rows = -(-self.n.bit_length() // w)
+        size = (1 << w) - 1
+        jpoints = []
+        base = self._to_jacobian(self.g)
+        for _ in range(rows):
+            acc = base
+            jpoints.append(acc)
+            for _ in range(size - 1):
+                acc = self._jacobian_add(acc, base)
+                jpoints.append(acc)
+            # 2^w * base = (2^w - 1) * base + base
+            base = self._jacobian_add(acc, base)
+
+        # The whole table is brought to affine with a single inversion.
+        points = self.normalize_batch(jpoints)
+        table = [[None] + points[i * size:(i + 1) * size] for i in range(rows)]
+
+        self._fixed_base_table = table
+        return table
+
+    def _mult_generator_jacobian(self, k):
+        """Returns k * G (0 <= k < n) as a Jacobian triple using the table."""
+        w = self._fixed_base_window
+        mask = (1 << w) - 1
+        result = self._JACOBIAN_INFINITY
+        for row in self._generator_table():
+            if not k:
+                break
+            digit = k & mask
+            if digit:
+                result = self._jacobian_add_mixed(result, row[digit])
+            k >>= w
+        return result
+
+
+class EdwardsCurve(EllipticCurve):
+    """
+    Twisted Edwards curve -x^2 + y^2 = 1 + d * x^2 * y^2 (Ed25519).
+
+    The public interface is the one of EllipticCurve: affine (x, y) tuples
+    and None for the neutral element (0, 1), so the protocols run unchanged.
+    Internally points are extended coordinates (X, Y, Z, T) with x = X / Z,
+    y = Y / Z and T = X * Y / Z. The addition formulas are complete: the
+    same code adds, doubles and handles the neutral element, no special
+    cases and fewer multiplications than the Weierstrass formulas.
+
+    The curve has cofactor 8, validate_points also rejects points outside
+    the subgroup of order n.
+    """
+
+    def __init__(self, type_, a, d, G, p, n, cofactor=8, **kwargs):
+        if a % p != p - 1:
+            raise ValueError(f'Only a = -1 is supported, got a = {a}')
+        super().__init__(type_, a, d, G, p, n, cofactor=cofactor, **kwargs)
+        self.d = d
+        self._d2 = 2 * d % p
+        self._byte_length = (p.bit_length() + 8) // 8
+
+    # Extended coordinates, the neutral element (0, 1) is (0, 1, 1, 0).
+
+    _JACOBIAN_INFINITY = (0, 1, 1, 0)
+
+    def _is_nonsingular(self):
+        # a * d * (a - d) != 0 (mod p)
+        return self.a * self.d * (self.a - self.d) % self.p != 0
+
+    def _is_infinity(self, epoint):
+        X, Y, Z, _ = epoint
+        return X == 0 and Y == Z
+
+    def _jacobian_equal(self, epoint1, epoint2):
+        """Returns True if X1 * Z2 == X2 * Z1 and Y1 * Z2 == Y2 * Z1."""
+        X1, Y1, Z1, _ = epoint1
+        X2, Y2, Z2, _ = epoint2
+        red = self.field.reduce
+        return red(X1 * Z2 - X2 * Z1) == 0 and red(Y1 * Z2 - Y2 * Z1) == 0
+
+    def is_on_curve(self, point):
+        """Returns True if the given point lies on the curve."""
+        if point is None:
+            return True
+        x, y = point
+        xx, yy = x * x, y * y
+        return (yy - xx - 1 - self.d * xx * yy) % self.p == 0
+
+    def validate_points(self, points):
+        """Returns True if every point is None or a pair of reduced
+        coordinates on the curve in the subgroup of order n, points with a
+        small order component would let a prover cheat with probability
+        1 / cofactor."""
+        if not super().validate_points(points):
+            return False
+        return all(point is None or self._is_infinity(self._mult_jacobian(self.n, point))
+                   for point in points)
+
+    def point_add(self, point1, point2, validate=True):
+        """Returns point1 + point2 according to the group law."""
+        if validate:
+            assert self.is_on_curve(point1)
+            assert self.is_on_curve(point2)
+
+        result = self._to_affine(self._jacobian_add(
+            self._to_jacobian(point1), self._to_jacobian(point2)))
+
+        if validate:
+            assert self.is_on_curve(result)
+
+        return result
+
+    def point_neg(self, point, validate=True):
+        """Returns -point."""
+        if validate:
+            assert self.is_on_curve(point)
+
+        if point is None:
+            return None
+
+        return self._neg_affine(point)
+
+    def _neg_affine(self, point):
+        x, y = point
+        return ((self.p - x) % self.p, y)
+
+    def encode_point(self, point, compressed=True):
+        """Returns the RFC 8032 encoding of point: y in little endian with the
+        parity of x in the top bit. With compressed=False x and y are both
+        written in little endian."""
+        x, y = point if point is not None else (0, 1)
+        size = self._byte_length
+        if compressed:
+            return (int(y) | (int(x) & 1) << (size * 8 - 1)).to_bytes(size, 'little')
+        return int(x).to_bytes(size, 'little') + int(y).to_bytes(size, 'little')
+
+    def decode_point(self, data):
+        """Returns the point of an encoding made by encode_point, raises
+        ValueError if data is not an encoding of a point on the curve."""
+        size = self._byte_length
+        p = self.p
+        if len(data) == size:
+            value = int.from_bytes(data, 'little')
+            sign = value >> (size * 8 - 1)
+            y = value & ((1 << (size * 8 - 1)) - 1)
+            if y >= p:
+                raise ValueError('Invalid point encoding')
+            # x^2 = (y^2 - 1) / (d * y^2 + 1)
+            yy = y * y
+            x = self.field.sqrt((yy - 1) * self.field.inv(self.d * yy + 1))
+            if x is None:
+                raise ValueError('Point is not on the curve')
+            x = int(x)
+            if x == 0 and sign:
+                raise ValueError('Invalid point encoding')
+            if x & 1 != sign:
+                x = p - x
+            point = (x, y)
+        elif len(data) == 2 * size:
+            point = (int.from_bytes(data[:size], 'little'),
+                     int.from_bytes(data[size:], 'little'))
+            if not (0 <= point[0] < p and 0 <= point[1] < p and self.is_on_curve(point)):
+                raise ValueError('Point is not on the curve')
+        else:
+            raise ValueError('Invalid point encoding')
+        return None if point == (0, 1) else point
+
+    def _to_jacobian(self, point):
+        """Returns the extended coordinates of an affine point."""
+        if point is None:
+            return self._JACOBIAN_INFINITY
+        x, y = point
+        return (x, y, 1, self.field.reduce(x * y))
+
+    def _to_affine(self, epoint):
+        """Returns the affine point of extended coordinates, None for the
+        neutral element."""
+        if self._is_infinity(epoint):
+            return None
+        X, Y, Z, _ = epoint
+        red = self.field.reduce
+        to_int = self.field.backend.to_int
+        z_inv = self.field.inv(Z)
+        return (to_int(red(X * z_inv)), to_int(red(Y * z_inv)))
+
+    def normalize_batch(self, epoints):
+        """Returns the affine points of a list of extended coordinates with one
+        inversion for all of them."""
+        red = self.field.reduce
+        to_int = self.field.backend.to_int
+        z_invs = self.field.batch_inv([Z for _, _, Z, _ in epoints])
+        points = []
+        for epoint, z_inv in zip(epoints, z_invs):
+            if self._is_infinity(epoint):
+                points.append(None)
+                continue
+            X, Y, _, _ = epoint
+            points.append((to_int(red(X * z_inv)), to_int(red(Y * z_inv))))
+        return points
+
+    def _jacobian_double(self, epoint):
+        """Returns 2 * epoint (dbl-2008-hwcd with a = -1)."""
+        X1, Y1, Z1, _ = epoint
+        red = self.field.reduce
+        A = red(X1 * X1)
+        B = red(Y1 * Y1)
+        C = red(2 * Z1 * Z1)
+        E = red((X1 + Y1) * (X1 + Y1) - A - B)
+        G = B - A
+        F = G - C
+        H = -A - B
+        return (red(E * F), red(G * H), red(F * G), red(E * H))
+
+    def _jacobian_add(self, epoint1, epoint2):
+        """Returns epoint1 + epoint2 (add-2008-hwcd-3 with a = -1), complete
+        for all inputs including doubling and the neutral element."""
+        X1, Y1, Z1, T1 = epoint1
+        X2, Y2, Z2, T2 = epoint2
+        red = self.field.reduce
+        A = red((Y1 - X1) * (Y2 - X2))
+        B = red((Y1 + X1) * (Y2 + X2))
+        C = red(T1 * self._d2 * T2)
+        D = red(2 * Z1 * Z2)
+        E = B - A
+        F = D - C
+        G = D + C
+        H = B + A
+        return (red(E * F), red(G * H), red(F * G), red(E * H))
+
+    def _jacobian_add_mixed(self, epoint, point):
+        """Returns epoint + point where point is affine (Z == 1 implied)."""
+        if point is None:
+            return epoint
+        X1, Y1, Z1, T1 = epoint
+        x2, y2 = point
+        red = self.field.reduce
+        A = red((Y1 - X1) * (y2 - x2))
+        B = red((Y1 + X1) * (y2 + x2))
+        C = red(T1 * self._d2 * x2 * y2)
+        D = 2 * Z1
+        E = B - A
+        F = D - C
+        G = D + C
+        H = B + A
+        return (red(E * F), red(G * H), red(F * G), red(E * H))
+
+
+# Domain parameters of the supported curves, a curve object is only built by
+# get_curve when it is first requested.
+CURVE_PARAMETERS = {
+    "secp256k1": dict(
+        a=0,
+        b=7,
+        G=(55066263022277343669578718895168534326250603453777594175500187360389116729240,
+           32670510020758816978083085130507043184471273380659243275938904335757337482424),
+        p=115792089237316195423570985008687907853269984665640564039457584007908834671663,
+        n=115792089237316195423570985008687907852837564279074904382605163141518161494337,
+        endomorphism=(
+            0x7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee,
+            0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72,
+            (0x3086d221a7d46bcde86c90e49284eb15,
+             -0xe4437ed6010e88286f547fa90abfe4c3,
+             0x114ca50f7a8e2f3f657c1108d9d44cfd8,
+             0x3086d221a7d46bcde86c90e49284eb15))
+    ),
+    "secp256r1": dict(
+        a=0xffffffff00000001000000000000000000000000fffffffffffffffffffffffc,
+        b=0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b,
+        G=(0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296,
+           0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5),
+        p=0xffffffff00000001000000000000000000000000ffffffffffffffffffffffff,
+        n=115792089210356248762697446949407573529996955224135760342422259061068512044369
+    ),
+    "curve25519": dict(
+        a=19298681539552699237261830834781317975544997444273427339909597334573241639236,
+        b=55751746669818908907645289078257140818241103727901012315294400837956729358436,
+        G=(19298681539552699237261830834781317975544997444273427339909597334652188435546,
+           14781619447589544791020593568409986887264606134616475288964881837755586237401),
+        p=pow(2, 255)-19,
+        n=7237005577332262213973186563042994240857116359379907606001950938285454250989
+    ),
+    "ed25519": dict(
+        model=EdwardsCurve,
+        a=-1,
+        d=37095705934669439343138083508754565189542113879843219016388785533085940283555,
+        G=(15112221349535400772501151409588531511454012693041857206046113283949847762202,
+           46316835694926478169428394003475163141307993866256225615783033603165251855960),
+        p=pow(2, 255)-19,
+        n=pow(2, 252)+27742317777372353535851937790883648493,
+        cofactor=8,
+        security_bits=128
+    ),
+    "P192": dict(
+        a=-3,
+        b=0x64210519e59c80e70fa7e9ab72243049feb8deecc146b9b1,
+        G=(0x188da80eb03090f67cbf20eb43a18800f4ff0afd82ff1012,
+           0x07192b95ffc8da78631011ed6b24cdd573f977a11e794811),
+        p=6277101735386680763835789423207666416083908700390324961279,
+        n=6277101735386680763835789423176059013767194773182842284081
+    ),
+    "P224": dict(
+        a=-3,
+        b=18958286285566608000408668544493926415504680968679321075787234672564,
+        G=(19277929113566293071110308034699488026831934219452440156649784352033,
+           19926808758034470970197974370888749184205991990603949537637343198772),
+        p=26959946667150639794667015087019630673557916260026308143510066298881,
+        n=26959946667150639794667015087019625940457807714424391721682722368061
+    ),
+    "P384": dict(
+        a=-3,
+        b=27580193559959705877849011840389048093056905856361568521428707301988689241309860865136260764883745107765439761230575,
+        G=(26247035095799689268623156744566981891852923491109213387815615900925518854738050089022388053975719786650872476732087,
+           8325710961489029985546751289520108179287853048861315594709205902480503199884419224438643760392947333078086511627871),
+        p=39402006196394479212279040100143613805079739270465446667948293404245721771496870329047266088258938001861606973112319,
+        n=0xffffffffffffffffffffffffffffffffffffffffffffffffc7634d81f4372ddf581a0db248b0a77aecec196accc52973
+    ),
+    "secp160r2": dict(
+        a=1461501637330902918203684832716283019651637554288,
+        b=1032640608390511495214075079957864673410201913530,
+        G=(0x52dcb034293a117e1f4ff11b30f7199d3144ce6d,
+           0xfeaffef2e331f296e071fa0df9982cfea7d43f2e),
+        p=1461501637330902918203684832716283019651637554291,
+        n=1461501637330902918203685083571792140653176136043
+    ),
+    "brainpoolP160r1": dict(
+        a=0x340E7BE2A280EB74E2BE61BADA745D97E8F7C300,
+        b=0x1E589A8595423412134FAA2DBDEC95C8D8675E58,
+        G=(0xBED5AF16EA3F6A4F62938C4631EB5AF7BDBCDBC3,
+           0x1667CB477A1A8EC338F94741669C976316DA6321),
+        p=0xE95E4A5F737059DC60DFC7AD95B3D8139515620F,
+        n=0xE95E4A5F737059DC60DF5991D45029409E60FC09
+    ),
+    "brainpoolP192r1": dict(
+        a=0x6A91174076B1E0E19C39C031FE8685C1CAE040E5C69A28EF,
+        b=0x469A28EF7C28CCA3DC721D044F4496BCCA7EF4146FBF25C9,
+        G=(0xC0A0647EAAB6A48753B033C56CB0F0900A2F5C4853375FD6,
+           0x14B690866ABD5BB88B5F4828C1490002E6773FA2FA299B8F),
+        p=0xC302F41D932A36CDA7A3463093D18DB78FCE476DE1A86297,
+        n=0xC302F41D932A36CDA7A3462F9E9E916B5BE8F1029AC4ACC1
+    ),
+    "brainpoolP224r1": dict(
+        a=0x68A5E62CA9CE6C1C299803A6C1530B514E182AD8B0042A59CAD29F43,
+        b=0x2580F63CCFE44138870713B1A92369E33E2135D266DBB372386C400B,
+        G=(0x0D9029AD2C7E5CF4340823B2A87DC68C9E4CE3174C1E6EFDEE12C07D,
+           0x58AA56F772C0726F24C6B89E4ECDAC24354B9E99CAA3F6D3761402CD),
+        p=0xD7C134AA264366862A18302575D1D787B09F075797DA89F57EC8C0FF,
+        n=0xD7C134AA264366862A18302575D0FB98D116BC4B6DDEBCA3A5A7939F
+    ),
+    "brainpoolP256r1": dict(
+        a=0x7D5A0975FC2C3057EEF67530417AFFE7FB8055C126DC5C6CE94A4B44F330B5D9,
+        b=0x26DC5C6CE94A4B44F330B5D9BBD77CBF958416295CF7E1CE6BCCDC18FF8C07B6,
+        G=(0x8BD2AEB9CB7E57CB2C4B482FFC81B7AFB9DE27E1E3BD23C23A4453BD9ACE3262,
+           0x547EF835C3DAC4FD97F8461A14611DC9C27745132DED8E545C1D54C72F046997),
+        p=0xA9FB57DBA1EEA9BC3E660A909D838D726E3BF623D52620282013481D1F6E5377,
+        n=0xA9FB57DBA1EEA9BC3E660A909D838D718C397AA3B561A6F7901E0E82974856A7
+    ),
+    # BN curve of ISO/IEC 15946-5 (BN P256), y^2 = x^3 + 3 with G = (1, 2).
+    # The pairing moves the discrete logarithm into F_p^12 where the number
+    # field sieve variants bring the security down to about 100 bits.
+    "BN256": dict(
+        security_bits=100,
+        a=0,
+        b=3,
+        G=(1, 2),
+        p=0xfffffffffffcf0cd46e5f25eee71a49f0cdc65fb12980a82d3292ddbaed33013,
+        n=0xfffffffffffcf0cd46e5f25eee71a49e0cdc65fb1299921af62d536cd10b500d
+    ),
+    "P512": dict(
+        a=-3,
+        b=1093849038073734274511112390766805569936207598951683748994586394495953116150735016013708737573759623248592132296706313309438452531591012912142327488478985984,
+        G=(2661740802050217063228768716723360960729859168756973147706671368418802944996427808491545080627771902352094241225065558662157113545570916814161637315895999846,
+           3757180025770020463545507224491183603594455134769762486694567779615544477440556316691234405012945539562144444537289428522585666729196580810124344277578376784),
+        p=6864797660130609714981900799081393217269435300143305409394463459185543183397656052122559640661454554977296311391480858037121987999716643812574028291115057151,
+        n=0x000001fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffa51868783bf2f966b7fcc0148f709a5d03bb5c9b8899c47aebb6fb71e91386409,
+        # p = 2^521 - 1, the only field where the special reduction beats %
+        field=partial(MersenneField, 521),
+        security_bits=256
+    ),
+}
+
+supported_curves = ['secp160r2', 'brainpoolP160r1', 'P192', 'brainpoolP192r1',
+                    'P224', 'brainpoolP224r1', 'secp256k1', "secp256r1",
+                    'brainpoolP256r1', 'BN256', 'ed25519', 'P384', 'P512']
+
+_curves = {}
+
 
 def get_curve(type_):
-    supported_curves = ['secp256k1', "secp256r1", 'P192']
-    curves = {
-        "secp256k1": EllipticCurve(
-            "secp256k1",
-            0,
-            7,
-            (55066263022277343669578718895168534326250603453777594175500187360389116729240,
-             32670510020758816978083085130507043184471273380659243275938904335757337482424),
-            115792089237316195423570985008687907853269984665640564039457584007908834671663,
-            115792089237316195423570985008687907852837564279074904382605163141518161494337
-        ),
-        "secp256r1": EllipticCurve(
-            "secp256r1",
-            0xffffffff00000001000000000000000000000000fffffffffffffffffffffffc,
-            0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b,
-            (0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296, 
-             0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5),
-            0xffffffff00000001000000000000000000000000ffffffffffffffffffffffff,
-            115792089210356248762697446949407573529996955224135760342422259061068512044369
-        ),
-        "curve25519": EllipticCurve(
-            "curve25519",
-            19298681539552699237261830834781317975544997444273427339909597334573241639236,
-            55751746669818908907645289078257140818241103727901012315294400837956729358436,
-            (19298681539552699237261830834781317975544997444273427339909597334652188435546,
-             14781619447589544791020593568409986887264606134616475288964881837755586237401),
-            pow(2, 255)-19,
-            7237005577332262213973186563042994240857116359379907606001950938285454250989
-        ),
-        "P192": EllipticCurve(
-            "P192",
-            -3,
-            18958286285566608000408668544493926415504680968679321075787234672564,
-            (19277929113566293071110308034699488026831934219452440156649784352033,
-             19926808758034470970197974370888749184205991990603949537637343198772),
-            26959946667150639794667015087019630673557916260026308143510066298881,
-            6277101735386680763835789423176059013767194773182842284081
-        ),
-        "P512": EllipticCurve(
-            "P512",
-            -3,
-            1093849038073734274511112390766805569936207598951683748994586394495953116150735016013708737573759623248592132296706313309438452531591012912142327488478985984,
-            (2661740802050217063228768716723360960729859168756973147706671368418802944996427808491545080627771902352094241225065558662157113545570916814161637315895999846,
-             3757180025770020463545507224491183603594455134769762486694567779615544477440556316691234405012945539562144444537289428522585666729196580810124344277578376784),
-            6864797660130609714981900799081393217269435300143305409394463459185543183397656052122559640661454554977296311391480858037121987999716643812574028291115057151,
-            0x000001fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffa51868783bf2f966b7fcc0148f709a5d03bb5c9b8899c47aebb6fb71e91386409
-        ), 
-    }
-    if type_ in supported_curves:
-        return curves.get(type_, None)
-    else:
+    """
+    Returns the curve named type_. Each curve is built on first use and then
+    shared, so all protocol classes on the same curve reuse one object and
+    its precomputed tables. Curves are cached per big integer backend.
+    """
+    if type_ not in supported_curves:
         raise ValueError(f"{type_} not supported")
+    key = (type_, get_backend().name)
+    curve = _curves.get(key)
+    if curve is None:
+        parameters = dict(CURVE_PARAMETERS[type_])
+        model = parameters.pop('model', EllipticCurve)
+        field = parameters.pop('field', None)
+        curve = model(type_, field=field and field(), **parameters)
+        _curves[key] = curve
+    return curve
+
 
-# elif (mytype=="P256"):
-#   print ("P256")
-#   a=-3
-#   b=41058363725152142129326129780047268409114441015993725554835256314039467401291
-#   G=(48439561293906451759052585252797914202762949526041747995844080717082404635286, 36134250956749795798585127919587881956611106672985015071877198253568414405109)
-#   p=115792089210356248762697446949407573530086143415290314195533631308867097853951
-#   n=115792089210356248762697446949407573529996955224135760342422259061068512044369
-# elif (mytype=="P224"):
-#   print ("P224")
-#   a=-3
-#   b=18958286285566608000408668544493926415504680968679321075787234672564
-#   G=(19277929113566293071110308034699488026831934219452440156649784352033, 19926808758034470970197974370888749184205991990603949537637343198772)
-#   p=26959946667150639794667015087019630673557916260026308143510066298881
-#   n=26959946667150639794667015087019625940457807714424391721682722368061
-# elif (mytype=="P384"):
-#   print ("P384")
-#   a=-3
-#   b=27580193559959705877849011840389048093056905856361568521428707301988689241309860865136260764883745107765439761230575
-#   G=(26247035095799689268623156744566981891852923491109213387815615900925518854738050089022388053975719786650872476732087, 8325710961489029985546751289520108179287853048861315594709205902480503199884419224438643760392947333078086511627871)
-#   p=39402006196394479212279040100143613805079739270465446667948293404245721771496870329047266088258938001861606973112319
-#   n=0xffffffffffffffffffffffffffffffffffffffffffffffffc7634d81f4372ddf581a0db248b0a77aecec196accc52973
-# elif (mytype=="secp160r2"):
-#   print ("secp160r2")
-#   a=1461501637330902918203684832716283019651637554288
-#   b=1032640608390511495214075079957864673410201913530
-#   G=(0x52dcb034293a117e1f4ff11b30f7199d3144ce6d , 0xfeaffef2e331f296e071fa0df9982cfea7d43f2e)
-#   p=1461501637330902918203684832716283019651637554291
-#   n=1461501637330902918203685083571792140653176136043
-# elif (mytype=="brainpoolP160r1"):
-#   print ("brainpoolP160r1")
-#   a=0x340E7BE2A280EB74E2BE61BADA745D97E8F7C300
-#   b=0x1E589A8595423412134FAA2DBDEC95C8D8675E58
-#   G=(0xBED5AF16EA3F6A4F62938C4631EB5AF7BDBCDBC3, 0x1667CB477A1A8EC338F94741669C976316DA6321)
-#   p=0xE95E4A5F737059DC60DFC7AD95B3D8139515620F
-#   n=0xE95E4A5F737059DC60DF5991D45029409E60FC09
-# elif (mytype=="brainpoolP192r1"):
-#   print ("brainpoolP192r1")
-#   a=0x6A91174076B1E0E19C39C031FE8685C1CAE040E5C69A28EF
-#   b=0x469A28EF7C28CCA3DC721D044F4496BCCA7EF4146FBF25C9
-#   G=(0xC0A0647EAAB6A48753B033C56CB0F0900A2F5C4853375FD6, 0x14B690866ABD5BB88B5F4828C1490002E6773FA2FA299B8F)
-#   p=0xC302F41D932A36CDA7A3463093D18DB78FCE476DE1A86297
-#   n=0xC302F41D932A36CDA7A3462F9E9E916B5BE8F1029AC4ACC1
-# elif (mytype=="brainpoolP224r1"):
-#   print ("brainpoolP224r1")
-#   a=0x68A5E62CA9CE6C1C299803A6C1530B514E182AD8B0042A59CAD29F43
-#   b=0x2580F63CCFE44138870713B1A92369E33E2135D266DBB372386C400B
-#   G=(0x0D9029AD2C7E5CF4340823B2A87DC68C9E4CE3174C1E6EFDEE12C07D,0x58AA56F772C0726F24C6B89E4ECDAC24354B9E99CAA3F6D3761402CD)
-#   p=0xD7C134AA264366862A18302575D1D787B09F075797DA89F57EC8C0FF
-#   n=0xD7C134AA264366862A18302575D0FB98D116BC4B6DDEBCA3A5A7939F
-# elif (mytype=="brainpoolP256r1"):
-#   print ("brainpoolP256r1")
-#   a=0x7D5A0975FC2C3057EEF67530417AFFE7FB8055C126DC5C6CE94A4B44F330B5D9
-#   b=0x26DC5C6CE94A4B44F330B5D9BBD77CBF958416295CF7E1CE6BCCDC18FF8C07B6
-#   G=(0x8BD2AEB9CB7E57CB2C4B482FFC81B7AFB9DE27E1E3BD23C23A4453BD9ACE3262,0x547EF835C3DAC4FD97F8461A14611DC9C27745132DED8E545C1D54C72F046997)
-#   p=0xA9FB57DBA1EEA9BC3E660A909D838D726E3BF623D52620282013481D1F6E5377
-#   n=0xA9FB57DBA1EEA9BC3E660A909D838D718C397AA3B561A6F7901E0E82974856A7
-# elif (mytype=="BN(2,254)"):
-#   print ("BN(2,254)")
-#   a=0
-#   b=2
-#   G=(1,2)
-#   p=0xfffffffffffcf0cd46e5f25eee71a49f0cdc65fb12980a82d3292ddbaed33013
-#   n=0xfffffffffffcf0cd46e5f25eee71a49e0cdc65fb1299921af62d536cd10b500d
\ No newline at end of file
+def get_curve_for_security(bits):
+    """Returns the curve with the smallest group order that offers at least
+    `bits` bits of security, see EllipticCurve.security_bits."""
+    # building a curve is cheap, the tables are only made on first use
+    candidates = [curve for curve in map(get_curve, supported_curves)
+                  if curve.security_bits >= bits]
+    if not candidates:
+        raise ValueError(f"No supported curve offers {bits} bits of security")
+    return min(candidates, key=lambda curve: curve.n)
\ No newline at end of file
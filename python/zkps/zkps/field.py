@@ -0,0 +1,199 @@
+from .backend import get_backend
+
+
+class PrimeField():
+    """
+    Integers modulo a prime p, the coordinate field of an elliptic curve.
+
+    The point formulas only call reduce (and inv for the final affine
+    conversion), so a field with a special form modulus can replace the
+    generic % by a cheaper reduction. In CPython the generic % runs in C, a
+    reduction written in Python only wins where it needs very few big
+    integer operations, see perf/field/test_field.py.
+
+    The integers themselves come from the big integer backend (see
+    backend.py), with gmpy2 every reduced value is an mpz.
+    """
+
+    name = 'generic'
+
+    def __init__(self, p, backend=None):
+        self.p = p
+        self.backend = backend or get_backend()
+        # __rmod__ is a C level callable, reduce(x) costs as much as x % p and
+        # returns the backend's integer type.
+        self.reduce = self.backend.mpz(p).__rmod__
+
+    def mul(self, a, b):
+        return self.reduce(a * b)
+
+    def sqr(self, a):
+        return self.reduce(a * a)
+
+    def add(self, a, b):
+        return self.reduce(a + b)
+
+    def sub(self, a, b):
+        return self.reduce(a - b)
+
+    def neg(self, a):
+        return self.reduce(-a)
+
+    def inv(self, a):
+        """Returns the inverse of a, a must not be divisible by p."""
+        if a % self.p == 0:
+            raise ZeroDivisionError('division by zero')
+        return self.backend.invert(a, self.p)
+
+    def batch_inv(self, values):
+        """Returns the inverses of all values with a single inversion
+        (Montgomery's trick): invert the product, then peel off one factor at
+        a time. No value may be divisible by p."""
+        red = self.reduce
+        prefixes = []
+        acc = 1
+        for value in values:
+            prefixes.append(acc)
+            acc = red(acc * value)
+        inv = self.inv(acc)
+        inverses = [0] * len(values)
+        for i in range(len(values) - 1, -1, -1):
+            inverses[i] = red(inv * prefixes[i])
+            inv = red(inv * values[i])
+        return inverses
+
+    def sqrt(self, a):
+        """Returns a square root of a, None if a is not a square. For
+        p = 3 mod 4 it is a single exponentiation, other primes use
+        Tonelli-Shanks."""
+        p = self.p
+        powmod = self.backend.powmod
+        a %= p
+        if a == 0:
+            return 0
+        if powmod(a, (p - 1) // 2, p) != 1:
+            return None
+        if p % 4 == 3:
+            return powmod(a, (p + 1) // 4, p)
+        # p - 1 = q * 2^s with q odd
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q //= 2
+            s += 1
+        z = 2
+        while powmod(z, (p - 1) // 2, p) != p - 1:
+            z += 1
+        c = powmod(z, q, p)
+        r = powmod(a, (q + 1) // 2, p)
+        t = powmod(a, q, p)
+        m = s
+        while t != 1:
+            i, t2 = 0, t
+            while t2 != 1:
+                t2 = t2 * t2 % p
+                i += 1
+            b = powmod(c, 1 << (m - i - 1), p)
+            r = r * b % p
+            c = b * b % p
+            t = t * c % p
+            m = i
+        return r
+
+
+class MersenneField(PrimeField):
+    """
+    Field modulo the Mersenne prime p = 2^k - 1 (P-521), since 2^k = 1 the
+    reduction only folds the high bits onto the low ones.
+    """
+
+    name = 'mersenne'
+
+    def __init__(self, k, backend=None):
+        super().__init__((1 << k) - 1, backend)
+        self._k = k
+        self.reduce = self._reduce
+
+    def _reduce(self, x):
+        k, p = self._k, self.p
+        # For negative x the folding stops at a value in [0, 2^k).
+        while x >> k:
+            x = (x & p) + (x >> k)
+        return 0 if x == p else x
+
+
+class PseudoMersenneField(PrimeField):
+    """
+    Field modulo p = 2^k - c for a small c (secp256k1: c = 2^32 + 977), since
+    2^k = c the high bits are folded back multiplied by c.
+    """
+
+    name = 'pseudo-mersenne'
+
+    def __init__(self, k, c, backend=None):
+        super().__init__((1 << k) - c, backend)
+        self._k = k
+        self._c = c
+        self._mask = (1 << k) - 1
+        self.reduce = self._reduce
+
+    def _reduce(self, x):
+        k, c, mask = self._k, self._c, self._mask
+        while x >> k:
+            x = (x & mask) + (x >> k) * c
+            if x < 0:
+                return x % self.p
+        return x - self.p if x >= self.p else x
+
+
+class SolinasField(PrimeField):
+    """
+    Field modulo a generalized Mersenne (Solinas) prime
+    p = 2^k - sum(sign * 2^e) as used by the NIST curves, e.g. P-256 with
+    terms [(1, 224), (-1, 192), (-1, 96), (1, 0)].
+    """
+
+    name = 'solinas'
+
+    def __init__(self, k, terms, backend=None):
+        super().__init__((1 << k) - sum(sign << e for sign, e in terms), backend)
+        self._k = k
+        self._terms = terms
+        self._mask = (1 << k) - 1
+        self.reduce = self._reduce
+
+    def _reduce(self, x):
+        k, mask = self._k, self._mask
+        # 2^k = sum(sign * 2^e) (mod p)
+        while x >> k > 0:
+            high = x >> k
+            x &= mask
+            for sign, e in self._terms:
+                x += sign * (high << e)
+        return x % self.p
+
+
+def special_fields(p):
+    """Returns the special form fields that apply to the prime p."""
+    fields = []
+    k = p.bit_length()
+    if p == (1 << k) - 1:
+        fields.append(MersenneField(k))
+    c = (1 << k) - p
+    if 0 < c < (1 << (k // 4)):
+        fields.append(PseudoMersenneField(k, c))
+    terms = SOLINAS_TERMS.get(p)
+    if terms:
+        fields.append(SolinasField(k, terms))
+    return fields
+
+
+SOLINAS_TERMS = {
+    # P-192: p = 2^192 - 2^64 - 1
+    2**192 - 2**64 - 1: [(1, 64), (1, 0)],
+    # P-224: p = 2^224 - 2^96 + 1
+    2**224 - 2**96 + 1: [(1, 96), (-1, 0)],
+    # P-256: p = 2^256 - 2^224 + 2^192 + 2^96 - 1
+    2**256 - 2**224 + 2**192 + 2**96 - 1: [(1, 224), (-1, 192), (-1, 96), (1, 0)],
+    # P-384: p = 2^384 - 2^128 - 2^96 + 2^32 - 1
+    2**384 - 2**128 - 2**96 + 2**32 - 1: [(1, 128), (1, 96), (-1, 32), (1, 0)],
+}
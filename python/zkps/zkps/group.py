@@ -0,0 +1,142 @@
+import random
+from math import gcd
+from functools import lru_cache
+from libnum import generate_prime, prime_test
+from .backend import powmod, jacobi
+
+# product of the odd primes below 1000, candidates sharing a factor with it
+# are discarded before the first exponentiation
+_SMALL_PRIMES_PRODUCT = 1
+for _n in range(3, 1000, 2):
+    if all(_n % _d for _d in range(3, int(_n ** 0.5) + 1, 2)):
+        _SMALL_PRIMES_PRODUCT *= _n
+
+
+class MultiplicativeGroup():
+    """
+    Z_p^*, the group the mod p protocols work in when they are given a plain
+    prime p. Its order p - 1 is what exponents and challenges are reduced by.
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.q = p - 1
+        self._random = random.SystemRandom()
+
+    def get_random(self):
+        """Returns a random exponent in [1, q)."""
+        return self._random.randint(1, self.q - 1)
+
+    def get_challenge(self, bits=None):
+        """Returns a random challenge in [1, q), shorter than bits bits if
+        given, which makes the y^c terms of a verification cheaper."""
+        if bits is not None and bits <= 0:
+            raise ValueError(f'Invalid challenge length: {bits}')
+        upper = self.q if bits is None else min(self.q, 1 << bits)
+        return self._random.randint(1, upper - 1)
+
+    def is_element(self, y):
+        return 0 < y < self.p
+
+    def validate_elements(self, elements):
+        """Returns True if all elements lie in the group."""
+        return all(self.is_element(y) for y in elements)
+
+
+class SchnorrGroup(MultiplicativeGroup):
+    """
+    The subgroup of prime order q of Z_p^*, q dividing p - 1, generated by g.
+
+    Passed to the mod p protocols in place of p, their exponents, nonces and
+    challenges are reduced modulo q instead of p - 1. With a 2048-bit p and
+    a 256-bit q every exponentiation of a response or nonce is about eight
+    times shorter than one modulo p - 1, at the same security as long as q
+    has twice the bits of the wanted security level.
+
+    The public values of a statement (generators, public keys) have to lie
+    in the subgroup, the protocols check them with validate_elements when
+    they are constructed or passed to verify. The verification equations
+    then only hold for commitments in the subgroup as well, batch
+    verification checks them explicitly (see batch.modp_failing_indices).
+    """
+
+    def __init__(self, p, q, g):
+        """
+        :param p: prime modulus
+        :param q: prime order of the subgroup, q divides p - 1
+        :param g: generator of the subgroup
+        """
+        super().__init__(p)
+        self.q = q
+        self.g = g
+
+    def validate(self):
+        """Returns True if p and q are prime, q divides p - 1 and g
+        generates the subgroup of order q."""
+        return prime_test(self.p) and prime_test(self.q) and \
+            (self.p - 1) % self.q == 0 and self.g != 1 and self.is_element(self.g)
+
+    def is_element(self, y):
+        """Returns True if y lies in the subgroup of order q, see
+        is_element below."""
+        return is_element(y, self.p, self.q)
+
+    def get_generators(self, n=1):
+        """Returns n random generators of the subgroup, random elements of
+        Z_p^* raised to the cofactor (p - 1) / q."""
+        cofactor = (self.p - 1) // self.q
+        gs = []
+        while len(gs) < n:
+            g = powmod(self._random.randint(2, self.p - 2), cofactor, self.p)
+            if g != 1:
+                gs.append(g)
+        return gs
+
+    @classmethod
+    def from_safe_prime(cls, p, g=4):
+        """The subgroup of quadratic residues of a safe prime p = 2q + 1,
+        4 = 2^2 always generates it."""
+        return cls(p, (p - 1) // 2, g)
+
+    @classmethod
+    def generate(cls, p_bits=2048, q_bits=256):
+        """
+        Generates parameters p = k * q + 1 with a q_bits prime q and a
+        p_bits prime p, as in DSA. Takes a few seconds for 2048 bits.
+        """
+        _random = random.SystemRandom()
+        q = generate_prime(q_bits)
+        while True:
+            k = _random.getrandbits(p_bits - q_bits) | 1 << (p_bits - q_bits - 1)
+            p = (k & ~1) * q + 1
+            if p.bit_length() != p_bits or gcd(p, _SMALL_PRIMES_PRODUCT) != 1:
+                continue
+            # one Fermat test before the full Miller-Rabin rounds
+            if powmod(2, p - 1, p) == 1 and prime_test(p):
+                break
+        group = cls(p, q, None)
+        group.g = group.get_generators()[0]
+        return group
+
+
+@lru_cache(maxsize=1024)
+def is_element(y, p, q):
+    """
+    Returns True if y lies in the subgroup of prime order q of Z_p^*. For a
+    safe prime p = 2q + 1 the subgroup is the quadratic residues and a
+    Jacobi symbol decides, otherwise it costs one exponentiation by q. The
+    public values of a statement are checked again on every verify, so the
+    results are cached.
+    """
+    if not 0 < y < p:
+        return False
+    if p == 2 * q + 1:
+        return jacobi(y, p) == 1
+    return powmod(y, q, p) == 1
+
+
+def get_group(p):
+    """Returns p if it is a group, otherwise Z_p^* of the prime p."""
+    if isinstance(p, MultiplicativeGroup):
+        return p
+    return MultiplicativeGroup(p)
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 
 class ZeroKnowledgeProtocol(ABC):
+    # length in bits of the verifier's random challenge, None for the whole
+    # group order (see MultiplicativeGroup.get_challenge)
+    challenge_bits = None
+
     @abstractmethod
     def response(self, statement):
         pass
@@ -0,0 +1,98 @@
+import hashlib
+
+
+class Transcript():
+    """
+    Fiat-Shamir transcript, a hash over everything prover and verifier have
+    seen so far from which the challenges are derived.
+
+    Every message is absorbed as its label and its data, each preceded by
+    its length as 4 big-endian bytes, so no two different sequences of
+    messages hash the same input. Integers are absorbed as minimal big-endian
+    bytes and points in their compressed SEC1 encoding (see
+    EllipticCurve.encode_point). The transcript starts with a domain
+    separation label, usually the name of the protocol.
+    """
+
+    hashes = {
+        "sha256": hashlib.sha256,
+        "sha512": hashlib.sha512,
+        "md5": hashlib.md5,
+        "sha1": hashlib.sha1,
+        "sha224": hashlib.sha224,
+        "sha384": hashlib.sha384,
+    }
+
+    def __init__(self, label, hash_function='sha256', curve=None):
+        """
+        :param label: Domain separation label, bytes or str.
+        :param hash_function: Name of the hash function, a key of hashes.
+        :param curve: The curve the points of append_points lie on.
+        """
+        if hash_function not in self.hashes:
+            raise ValueError(f'Unsupported hash function: {hash_function}')
+        self._hash = self.hashes[hash_function]()
+        self.curve = curve
+        self.append_message(b'domain', label.encode() if isinstance(label, str) else label)
+
+    def append_message(self, label, data):
+        """Absorbs data (bytes) under label."""
+        self._hash.update(_frame(label) + len(data).to_bytes(4, 'big') + data)
+        return self
+
+    def append_ints(self, label, values):
+        """Absorbs the non-negative integers values under label."""
+        label = _frame(label)
+        messages = []
+        for value in values:
+            data = int(value).to_bytes((value.bit_length() + 7) // 8, 'big')
+            messages.append(label + len(data).to_bytes(4, 'big') + data)
+        self._hash.update(b''.join(messages))
+        return self
+
+    def append_points(self, label, points):
+        """Absorbs points of the transcript's curve under label."""
+        label = _frame(label)
+        encode_point = self.curve.encode_point
+        messages = []
+        for point in points:
+            data = encode_point(point)
+            messages.append(label + len(data).to_bytes(4, 'big') + data)
+        self._hash.update(b''.join(messages))
+        return self
+
+    def copy(self):
+        """Returns an independent transcript with the same state, cheaper
+        than absorbing the same messages again."""
+        transcript = Transcript.__new__(Transcript)
+        transcript._hash = self._hash.copy()
+        transcript.curve = self.curve
+        return transcript
+
+    def challenge(self, label, order, bits=None):
+        """
+        Returns a challenge in [0, order) derived from the transcript. The
+        label is absorbed first and the digest after, so the next challenge
+        of the same transcript differs.
+
+        With bits the challenge is the top bits of the digest, a shorter
+        challenge makes the c * P terms of the verification cheaper. A
+        cheating prover succeeds with probability 2^-bits, so 128 bits match
+        the 128-bit security of secp256r1 and 3072-bit groups.
+        """
+        self.append_message(label, b'')
+        digest = self._hash.digest()
+        self.append_message(b'challenge', digest)
+        c = int.from_bytes(digest, 'big')
+        if bits is not None:
+            if not 0 < bits <= 8 * len(digest):
+                raise ValueError(f'Invalid challenge length: {bits}')
+            c >>= 8 * len(digest) - bits
+        return c % order
+
+
+def _frame(label):
+    """Returns the length prefixed label, label is bytes or str."""
+    if isinstance(label, str):
+        label = label.encode()
+    return len(label).to_bytes(4, 'big') + label
@@ -1,22 +1,62 @@
-import hashlib
+from functools import lru_cache
+from .transcript import Transcript
+
+
+@lru_cache(maxsize=256)
+def _statement_transcript(label, hash_function, statement):
+    return Transcript(label, hash_function).append_ints(b'statement', statement)
+
+
+@lru_cache(maxsize=256)
+def _statement_transcript_ecc(label, curve, hash_function, statement):
+    return Transcript(label, hash_function, curve).append_points(b'statement', statement)
+
 
 class Base():
     supported_hash_name = "sha256"
-    hashes = {
-        "sha256": hashlib.sha256,
-        "sha512": hashlib.sha512,
-        "md5": hashlib.md5,
-        "sha1": hashlib.sha1,
-        "sha224": hashlib.sha224,
-        "sha384": hashlib.sha384,
-    }
+    hashes = Transcript.hashes
+    # challenge length in bits, None for the full digest (see Transcript.challenge)
+    challenge_bits = None
+
     def __init__(self):
         pass
-    
-    def _hash(self, itmes):
-        s_ = ''
-        h = self.hashes[self.supported_hash_name]()
-        for item in itmes:      
-            s_ += str(item)
-        h.update(s_.encode())
-        return int(h.hexdigest(), 16)
\ No newline at end of file
+
+    def _challenge(self, statement, commitments, order):
+        """
+        Returns the Fiat-Shamir challenge in [0, order) for the public
+        statement and the prover's commitments, integers modulo p. The
+        class name separates the domains of the protocols.
+
+        The transcript after the statement is cached, proofs of a statement
+        seen before start from a copy of the hash state.
+        """
+        transcript = _statement_transcript(
+            type(self).__name__, self.supported_hash_name, tuple(statement)).copy()
+        transcript.append_ints(b'commitment', commitments)
+        return transcript.challenge(b'challenge', order, self.challenge_bits)
+
+
+class BaseEcc():
+    """
+    Fiat-Shamir challenges of the protocols over the class attribute curve.
+    """
+
+    # challenge length in bits, None for the full digest (see Transcript.challenge).
+    # Protocols that fold two equations with a random weight w (conjunction,
+    # disjunction, DLEQ, Pedersen equality) still multiply the second
+    # challenge term by w * c, a full length scalar, so only the first term
+    # gets shorter. Refolding as c * (P + w * Q) costs an extra multiplication
+    # and is slower.
+    challenge_bits = None
+
+    @classmethod
+    def _challenge(cls, statement, commitments):
+        """
+        Returns the challenge modulo the curve order for the public statement
+        and the prover's commitments, points of cls.curve. The statement
+        prefix is cached as in Base._challenge.
+        """
+        transcript = _statement_transcript_ecc(
+            cls.__name__, cls.curve, cls.curve.hash_function, tuple(statement)).copy()
+        transcript.append_points(b'commitment', commitments)
+        return transcript.challenge(b'challenge', cls.curve.order, cls.challenge_bits)
\ No newline at end of file
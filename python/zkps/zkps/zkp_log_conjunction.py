@@ -1,7 +1,9 @@
 import random
 from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
 
     
 class DiscreteLogConjunctionInteractive(ZeroKnowledgeProtocol):
@@ -12,7 +14,7 @@ class DiscreteLogConjunctionInteractive(ZeroKnowledgeProtocol):
         :param g, h: Generators of the group.
         :param P, Q: Public values such that P = g^a and Q = h^b.
         :param a, b: Secret values.
-        :param p: Prime modulus (optional for large groups).
+        :param p: Prime modulus, or a SchnorrGroup (exponents modulo its order q).
         """
         self._g = g
         self._h = h
@@ -20,7 +22,11 @@ class DiscreteLogConjunctionInteractive(ZeroKnowledgeProtocol):
         self._Q = Q
         self._a = a
         self._b = b
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h, P, Q]):
+            raise ValueError('The public values must lie in the group')
         self._random = random.SystemRandom()
 
     def commitment(self):
@@ -29,12 +35,12 @@ class DiscreteLogConjunctionInteractive(ZeroKnowledgeProtocol):
         :return: Tuple of commitments (g^r1, h^r2).
         """
         self._r1 = self._random.randint(
-            0, self._p - 1)
+            0, self._q - 1)
         self._r2 = self._random.randint(
-            0, self._p - 1)
-        commitment1 = pow(self._g, self._r1, self._p) if self._p else pow(
+            0, self._q - 1)
+        commitment1 = powmod(self._g, self._r1, self._p) if self._p else pow(
             self._g, self._r1)
-        commitment2 = pow(self._h, self._r2, self._p) if self._p else pow(
+        commitment2 = powmod(self._h, self._r2, self._p) if self._p else pow(
             self._h, self._r2)
         return commitment1, commitment2
 
@@ -43,8 +49,7 @@ class DiscreteLogConjunctionInteractive(ZeroKnowledgeProtocol):
         Generates a challenge by the verifier.
         :return: Challenge (random integer).
         """
-        self._challenge = self._random.randint(
-            1, self._p - 1)
+        self._challenge = self._group.get_challenge(self.challenge_bits)
         return self._challenge
 
     def response(self):
@@ -54,21 +59,21 @@ class DiscreteLogConjunctionInteractive(ZeroKnowledgeProtocol):
         :return: Tuple of responses (s1, s2).
         """
         s1 = (self._r1 + self._challenge *
-              self._a) % (self._p - 1)
+              self._a) % self._q
 
-        s2 = (self._r2 + self._challenge * self._b) % (self._p - 1)
+        s2 = (self._r2 + self._challenge * self._b) % self._q
         return s1, s2
 
     def verify(self, commitment1, commitment2, response1, response2, challange):
         """
         Verifies the responses from the prover.
         """
-        lhs1 = pow(self._g, response1, self._p) if self._p else pow(
+        lhs1 = powmod(self._g, response1, self._p) if self._p else pow(
             self._g, response1)
-        lhs2 = pow(self._h, response2, self._p) if self._p else pow(
+        lhs2 = powmod(self._h, response2, self._p) if self._p else pow(
             self._h, response2)
-        rhs1 = (commitment1 * pow(self._P, challange, self._p)) % self._p
-        rhs2 = (commitment2 * pow(self._Q, challange, self._p)) % self._p
+        rhs1 = (commitment1 * powmod(self._P, challange, self._p)) % self._p
+        rhs2 = (commitment2 * powmod(self._Q, challange, self._p)) % self._p
         assert lhs1 == rhs1 and lhs2 == rhs2
 
 
@@ -79,30 +84,40 @@ class DiscreteLogConjunction(ZeroKnowledgeProtocolNonInteractive, Base):
         Initialize the protocol parameters.
         :param g, h: Generators of the group.
         :param P, Q: Public values such that P = g^a and Q = h^b.
-        :param p: Prime modulus.
+        :param p: Prime modulus, or a SchnorrGroup (exponents modulo its order q).
         :param x: Secret value.
         """
         self._g = g
         self._h = h
         self._P = P
         self._Q = Q
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h, P, Q]):
+            raise ValueError('The public values must lie in the group')
         self._x = x
         self._y = y
         self._random = random.SystemRandom()
 
-    def response(self):
-        r1 = self._random.randint(0, self._p - 1)
-        r2 = self._random.randint(0, self._p - 1)
+    def response(self, compact=False):
+        """
+        :param compact: return (c, s1, s2) instead of (t1, s1), (t2, s2),
+            see verify_compact.
+        """
+        r1 = self._random.randint(0, self._q - 1)
+        r2 = self._random.randint(0, self._q - 1)
 
-        t1 = pow(self._g, r1, self._p)
-        t2 = pow(self._h, r2, self._p)
+        t1 = powmod(self._g, r1, self._p)
+        t2 = powmod(self._h, r2, self._p)
 
-        c = self._hash([self._g, self._h, self._P, self._Q, t1, t2]) % self._p
+        c = self._challenge([self._g, self._h, self._P, self._Q], [t1, t2], self._q)
         
-        s1 = (r1 + c * self._x) % (self._p - 1)
-        s2 = (r2 + c * self._y) % (self._p - 1)
+        s1 = (r1 + c * self._x) % self._q
+        s2 = (r2 + c * self._y) % self._q
 
+        if compact:
+            return c, s1, s2
         return (t1, s1), (t2, s2)
 
     def verify(self, t1cs1, t2cs2):
@@ -110,19 +125,30 @@ class DiscreteLogConjunction(ZeroKnowledgeProtocolNonInteractive, Base):
         (t1, s1) = t1cs1
         (t2, s2) = t2cs2
 
-        c = self._hash([self._g, self._h, self._P, self._Q, t1, t2]) % self._p
+        c = self._challenge([self._g, self._h, self._P, self._Q], [t1, t2], self._q)
         
-        lhs1 = pow(self._g, s1, self._p)
-        rhs1 = (t1 * pow(self._P, c, self._p)) % self._p
+        lhs1 = powmod(self._g, s1, self._p)
+        rhs1 = (t1 * powmod(self._P, c, self._p)) % self._p
 
-        lhs2 = pow(self._h, s2, self._p)
-        rhs2 = (t2 * pow(self._Q, c, self._p)) % self._p
+        lhs2 = powmod(self._h, s2, self._p)
+        rhs2 = (t2 * powmod(self._Q, c, self._p)) % self._p
 
         assert lhs1 == rhs1
         assert lhs2 == rhs2
 
+    def verify_compact(self, c, s1, s2):
+        """
+        Verifies a proof (c, s1, s2) returned by response(compact=True), the
+        commitments t1 = g^s1 * P^-c and t2 = h^s2 * Q^-c are recomputed and
+        must hash to c.
+        """
+        t1 = (powmod(self._g, s1, self._p) * powmod(self._P, -c, self._p)) % self._p
+        t2 = (powmod(self._h, s2, self._p) * powmod(self._Q, -c, self._p)) % self._p
+
+        assert c == self._challenge([self._g, self._h, self._P, self._Q], [t1, t2], self._q)
 
-class DiscreteLogConjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
+
+class DiscreteLogConjunctionEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
 
     curve = get_curve('secp256r1')
 
@@ -132,7 +158,7 @@ class DiscreteLogConjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
             self._x = x
             self._y = y
 
-    def response(self, g, h, P, Q):
+    def response(self, g, h, P, Q, compact=False):
         """
         Calculates the response for the given parameters.
         Args:
@@ -140,16 +166,20 @@ class DiscreteLogConjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
             h (Point): Another point on the curve.
             P (Point): A point on the curve.
             Q (Point): Another point on the curve.
+            compact (bool): return (c, s1, s2) instead, see verify_compact.
         Returns:
             Tuple[Point, Point, int]: A tuple containing the calculated points t1 and t2, and the calculated integer s.
         """
+        assert DiscreteLogConjunctionEcc.curve.validate_points([g, h, P, Q])
         r1 = DiscreteLogConjunctionEcc.curve.get_random()
         r2 = DiscreteLogConjunctionEcc.curve.get_random()
-        t1 = DiscreteLogConjunctionEcc.curve.mult_point(r1, g)
-        t2 = DiscreteLogConjunctionEcc.curve.mult_point(r2, h)
-        c = DiscreteLogConjunctionEcc.curve.hash_points([g, h, P, Q, t1, t2])
+        t1, t2 = DiscreteLogConjunctionEcc.curve.multi_mult_batch(
+            [[(r1, g)], [(r2, h)]], validate=False)
+        c = DiscreteLogConjunctionEcc._challenge([g, h, P, Q], [t1, t2])
         s1 = ((r1 + c * self._x) % DiscreteLogConjunctionEcc.curve.order)
         s2 = ((r2 + c * self._y) % DiscreteLogConjunctionEcc.curve.order)
+        if compact:
+            return c, s1, s2
         return (t1, s1), (t2, s2)
 
     def verify(self, g, h, P, Q, t1s1, t2s2):
@@ -166,11 +196,23 @@ class DiscreteLogConjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
         """
         (t1, s1) = t1s1
         (t2, s2) = t2s2
-        c = DiscreteLogConjunctionEcc.curve.hash_points([g, h, P, Q, t1, t2])
-        lhs1 = DiscreteLogConjunctionEcc.curve.mult_point(s1, g)
-        rhs1 = DiscreteLogConjunctionEcc.curve.point_add(
-            t1, DiscreteLogConjunctionEcc.curve.mult_point(c, P))
-        lhs2 = DiscreteLogConjunctionEcc.curve.mult_point(s2, h)
-        rhs2 = DiscreteLogConjunctionEcc.curve.point_add(
-            t2, DiscreteLogConjunctionEcc.curve.mult_point(c, Q))
-        assert (lhs1 == rhs1) and (lhs2 == rhs2)
+        assert DiscreteLogConjunctionEcc.curve.validate_points([g, h, P, Q, t1, t2])
+        c = DiscreteLogConjunctionEcc._challenge([g, h, P, Q], [t1, t2])
+        # s1 * g - c * P - t1 + w * (s2 * h - c * Q - t2) == 0 for a random w
+        w = DiscreteLogConjunctionEcc.curve.get_random_weight()
+        assert DiscreteLogConjunctionEcc.curve.multi_mult_is_infinity(
+            [(s1, g), (-c, P), (-1, t1), (w * s2, h), (-w * c, Q), (-w, t2)], validate=False)
+
+    def verify_compact(self, g, h, P, Q, c, s1, s2):
+        """
+        Verify a proof (c, s1, s2) returned by response(compact=True).
+
+        The commitments t1 = s1 * g - c * P and t2 = s2 * h - c * Q are
+        recomputed with one inversion for both and must hash to c.
+        Raises:
+            AssertionError: If the proof is invalid.
+        """
+        assert DiscreteLogConjunctionEcc.curve.validate_points([g, h, P, Q])
+        t1, t2 = DiscreteLogConjunctionEcc.curve.multi_mult_batch(
+            [[(s1, g), (-c, P)], [(s2, h), (-c, Q)]], validate=False)
+        assert c == DiscreteLogConjunctionEcc._challenge([g, h, P, Q], [t1, t2])
@@ -1,7 +1,10 @@
 import random
 from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
+from .batch import ecc_failing_indices, modp_failing_indices
 
 class DiscreteLogInteractive(ZeroKnowledgeProtocol):
 
@@ -9,12 +12,16 @@ class DiscreteLogInteractive(ZeroKnowledgeProtocol):
         """
         :param g: generator
         :param y: public key
-        :param p: modulo
+        :param p: modulo, or a SchnorrGroup (exponents modulo its order q)
         :param x: secret
         """
         self._g = g
         self._y = y
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, y]):
+            raise ValueError('The public values must lie in the group')
         self._x = x
         self._random = random.SystemRandom()
 
@@ -22,32 +29,32 @@ class DiscreteLogInteractive(ZeroKnowledgeProtocol):
         """
         :return: commitment (g^r mod p)
         """
-        self._r = self._random.randint(0, self._p - 1)
-        commitment = pow(self._g, self._r, self._p)
+        self._r = self._random.randint(0, self._q - 1)
+        commitment = powmod(self._g, self._r, self._p)
         return commitment
 
     def challenge(self):
         """        
-        :return: challenge (x * c + r mod p - 1)
+        :return: challenge (x * c + r mod q)
         """
-        self._challenge = self._random.randint(1, self._p - 1)
+        self._challenge = self._group.get_challenge(self.challenge_bits)
         return self._challenge
 
     def response(self, challenge):
         """
         :param challenge: The challenge generated by the verifier
 
-        :return: response (x * c + r mod p - 1)
+        :return: response (x * c + r mod q)
         """
-        return (self._x * challenge + self._r) % (self._p - 1)
+        return (self._x * challenge + self._r) % self._q
 
     def verify(self, response, commitment):
         """
         :param response: The response generated by the prover
         :param commitment: The commitment generated by the prover
         """
-        assert pow(self._g, response, self._p) == (
-            pow(self._y, self._challenge) * commitment) % self._p
+        assert powmod(self._g, response, self._p) == (
+            powmod(self._y, self._challenge, self._p) * commitment) % self._p
 
 
 class DiscreteLog(ZeroKnowledgeProtocolNonInteractive, Base):
@@ -59,26 +66,35 @@ class DiscreteLog(ZeroKnowledgeProtocolNonInteractive, Base):
         """
         :param g: generator
         :param y: public key
-        :param p: modulo
+        :param p: modulo, or a SchnorrGroup (exponents modulo its order q)
         :param x: secret
         """
         self._g = g
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, y]):
+            raise ValueError('The public values must lie in the group')
         self._y = y
         self._x = x
         self._random = random.SystemRandom()
 
-    def response(self):
+    def response(self, compact=False):
         """
         Calculate the response value based on the current state of the object.
+        Parameters:
+            compact (bool): return (c, s) instead of (t, s), see verify_compact.
         Returns:
             int: The calculated response value.
         """
-        self._v = self._random.randint(0, self._p - 1)
-        t = pow(self._g, self._v, self._p)
-        self._c = self._hash([self._g, self._y, t])
+        self._v = self._random.randint(0, self._q - 1)
+        t = powmod(self._g, self._v, self._p)
+        self._c = self._challenge([self._g, self._y], [t], self._q)
         print(f"c: {self._c}")
-        return t, (self._v - self._c * self._x) % (self._p - 1)
+        s = (self._v - self._c * self._x) % self._q
+        if compact:
+            return self._c, s
+        return t, s
 
     def verify(self, s, t):
         """
@@ -92,12 +108,54 @@ class DiscreteLog(ZeroKnowledgeProtocolNonInteractive, Base):
         Raises:
             AssertionError: If the signature is invalid.
         """        
-        c = self._hash([self._g, self._y, t])
-        check = (pow(self._g, s, self._p) * pow(self._y, c, self._p)) % self._p
+        c = self._challenge([self._g, self._y], [t], self._q)
+        check = (powmod(self._g, s, self._p) * powmod(self._y, c, self._p)) % self._p
         assert t == check
 
+    def verify_compact(self, c, s):
+        """
+        Verify a proof (c, s) returned by response(compact=True). The
+        commitment t = g^s * y^c is recomputed and must hash to c.
+        Raises:
+            AssertionError: If the proof is invalid.
+        """
+        t = (powmod(self._g, s, self._p) * powmod(self._y, c, self._p)) % self._p
+        assert c == self._challenge([self._g, self._y], [t], self._q)
+
+    def verify_batch(self, proofs, weight_bits=128):
+        """
+        Verify many proofs at once with small random exponents.
+
+        Every equation g^s * y^c == t is raised to a random weight w of
+        weight_bits bits and the results are multiplied:
+
+            g^(sum w * s) * prod over y of y^(sum w * c) == prod t^w
 
-class DiscreteLogEcc(ZeroKnowledgeProtocolNonInteractive):
+        so a batch costs one full exponentiation of g, one per distinct y
+        and a weight_bits exponentiation per proof. A forged proof passes
+        with probability 2^-weight_bits when g, y and t lie in a subgroup of
+        prime order, in Z_p^* a factor of small order in t can go unnoticed.
+        If the check fails the failing proofs are found by bisection.
+
+        Args:
+            proofs: A list of (t, s) tuples as returned by response, or
+                (t, s, y) for proofs of another public key y under the same
+                g and p.
+            weight_bits: Bit length of the random exponents.
+
+        Returns:
+            list: The indices of the invalid proofs, empty if all are valid.
+        """
+        def equations(proof):
+            t, s = proof[:2]
+            y = proof[2] if len(proof) > 2 else self._y
+            c = self._challenge([self._g, y], [t], self._q)
+            return [([(s, self._g), (c, y)], [t])]
+
+        return modp_failing_indices(self._p, proofs, equations, weight_bits, self._q)
+
+
+class DiscreteLogEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
 
     curve = get_curve('secp256r1')
 
@@ -114,20 +172,25 @@ class DiscreteLogEcc(ZeroKnowledgeProtocolNonInteractive):
             DiscreteLogEcc.y = DiscreteLogEcc.curve.mult_point(
                 x, DiscreteLogEcc.curve.g)
 
-    def response(self):
+    def response(self, compact=False):
         """
         Generate a response using the DiscreteLogNonInteractiveEcc algorithm.
 
+        Args:
+            compact: return the two scalars (c, s) instead of (t, s), see
+                verify_compact.
+
         Returns:
             tuple: A tuple containing the calculated values t and s.
                 - t (Point): The calculated point t.
                 - s (int): The calculated value s.
         """
         r = DiscreteLogEcc.curve.get_random()
-        t = DiscreteLogEcc.curve.mult_point(r, DiscreteLogEcc.curve.g)
-        c = DiscreteLogEcc.curve.hash_points(
-            [DiscreteLogEcc.curve.g, DiscreteLogEcc.y, t])
+        t = DiscreteLogEcc.curve.mult_point(r, DiscreteLogEcc.curve.g, validate=False)
+        c = DiscreteLogEcc._challenge([DiscreteLogEcc.curve.g, DiscreteLogEcc.y], [t])
         s = ((r + c * self._x) % DiscreteLogEcc.curve.order)
+        if compact:
+            return c, s
         return t, s
 
     def verify(self, s, t):
@@ -144,9 +207,50 @@ class DiscreteLogEcc(ZeroKnowledgeProtocolNonInteractive):
         Raises:
             AssertionError: If the verification fails (i.e., the values are not equal).
         """
-        c = DiscreteLogEcc.curve.hash_points(
-            [DiscreteLogEcc.curve.g, DiscreteLogEcc.y, t])
-        lhs = DiscreteLogEcc.curve.mult_point(s, DiscreteLogEcc.curve.g)
-        yc = DiscreteLogEcc.curve.mult_point(c, DiscreteLogEcc.y)
-        rhs = DiscreteLogEcc.curve.point_add(t, yc)
-        assert lhs == rhs
+        assert DiscreteLogEcc.curve.validate_points([DiscreteLogEcc.y, t])
+        c = DiscreteLogEcc._challenge([DiscreteLogEcc.curve.g, DiscreteLogEcc.y], [t])
+        # s * G - c * Y == t
+        assert DiscreteLogEcc.curve.multi_mult_equals(
+            [(s, DiscreteLogEcc.curve.g), (-c, DiscreteLogEcc.y)], t, validate=False)
+
+    def verify_compact(self, c, s):
+        """
+        Verify a proof (c, s) returned by response(compact=True).
+
+        The commitment t = s * G - c * Y is recomputed and must hash to c,
+        the proof is two scalars instead of a point and a scalar.
+
+        Raises:
+            AssertionError: If the verification fails.
+        """
+        assert DiscreteLogEcc.curve.validate_points([DiscreteLogEcc.y])
+        t = DiscreteLogEcc.curve.multi_mult(
+            [(s, DiscreteLogEcc.curve.g), (-c, DiscreteLogEcc.y)], validate=False)
+        assert c == DiscreteLogEcc._challenge([DiscreteLogEcc.curve.g, DiscreteLogEcc.y], [t])
+
+    def verify_batch(self, proofs):
+        """
+        Verify many proofs (t, s) of the same y at once.
+
+        Every equation s * G - c * Y - t == 0 is multiplied by a random
+        128-bit weight w and the weighted sum is checked with one multi-scalar
+        multiplication, the G and Y terms of all proofs merge into one each
+        (see batch.ecc_failing_indices).
+        A forged proof passes with probability at most 2^-128. If the sum is
+        not zero the failing proofs are found by bisection.
+
+        Args:
+            proofs: A list of (t, s) tuples as returned by response.
+
+        Returns:
+            list: The indices of the invalid proofs, empty if all are valid.
+        """
+        curve = DiscreteLogEcc.curve
+        y = DiscreteLogEcc.y
+
+        def equations(proof):
+            t, s = proof
+            c = DiscreteLogEcc._challenge([curve.g, y], [t])
+            return [[(s, curve.g), (-c, y), (-1, t)]]
+
+        return ecc_failing_indices(curve, proofs, lambda proof: [y, proof[0]], equations)
@@ -1,7 +1,10 @@
 import random
 from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
+from .batch import ecc_failing_indices, modp_failing_indices
 
 class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
     def __init__(self, g, h, P, Q, p, x=None):
@@ -12,7 +15,7 @@ class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
         :param h: Base h, used in the disjunction.
         :param P: Public value g^a mod p.
         :param Q: Public value h^b mod p.
-        :param p: Prime modulus.
+        :param p: Prime modulus, or a SchnorrGroup (exponents modulo its order q).
         :param x: The secret (either a or b).
         :param knows: Indicates whether the prover knows 'a' or 'b'.
         """
@@ -20,7 +23,11 @@ class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
         self._h = h
         self._P = P
         self._Q = Q
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h, P, Q]):
+            raise ValueError('The public values must lie in the group')
         self._x = x
         self._random = random.SystemRandom()
 
@@ -30,7 +37,7 @@ class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
 
         :return: A random challenge c.
         """
-        self._c = self._random.randint(1, self._p - 1)
+        self._c = self._group.get_challenge(self.challenge_bits)
         return self._c
 
     def commitment(self):
@@ -39,12 +46,12 @@ class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
 
         This function does not take any parameters and returns a tuple of two integers representing the commitment values.
         """
-        self._r1 = self._random.randint(0, self._p - 1)
-        self._s2 = self._random.randint(0, self._p - 1)
-        self._c2 = self._random.randint(0, self._p - 1)
-        t1 = pow(self._g, self._r1, self._p)
+        self._r1 = self._random.randint(0, self._q - 1)
+        self._s2 = self._random.randint(0, self._q - 1)
+        self._c2 = self._random.randint(0, self._q - 1)
+        t1 = powmod(self._g, self._r1, self._p)
 
-        t2 = (pow(self._h, self._s2, self._p) * pow(self._Q, - self._c2, self._p)) % self._p
+        t2 = (powmod(self._h, self._s2, self._p) * powmod(self._Q, - self._c2, self._p)) % self._p
         return (t1, t2)
         
     def response(self, c):
@@ -60,8 +67,8 @@ class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
                 - Tuple of (self._c2, self._s2) values.
 
         """
-        c1 = (c - self._c2) % self._p
-        s1 = (self._r1 + c1 * self._x) % (self._p - 1)
+        c1 = (c - self._c2) % self._q
+        s1 = (self._r1 + c1 * self._x) % self._q
 
         return (c1, s1), (self._c2, self._s2)
 
@@ -73,19 +80,20 @@ class DiscreteLogDisjunctionInteractive(ZeroKnowledgeProtocol):
         :param t1c1s1: The first tuple of proof components.
         :param t2c2s2: The second tuple of proof components.
         """
+        assert self._group.validate_elements([g, h, P, Q])
         (c1, s1) = c1s1
         (c2, s2) = c2s2
 
         # Ensure the total challenge c equals the sum of c1 and c2.
-        assert (self._c == (c1 + c2) % self._p), "Challenge mismatch"
+        assert (self._c == (c1 + c2) % self._q), "Challenge mismatch"
 
         # Verify the first proof.
-        lhs1 = pow(g, s1, self._p)
-        rhs1 = (t1 * pow(P, c1, self._p)) % self._p
+        lhs1 = powmod(g, s1, self._p)
+        rhs1 = (t1 * powmod(P, c1, self._p)) % self._p
 
         # Verify the second proof.
-        lhs2 = pow(h, s2, self._p)
-        rhs2 = (t2 * pow(Q, c2, self._p)) % self._p
+        lhs2 = powmod(h, s2, self._p)
+        rhs2 = (t2 * powmod(Q, c2, self._p)) % self._p
         assert lhs2 == rhs2 and lhs1 == rhs1
 
 
@@ -96,52 +104,104 @@ class DiscreteLogDisjunction(ZeroKnowledgeProtocolNonInteractive, Base):
         Initialize the protocol parameters.
         :param g, h: Generators of the group.
         :param P, Q: Public values such that P = g^a and Q = h^b.
-        :param p: Prime modulus.
+        :param p: Prime modulus, or a SchnorrGroup (exponents modulo its order q).
         :param x: Secret value.
         """
         self._g = g
         self._h = h
         self._P = P
         self._Q = Q
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h, P, Q]):
+            raise ValueError('The public values must lie in the group')
         self._x = x
         self._random = random.SystemRandom()
 
-    def response(self):
-        r1 = self._random.randint(0, self._p - 1)
-        c2 = self._random.randint(0, self._p - 1)
-        s2 = self._random.randint(0, self._p - 1)
+    def response(self, compact=False):
+        """
+        :param compact: leave out the commitments and return (c1, s1),
+            (c2, s2) as the interactive protocol does, see verify_compact.
+        """
+        r1 = self._random.randint(0, self._q - 1)
+        c2 = self._random.randint(0, self._q - 1)
+        s2 = self._random.randint(0, self._q - 1)
 
-        t1 = pow(self._g, r1, self._p)
-        t2 = (pow(self._h, s2, self._p) *
-              pow(self._Q, (0 - c2), self._p)) % self._p
+        t1 = powmod(self._g, r1, self._p)
+        t2 = (powmod(self._h, s2, self._p) *
+              powmod(self._Q, (0 - c2), self._p)) % self._p
         
-        c = self._hash([self._g, self._h, self._P, self._Q, t1, t2]) % self._p
+        c = self._challenge([self._g, self._h, self._P, self._Q], [t1, t2], self._q)
 
-        c1 = (c - c2) % self._p
+        c1 = (c - c2) % self._q
 
-        s1 = (r1 + c1 * self._x) % (self._p - 1)
+        s1 = (r1 + c1 * self._x) % self._q
 
+        if compact:
+            return (c1, s1), (c2, s2)
         return (t1, c1, s1), (t2, c2, s2)
 
     def verify(self, g, h, P, Q, t1c1s1, t2c2s2):
+        assert self._group.validate_elements([g, h, P, Q])
         (t1, c1, s1) = t1c1s1
         (t2, c2, s2) = t2c2s2
         
-        c = self._hash([g, h, P, Q, t1, t2]) % self._p
+        c = self._challenge([g, h, P, Q], [t1, t2], self._q)
 
-        assert (c == (c1 + c2) % self._p)
+        assert (c == (c1 + c2) % self._q)
 
-        lhs1 = pow(g, s1, self._p)
-        rhs1 = (t1 * pow(P, c1, self._p)) % self._p
+        lhs1 = powmod(g, s1, self._p)
+        rhs1 = (t1 * powmod(P, c1, self._p)) % self._p
 
-        lhs2 = pow(h, s2, self._p)
-        rhs2 = (t2 * pow(Q, c2, self._p)) % self._p
+        lhs2 = powmod(h, s2, self._p)
+        rhs2 = (t2 * powmod(Q, c2, self._p)) % self._p
 
         assert lhs1 == rhs1 and lhs2 == rhs2
 
+    def verify_compact(self, g, h, P, Q, c1s1, c2s2):
+        """
+        Verifies a proof (c1, s1), (c2, s2) returned by
+        response(compact=True). The commitments t1 = g^s1 * P^-c1 and
+        t2 = h^s2 * Q^-c2 are recomputed and c1 + c2 must equal their hash.
+        """
+        assert self._group.validate_elements([g, h, P, Q])
+        (c1, s1) = c1s1
+        (c2, s2) = c2s2
+
+        t1 = (powmod(g, s1, self._p) * powmod(P, -c1, self._p)) % self._p
+        t2 = (powmod(h, s2, self._p) * powmod(Q, -c2, self._p)) % self._p
+
+        c = self._challenge([g, h, P, Q], [t1, t2], self._q)
+        assert c == (c1 + c2) % self._q
+
+    def verify_batch(self, proofs, weight_bits=128):
+        """
+        Verify many OR-proofs at once.
+
+        The challenge split c == c1 + c2 is checked per proof from the hash
+        alone, the branch equations g^s1 == t1 * P^c1 and h^s2 == t2 * Q^c2
+        of all proofs are then checked together with small random exponents
+        (see batch.modp_failing_indices), which costs one full
+        exponentiation per distinct g, h, P and Q.
+
+        :param proofs: A list of (g, h, P, Q, t1c1s1, t2c2s2) tuples, the
+            arguments of verify.
+        :param weight_bits: Bit length of the random exponents.
+        :return: The indices of the invalid proofs, empty if all are valid.
+        """
+        def equations(proof):
+            g, h, P, Q, (t1, c1, s1), (t2, c2, s2) = proof
+            c = self._challenge([g, h, P, Q], [t1, t2], self._q)
+            if c != (c1 + c2) % self._q:
+                return None
+            return [([(s1, g), (-c1, P)], [t1]),
+                    ([(s2, h), (-c2, Q)], [t2])]
+
+        return modp_failing_indices(self._p, proofs, equations, weight_bits, self._q)
 
-class DiscreteLogDisjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
+
+class DiscreteLogDisjunctionEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
 
     curve = get_curve('secp256r1')
 
@@ -149,19 +209,20 @@ class DiscreteLogDisjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
         if x:
             self._x = x
 
-    def response(self, g, h, P, Q):
-
+    def response(self, g, h, P, Q, compact=False):
+        assert DiscreteLogDisjunctionEcc.curve.validate_points([g, h, P, Q])
         r1 = DiscreteLogDisjunctionEcc.curve.get_random()
         c2 = DiscreteLogDisjunctionEcc.curve.get_random()
         s2 = DiscreteLogDisjunctionEcc.curve.get_random()
 
-        t1 = DiscreteLogDisjunctionEcc.curve.mult_point(r1, g)
-        t2 = DiscreteLogDisjunctionEcc.curve.point_add(DiscreteLogDisjunctionEcc.curve.mult_point(
-            s2, h), DiscreteLogDisjunctionEcc.curve.mult_point((0-c2) % DiscreteLogDisjunctionEcc.curve.order, Q))
-        c = DiscreteLogDisjunctionEcc.curve.hash_points([g, h, P, Q, t1, t2])
+        t1, t2 = DiscreteLogDisjunctionEcc.curve.multi_mult_batch(
+            [[(r1, g)], [(s2, h), ((0-c2) % DiscreteLogDisjunctionEcc.curve.order, Q)]], validate=False)
+        c = DiscreteLogDisjunctionEcc._challenge([g, h, P, Q], [t1, t2])
         c1 = (c - c2) % DiscreteLogDisjunctionEcc.curve.order
         s1 = ((r1 + c1 * self._x) %
               DiscreteLogDisjunctionEcc.curve.order) % DiscreteLogDisjunctionEcc.curve.order
+        if compact:
+            return (c1, s1), (c2, s2)
         return (t1, c1, s1), (t2, c2, s2)
 
     def verify(self, g, h, P, Q, t1cs1, t2cs2):
@@ -178,12 +239,59 @@ class DiscreteLogDisjunctionEcc(ZeroKnowledgeProtocolNonInteractive):
         """
         (t1, c1, s1) = t1cs1
         (t2, c2, s2) = t2cs2
-        c = DiscreteLogDisjunctionEcc.curve.hash_points([g, h, P, Q, t1, t2])
+        assert DiscreteLogDisjunctionEcc.curve.validate_points([g, h, P, Q, t1, t2])
+        c = DiscreteLogDisjunctionEcc._challenge([g, h, P, Q], [t1, t2])
         assert (c == (c1 + c2) % DiscreteLogDisjunctionEcc.curve.order)
-        lhs1 = DiscreteLogDisjunctionEcc.curve.mult_point(s1, g)
-        rhs1 = DiscreteLogDisjunctionEcc.curve.point_add(
-            t1, DiscreteLogDisjunctionEcc.curve.mult_point(c1, P))
-        lhs2 = DiscreteLogDisjunctionEcc.curve.mult_point(s2, h)
-        rhs2 = DiscreteLogDisjunctionEcc.curve.point_add(
-            t2, DiscreteLogDisjunctionEcc.curve.mult_point(c2, Q))
-        assert (lhs1 == rhs1) and (lhs2 == rhs2)
+        # s1 * g - c1 * P - t1 + w * (s2 * h - c2 * Q - t2) == 0 for a random w
+        w = DiscreteLogDisjunctionEcc.curve.get_random_weight()
+        assert DiscreteLogDisjunctionEcc.curve.multi_mult_is_infinity(
+            [(s1, g), (-c1, P), (-1, t1), (w * s2, h), (-w * c2, Q), (-w, t2)], validate=False)
+
+    def verify_compact(self, g, h, P, Q, c1s1, c2s2):
+        """
+        Verify a proof (c1, s1), (c2, s2) returned by response(compact=True).
+
+        The commitments t1 = s1 * g - c1 * P and t2 = s2 * h - c2 * Q are
+        recomputed and c1 + c2 must equal their hash.
+        Raises:
+            AssertionError: If the proof is invalid.
+        """
+        (c1, s1) = c1s1
+        (c2, s2) = c2s2
+        assert DiscreteLogDisjunctionEcc.curve.validate_points([g, h, P, Q])
+        t1, t2 = DiscreteLogDisjunctionEcc.curve.multi_mult_batch(
+            [[(s1, g), (-c1, P)], [(s2, h), (-c2, Q)]], validate=False)
+        c = DiscreteLogDisjunctionEcc._challenge([g, h, P, Q], [t1, t2])
+        assert c == (c1 + c2) % DiscreteLogDisjunctionEcc.curve.order
+
+    def verify_batch(self, proofs):
+        """
+        Verify many OR-proofs at once.
+
+        The challenge split c == c1 + c2 is checked per proof from the hash
+        alone, the branch equations s1 * g - c1 * P - t1 == 0 and
+        s2 * h - c2 * Q - t2 == 0 of all proofs are then checked with one
+        multi-scalar multiplication (see batch.ecc_failing_indices), the
+        terms of points shared between proofs merge into one.
+
+        Args:
+            proofs: A list of (g, h, P, Q, t1c1s1, t2c2s2) tuples, the
+                arguments of verify.
+
+        Returns:
+            list: The indices of the invalid proofs, empty if all are valid.
+        """
+        curve = DiscreteLogDisjunctionEcc.curve
+
+        def points(proof):
+            g, h, P, Q, (t1, _, _), (t2, _, _) = proof
+            return [g, h, P, Q, t1, t2]
+
+        def equations(proof):
+            g, h, P, Q, (t1, c1, s1), (t2, c2, s2) = proof
+            c = DiscreteLogDisjunctionEcc._challenge([g, h, P, Q], [t1, t2])
+            if c != (c1 + c2) % curve.order:
+                return None
+            return [[(s1, g), (-c1, P), (-1, t1)], [(s2, h), (-c2, Q), (-1, t2)]]
+
+        return ecc_failing_indices(curve, proofs, points, equations)
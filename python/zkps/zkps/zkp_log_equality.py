@@ -2,7 +2,10 @@ import random
 from typing import Tuple
 from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
+from .batch import ecc_failing_indices, modp_failing_indices
 
 class DiscreteLogEqualityInteractive(ZeroKnowledgeProtocol):
     """
@@ -10,7 +13,11 @@ class DiscreteLogEqualityInteractive(ZeroKnowledgeProtocol):
     """
 
     def __init__(self, g: int, h: int,xG: int, xH: int, p: int, x: int = None):
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h, xG, xH]):
+            raise ValueError('The public values must lie in the group')
         self._g = g
         self._xG = xG
         self._h = h
@@ -23,23 +30,23 @@ class DiscreteLogEqualityInteractive(ZeroKnowledgeProtocol):
         """
         Generates commitments for the protocol.
         """
-        self._v = self._random.randint(0, self._p - 1)
-        self._vG = pow(self._g, self._v, self._p)
-        self._vH = pow(self._h, self._v, self._p)
+        self._v = self._random.randint(0, self._q - 1)
+        self._vG = powmod(self._g, self._v, self._p)
+        self._vH = powmod(self._h, self._v, self._p)
         return self._vG, self._vH
 
     def challenge(self) -> int:
         """
         Generates a random challenge value.
         """
-        self._c = self._random.randint(1, self._p - 1)
+        self._c = self._group.get_challenge(self.challenge_bits)
         return self._c
 
     def response(self, c: int) -> int:
         """
         Calculates the response based on the challenge.
         """
-        self._r = (self._v - self._x * c) % (self._p - 1)
+        self._r = (self._v - self._x * c) % self._q
         return self._r
 
     def verify(self, c: int, r: int, vG: int, vH: int) -> bool:
@@ -47,8 +54,8 @@ class DiscreteLogEqualityInteractive(ZeroKnowledgeProtocol):
         Verifies the ZKP given the challenge, response, and commitments.
         """
         # Calculate the verification values using the prover's response
-        v1 = pow(self._g, r, self._p) * pow(self._xG, c, self._p) % self._p
-        v2 = pow(self._h, r, self._p) * pow(self._xH, c, self._p) % self._p
+        v1 = powmod(self._g, r, self._p) * powmod(self._xG, c, self._p) % self._p
+        v2 = powmod(self._h, r, self._p) * powmod(self._xH, c, self._p) % self._p
 
         # Check if the recalculated commitments match the original commitments
         assert v1 == vG
@@ -66,29 +73,37 @@ class DiscreteLogEquality(ZeroKnowledgeProtocolNonInteractive, Base):
         :param xG: public key 1
         :param h: generator 2
         :param xH: public key 2
-        :param p: modulo
+        :param p: modulo, or a SchnorrGroup (exponents modulo its order q)
         :param x: secret
         """
         self._g = g
         self._P = P
         self._h = h
         self._Q = Q
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h, P, Q]):
+            raise ValueError('The public values must lie in the group')
         self._x = x
         self._random = random.SystemRandom()
 
-    def response(self):
+    def response(self, commitments=False):
         """
         Calculates the response value based on the current object state.
+        :param commitments: return the commitments (vG, vH, r) instead of
+            (c, r), the form verify_batch works on.
         :return: The calculated response value.
         """
-        self._v = self._random.randint(0, self._p - 1)
-        self._vG = pow(self._g, self._v, self._p)
-        self._vH = pow(self._h, self._v, self._p)
+        self._v = self._random.randint(0, self._q - 1)
+        self._vG = powmod(self._g, self._v, self._p)
+        self._vH = powmod(self._h, self._v, self._p)
         
-        self._c = self._hash([self._vG, self._vH, self._g, self._h])
+        self._c = self._challenge([self._g, self._h, self._P, self._Q], [self._vG, self._vH], self._q)
 
-        self._r = (self._v - self._x * self._c) % (self._p - 1)
+        self._r = (self._v - self._x * self._c) % self._q
+        if commitments:
+            return self._vG, self._vH, self._r
         return self._c, self._r
 
     def verify(self, c, r):
@@ -100,14 +115,41 @@ class DiscreteLogEquality(ZeroKnowledgeProtocolNonInteractive, Base):
         Returns:
             None
         """
-        v1 = (pow(self._g, r, self._p) * pow(self._P, c, self._p)) % self._p
-        v2 = (pow(self._h, r, self._p) * pow(self._Q, c, self._p)) % self._p
+        v1 = (powmod(self._g, r, self._p) * powmod(self._P, c, self._p)) % self._p
+        v2 = (powmod(self._h, r, self._p) * powmod(self._Q, c, self._p)) % self._p
         
-        c1 = self._hash([v1, v2, self._g, self._h])
+        c1 = self._challenge([self._g, self._h, self._P, self._Q], [v1, v2], self._q)
         assert c == c1
 
+    def verify_batch(self, proofs, weight_bits=128):
+        """
+        Verify many DLEQ proofs at once with small random exponents.
+
+        (c, r) proofs can only be checked by recomputing the commitments, so
+        the batch takes proofs made with response(commitments=True). Both
+        equations g^r * P^c == vG and h^r * Q^c == vH of every proof are
+        raised to their own random weight and multiplied together, which
+        leaves one full exponentiation of each of g, h, P and Q and two
+        weight_bits exponentiations per proof. The same soundness caveat as
+        for DiscreteLog.verify_batch applies outside prime order subgroups.
+
+        Args:
+            proofs: A list of (vG, vH, r) tuples.
+            weight_bits: Bit length of the random exponents.
+
+        Returns:
+            list: The indices of the invalid proofs, empty if all are valid.
+        """
+        def equations(proof):
+            vG, vH, r = proof
+            c = self._challenge([self._g, self._h, self._P, self._Q], [vG, vH], self._q)
+            return [([(r, self._g), (c, self._P)], [vG]),
+                    ([(r, self._h), (c, self._Q)], [vH])]
+
+        return modp_failing_indices(self._p, proofs, equations, weight_bits, self._q)
 
-class DiscreteLogEqualityEcc(ZeroKnowledgeProtocolNonInteractive):
+
+class DiscreteLogEqualityEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
 
     curve = get_curve('secp256r1')
 
@@ -124,7 +166,7 @@ class DiscreteLogEqualityEcc(ZeroKnowledgeProtocolNonInteractive):
         if x:
             self._x = x
 
-    def response(self, g, h, P, Q):
+    def response(self, g, h, P, Q, compact=False):
         """
         Calculates the response for the given parameters.
         Args:
@@ -132,14 +174,19 @@ class DiscreteLogEqualityEcc(ZeroKnowledgeProtocolNonInteractive):
             h (Point): Another point on the curve.
             P (Point): A point on the curve.
             Q (Point): Another point on the curve.
+            compact (bool): return the two scalars (c, s) instead, see
+                verify_compact.
         Returns:
             Tuple[Point, Point, int]: A tuple containing the calculated points t1 and t2, and the calculated integer s.
         """
+        assert DiscreteLogEqualityEcc.curve.validate_points([g, h, P, Q])
         r = DiscreteLogEqualityEcc.curve.get_random()
-        t1 = DiscreteLogEqualityEcc.curve.mult_point(r, g)
-        t2 = DiscreteLogEqualityEcc.curve.mult_point(r, h)
-        c = DiscreteLogEqualityEcc.curve.hash_points([g, h, P, Q, t1, t2])
+        t1, t2 = DiscreteLogEqualityEcc.curve.multi_mult_batch(
+            [[(r, g)], [(r, h)]], validate=False)
+        c = DiscreteLogEqualityEcc._challenge([g, h, P, Q], [t1, t2])
         s = ((r + c * self._x) % DiscreteLogEqualityEcc.curve.order)
+        if compact:
+            return c, s
         return t1, t2, s
 
     def verify(self, g, h, P, Q, t1, t2, s):
@@ -158,11 +205,56 @@ class DiscreteLogEqualityEcc(ZeroKnowledgeProtocolNonInteractive):
         Raises:
             AssertionError: If the equality of the discrete logarithms is not verified.
         """
-        c = DiscreteLogEqualityEcc.curve.hash_points([g, h, P, Q, t1, t2])
-        lhs1 = DiscreteLogEqualityEcc.curve.mult_point(s, g)
-        rhs1 = DiscreteLogEqualityEcc.curve.point_add(
-            t1, DiscreteLogEqualityEcc.curve.mult_point(c, P))
-        lhs2 = DiscreteLogEqualityEcc.curve.mult_point(s, h)
-        rhs2 = DiscreteLogEqualityEcc.curve.point_add(
-            t2, DiscreteLogEqualityEcc.curve.mult_point(c, Q))
-        assert (lhs1 == rhs1) and (lhs2 == rhs2)
+        assert DiscreteLogEqualityEcc.curve.validate_points([g, h, P, Q, t1, t2])
+        c = DiscreteLogEqualityEcc._challenge([g, h, P, Q], [t1, t2])
+        # s * g - c * P - t1 + w * (s * h - c * Q - t2) == 0 for a random w
+        w = DiscreteLogEqualityEcc.curve.get_random_weight()
+        assert DiscreteLogEqualityEcc.curve.multi_mult_is_infinity(
+            [(s, g), (-c, P), (-1, t1), (w * s, h), (-w * c, Q), (-w, t2)], validate=False)
+
+    def verify_compact(self, g, h, P, Q, c, s):
+        """
+        Verify a proof (c, s) returned by response(compact=True).
+        Args:
+            g (Point): The base point of the first logarithm.
+            h (Point): The base point of the second logarithm.
+            P (Point): The first point on the elliptic curve.
+            Q (Point): The second point on the elliptic curve.
+            c (Scalar): The challenge.
+            s (Scalar): The scalar value.
+        Returns:
+            None
+        Raises:
+            AssertionError: If t1 = s * g - c * P and t2 = s * h - c * Q do
+                not hash to c.
+        """
+        assert DiscreteLogEqualityEcc.curve.validate_points([g, h, P, Q])
+        t1, t2 = DiscreteLogEqualityEcc.curve.multi_mult_batch(
+            [[(s, g), (-c, P)], [(s, h), (-c, Q)]], validate=False)
+        assert c == DiscreteLogEqualityEcc._challenge([g, h, P, Q], [t1, t2])
+
+    def verify_batch(self, proofs):
+        """
+        Verify many DLEQ proofs at once.
+
+        Both equations of every proof get their own random 128-bit weight
+        and all of them are checked with one multi-scalar multiplication,
+        points shared between proofs (g, P, and h, Q for proofs under one
+        key) are merged into a single term. The failing proofs of a batch
+        that does not sum to zero are found by bisection.
+
+        Args:
+            proofs: A list of (g, h, P, Q, t1, t2, s) tuples, the arguments
+                of verify.
+
+        Returns:
+            list: The indices of the invalid proofs, empty if all are valid.
+        """
+        curve = DiscreteLogEqualityEcc.curve
+
+        def equations(proof):
+            g, h, P, Q, t1, t2, s = proof
+            c = DiscreteLogEqualityEcc._challenge([g, h, P, Q], [t1, t2])
+            return [[(s, g), (-c, P), (-1, t1)], [(s, h), (-c, Q), (-1, t2)]]
+
+        return ecc_failing_indices(curve, proofs, lambda proof: proof[:6], equations)
@@ -2,8 +2,10 @@ from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
 
 import random
-import hashlib
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
+from .batch import ecc_failing_indices, modp_failing_indices
 
 
 class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
@@ -14,7 +16,7 @@ class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
     def __init__(self, g: int, h: int, p: int, x: int = None, y: int = None) -> None:
         """
         Initialize the commitment scheme with public parameters and optionally secret values.
-        :param p: The prime order of the cyclic group.
+        :param p: The prime modulus, or a SchnorrGroup (exponents modulo its order q).
         :param g: The generator of the group.
         :param h: Another generator of the group, where no one knows the discrete log of h with respect to g.
         :param x: The secret value associated with g.
@@ -22,7 +24,11 @@ class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
         """
         self.g = g
         self.h = h
-        self.p = p
+        self.group = get_group(p)
+        self.p = self.group.p
+        self.q = self.group.q
+        if not self.group.validate_elements([g, h]):
+            raise ValueError('The public values must lie in the group')
         self.x = x
         self.y = y
         self._random = random.SystemRandom()
@@ -32,10 +38,10 @@ class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
         Generate a commitment.
         :return: The commitment value t.
         """
-        self.r1 = self._random.randint(1, self.p - 1)
-        self.r2 = self._random.randint(1, self.p - 1)
-        self.t = (pow(self.g, self.r1, self.p) *
-                  pow(self.h, self.r2, self.p)) % self.p
+        self.r1 = self._random.randint(1, self.q - 1)
+        self.r2 = self._random.randint(1, self.q - 1)
+        self.t = (powmod(self.g, self.r1, self.p) *
+                  powmod(self.h, self.r2, self.p)) % self.p
         return self.t
 
     def challenge(self) -> None:
@@ -43,7 +49,7 @@ class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
         Receives a challenge from the verifier.
         :param c: The challenge value.
         """
-        self.c = self._random.randint(1, self.p - 1)
+        self.c = self.group.get_challenge(self.challenge_bits)
         return self.c
 
     def response(self, c) -> tuple:
@@ -51,8 +57,8 @@ class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
         Generate a response based on the challenge.
         :return: A tuple of the responses (s1, s2).
         """
-        s1 = (self.r1 + c * self.x) % (self.p - 1)
-        s2 = (self.r2 + c * self.y) % (self.p - 1)
+        s1 = (self.r1 + c * self.x) % self.q
+        s2 = (self.r2 + c * self.y) % self.q
         return s1, s2
 
     def verify(self, t: int, c: int, s1: int, s2: int) -> bool:
@@ -66,9 +72,9 @@ class PedersenCommitmentInteractive(ZeroKnowledgeProtocol):
         """
         # Recompute the commitment using s1, s2, and challenge c
 
-        lhs = (pow(self.g, s1, self.p) * pow(self.h, s2, self.p)) % self.p
+        lhs = (powmod(self.g, s1, self.p) * powmod(self.h, s2, self.p)) % self.p
         # This is incorrect in the context of Pedersen commitments
-        rhs = (t * pow(self.g, c, self.p)) % self.p
+        rhs = (t * powmod(self.g, c, self.p)) % self.p
         # Correct rhs computation for Pedersen verification
         # rhs = t  # For Pedersen, the verification does not recompute t this way
         return lhs == rhs
@@ -82,7 +88,7 @@ class PedersenCommitment(ZeroKnowledgeProtocolNonInteractive, Base):
     def __init__(self, g: int, h: int, p: int, x: int = None, y: int = None) -> None:
         """
         Initialize the commitment scheme with public parameters and optionally secret values.
-        :param p: The prime order of the cyclic group.
+        :param p: The prime modulus, or a SchnorrGroup (exponents modulo its order q).
         :param g: The generator of the group.
         :param h: Another generator of the group, where no one knows the discrete log of h with respect to g.
         :param x: The secret value associated with g.
@@ -92,26 +98,33 @@ class PedersenCommitment(ZeroKnowledgeProtocolNonInteractive, Base):
         self.h = h
         self.x = x
         self.y = y
-        self.p = p
+        self.group = get_group(p)
+        self.p = self.group.p
+        self.q = self.group.q
+        if not self.group.validate_elements([g, h]):
+            raise ValueError('The public values must lie in the group')
         self._random = random.SystemRandom()
 
-    def response(self, P: int) -> tuple:
+    def response(self, P: int, compact: bool = False) -> tuple:
         """
         Generate a commitment and response for the given value P.
         :param P: The public point (or value) associated with the secrets x and y.
+        :param compact: Return the challenge in place of t, see verify_compact.
         :return: A tuple of the commitment (t), and responses (s1, s2).
         """
-        r1 = self._random.randint(1, self.p - 1)
-        r2 = self._random.randint(1, self.p - 1)
+        r1 = self._random.randint(1, self.q - 1)
+        r2 = self._random.randint(1, self.q - 1)
 
         # Commitment
-        t = (pow(self.g, r1, self.p) * pow(self.h, r2, self.p)) % self.p
-        c = self._hash([self.g, self.h, P, t]) % self.p
+        t = (powmod(self.g, r1, self.p) * powmod(self.h, r2, self.p)) % self.p
+        c = self._challenge([self.g, self.h, P], [t], self.q)
         
         # Responses
-        s1 = (r1 + c * self.x) % (self.p - 1)
-        s2 = (r2 + c * self.y) % (self.p - 1)
+        s1 = (r1 + c * self.x) % self.q
+        s2 = (r2 + c * self.y) % self.q
 
+        if compact:
+            return c, s1, s2
         return t, s1, s2
 
     def verify(self, g: int, h: int, P: int, t: int, s1: int, s2: int) -> bool:
@@ -123,16 +136,50 @@ class PedersenCommitment(ZeroKnowledgeProtocolNonInteractive, Base):
         :param s1, s2: The responses.
         :return: True if the commitment and responses are valid, False otherwise.
         """
+        assert self.group.validate_elements([g, h, P])
         # Calculate left hand side (LHS) of the verification equation
-        lhs = (pow(g, s1, self.p) * pow(h, s2, self.p)) % self.p
-        c = self._hash([g, h, P, t]) % self.p
+        lhs = (powmod(g, s1, self.p) * powmod(h, s2, self.p)) % self.p
+        c = self._challenge([g, h, P], [t], self.q)
         # Calculate right hand side (RHS) of the verification equation
-        rhs = (t * pow(P, c, self.p)) % self.p
+        rhs = (t * powmod(P, c, self.p)) % self.p
 
         assert lhs == rhs
 
+    def verify_compact(self, g: int, h: int, P: int, c: int, s1: int, s2: int) -> None:
+        """
+        Verify a proof (c, s1, s2) returned by response(compact=True).
+        The commitment t = g^s1 * h^s2 * P^-c is recomputed and must hash to c.
+        :param g, h: The generators.
+        :param P: The public point/value.
+        :param c: The challenge.
+        :param s1, s2: The responses.
+        """
+        assert self.group.validate_elements([g, h, P])
+        t = (powmod(g, s1, self.p) * powmod(h, s2, self.p) *
+             powmod(P, -c, self.p)) % self.p
+
+        assert c == self._challenge([g, h, P], [t], self.q)
+
+    def verify_batch(self, proofs, weight_bits=128):
+        """
+        Verify many proofs at once with small random exponents, see
+        batch.modp_failing_indices. The exponents of g, h and of a P shared
+        between proofs are added up, so the batch costs one full
+        exponentiation per distinct g, h and P and a weight_bits
+        exponentiation per proof.
+        :param proofs: A list of (g, h, P, t, s1, s2) tuples, the arguments of verify.
+        :param weight_bits: Bit length of the random exponents.
+        :return: The indices of the invalid proofs, empty if all are valid.
+        """
+        def equations(proof):
+            g, h, P, t, s1, s2 = proof
+            c = self._challenge([g, h, P], [t], self.q)
+            return [([(s1, g), (s2, h), (-c, P)], [t])]
+
+        return modp_failing_indices(self.p, proofs, equations, weight_bits, self.q)
+
 
-class PedersenCommitmentEcc(ZeroKnowledgeProtocolNonInteractive):
+class PedersenCommitmentEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
 
     curve = get_curve('secp256r1')
 
@@ -141,15 +188,17 @@ class PedersenCommitmentEcc(ZeroKnowledgeProtocolNonInteractive):
             self._x = x
             self._y = y
 
-    def response(self, g, h, P):
+    def response(self, g, h, P, compact=False):
+        assert PedersenCommitmentEcc.curve.validate_points([g, h, P])
         r1 = PedersenCommitmentEcc.curve.get_random()
         r2 = PedersenCommitmentEcc.curve.get_random()
 
-        t = PedersenCommitmentEcc.curve.point_add(PedersenCommitmentEcc.curve.mult_point(
-            r1, g), PedersenCommitmentEcc.curve.mult_point(r2, h))
-        c = PedersenCommitmentEcc.curve.hash_points([g, h, P, t])
+        t = PedersenCommitmentEcc.curve.multi_mult([(r1, g), (r2, h)], validate=False)
+        c = PedersenCommitmentEcc._challenge([g, h, P], [t])
         s1 = ((r1 + c * self._x) % PedersenCommitmentEcc.curve.order)
         s2 = ((r2 + c * self._y) % PedersenCommitmentEcc.curve.order)
+        if compact:
+            return c, s1, s2
         return t, s1, s2
 
     def verify(self, g, h, P, t, s1, s2):
@@ -164,9 +213,40 @@ class PedersenCommitmentEcc(ZeroKnowledgeProtocolNonInteractive):
         Raises:
             AssertionError: If the signature is invalid.
         """
-        lhs = PedersenCommitmentEcc.curve.point_add(PedersenCommitmentEcc.curve.mult_point(
-            s1, g), PedersenCommitmentEcc.curve.mult_point(s2, h))
-        c = PedersenCommitmentEcc.curve.hash_points([g, h, P, t])
-        rhs = PedersenCommitmentEcc.curve.point_add(
-            t, PedersenCommitmentEcc.curve.mult_point(c, P))
-        assert (lhs == rhs)
+        assert PedersenCommitmentEcc.curve.validate_points([g, h, P, t])
+        c = PedersenCommitmentEcc._challenge([g, h, P], [t])
+        # s1 * g + s2 * h - c * P == t
+        assert PedersenCommitmentEcc.curve.multi_mult_equals(
+            [(s1, g), (s2, h), (-c, P)], t, validate=False)
+
+    def verify_compact(self, g, h, P, c, s1, s2):
+        """
+        Verify a proof (c, s1, s2) returned by response(compact=True), the
+        commitment t = s1 * g + s2 * h - c * P is recomputed and must hash
+        to c.
+        Raises:
+            AssertionError: If the proof is invalid.
+        """
+        assert PedersenCommitmentEcc.curve.validate_points([g, h, P])
+        t = PedersenCommitmentEcc.curve.multi_mult([(s1, g), (s2, h), (-c, P)], validate=False)
+        assert c == PedersenCommitmentEcc._challenge([g, h, P], [t])
+
+    def verify_batch(self, proofs):
+        """
+        Verify many proofs at once with one multi-scalar multiplication, see
+        batch.ecc_failing_indices. The g and h terms of all proofs merge into
+        one each, so a batch costs about one scalar multiplication per
+        distinct point.
+        Parameters:
+            proofs: A list of (g, h, P, t, s1, s2) tuples, the arguments of verify.
+        Returns:
+            list: The indices of the invalid proofs, empty if all are valid.
+        """
+        curve = PedersenCommitmentEcc.curve
+
+        def equations(proof):
+            g, h, P, t, s1, s2 = proof
+            c = PedersenCommitmentEcc._challenge([g, h, P], [t])
+            return [[(s1, g), (s2, h), (-c, P), (-1, t)]]
+
+        return ecc_failing_indices(curve, proofs, lambda proof: proof[:4], equations)
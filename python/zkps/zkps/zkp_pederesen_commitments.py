@@ -1,22 +1,27 @@
 import random 
 from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
+from .batch import ecc_failing_indices, modp_failing_indices
 
 class PedersenCommitmentsEqualInteractive(ZeroKnowledgeProtocol):
     def __init__(self, p, x=None, y=None):
         self._x = x
         self._y = y
-        self.p = p  # Large prime number for modulo operations
+        self.group = get_group(p)  # Large prime number or SchnorrGroup
+        self.p = self.group.p
+        self.q = self.group.q
         self._random = random.SystemRandom()
     
     def _mod_exp(self, base, exponent):
         """Performs modular exponentiation."""
-        return pow(base, exponent, self.p)
+        return powmod(base, exponent, self.p)
 
     def challenge(self):
         """Verifier generates and sends a random challenge to the prover."""
-        self._c = self._random.randint(1, self.p - 1)
+        self._c = self.group.get_challenge(self.challenge_bits)
         return self._c
     
     def set_challange(self, c):
@@ -27,18 +32,19 @@ class PedersenCommitmentsEqualInteractive(ZeroKnowledgeProtocol):
         #r1 = self._random.randint(1, self.p - 2)
         #r2 = self._random.randint(1, self.p - 2)
         
-        r1 = (self._x + self._y) % (self.p - 1)
-        r2 = (self._x * self._y) % (self.p - 1)
+        r1 = (self._x + self._y) % self.q
+        r2 = (self._x * self._y) % self.q
         
         t1 = (self._mod_exp(g1, r1) * self._mod_exp(h1, r2)) % self.p
         t2 = (self._mod_exp(g2, r1) * self._mod_exp(h2, r2)) % self.p
         
-        s1 = (r1 + c * self._x) % (self.p - 1)
-        s2 = (r2 + c * self._y) % (self.p - 1)
+        s1 = (r1 + c * self._x) % self.q
+        s2 = (r2 + c * self._y) % self.q
         
         return (t1, s1), (t2, s2)
 
     def verify(self, g1, h1, g2, h2, P, Q, t1s1, t2s2):
+        assert self.group.validate_elements([g1, h1, g2, h2, P, Q])
         (t1, s1) = t1s1
         (t2, s2) = t2s2
         """Verifier checks the prover's response against the given challenge."""
@@ -56,35 +62,41 @@ class PedersenCommitmentsEqual(ZeroKnowledgeProtocolNonInteractive, Base):
     def __init__(self, p, x=None, y=None):
         self._x = x
         self._y = y
-        self.p = p  # Large prime number for modulo operations
+        self.group = get_group(p)  # Large prime number or SchnorrGroup
+        self.p = self.group.p
+        self.q = self.group.q
     
     def _mod_exp(self, base, exponent):
         """Performs modular exponentiation."""
-        return pow(base, exponent, self.p)
+        return powmod(base, exponent, self.p)
     
-    def response(self, g1, h1, g2, h2, P, Q):
-        
-        r1 = random.randint(2, self.p )
-        r2 = random.randint(2, self.p )
+    def response(self, g1, h1, g2, h2, P, Q, compact=False):
+        """Returns (t1, s1), (t2, s2), or (c, s1, s2) with compact=True (see
+        verify_compact)."""
+        r1 = self.group.get_random()
+        r2 = self.group.get_random()
         
         t1 = (self._mod_exp(g1, r1) * self._mod_exp(h1, r2)) % self.p 
         t2 = (self._mod_exp(g2, r1) * self._mod_exp(h2, r2)) % self.p
         
-        c = self._hash([g1, h1, g2, h2, P, Q, t1, t2]) % self.p
+        c = self._challenge([g1, h1, g2, h2, P, Q], [t1, t2], self.q)
         
-        s1 = (r1 + c * self._x) % ( self.p - 1)
-        s2 = (r2 + c * self._y) % ( self.p - 1)
+        s1 = (r1 + c * self._x) % self.q
+        s2 = (r2 + c * self._y) % self.q
         
+        if compact:
+            return c, s1, s2
         return (t1, s1), (t2, s2)
     
     def verify(self, g1, h1, g2, h2, P, Q, t1s1, t2s2):
+        assert self.group.validate_elements([g1, h1, g2, h2, P, Q])
         (t1, s1) = t1s1
         (t2, s2) = t2s2
         
         lhs1 = (self._mod_exp(g1, s1) * self._mod_exp(h1, s2)) % self.p
         lhs2 = (self._mod_exp(g2, s1) * self._mod_exp(h2, s2)) % self.p
         
-        c = self._hash([g1, h1, g2, h2, P, Q, t1, t2]) % self.p
+        c = self._challenge([g1, h1, g2, h2, P, Q], [t1, t2], self.q)
         
         rhs1 = (t1 * self._mod_exp(P, c)) % self.p
         rhs2 = (t2 * self._mod_exp(Q, c)) % self.p
@@ -92,7 +104,35 @@ class PedersenCommitmentsEqual(ZeroKnowledgeProtocolNonInteractive, Base):
         assert (lhs1 == rhs1) 
         assert (lhs2 == rhs2)
 
-class PederesenCommitmentsEqualEcc(ZeroKnowledgeProtocolNonInteractive):
+    def verify_compact(self, g1, h1, g2, h2, P, Q, c, s1, s2):
+        """Verifies a proof (c, s1, s2) returned by response(compact=True),
+        the commitments t1 = g1^s1 * h1^s2 * P^-c and t2 = g2^s1 * h2^s2 * Q^-c
+        are recomputed and must hash to c."""
+        assert self.group.validate_elements([g1, h1, g2, h2, P, Q])
+        t1 = (self._mod_exp(g1, s1) * self._mod_exp(h1, s2) * self._mod_exp(P, -c)) % self.p
+        t2 = (self._mod_exp(g2, s1) * self._mod_exp(h2, s2) * self._mod_exp(Q, -c)) % self.p
+
+        assert c == self._challenge([g1, h1, g2, h2, P, Q], [t1, t2], self.q)
+
+    def verify_batch(self, proofs, weight_bits=128):
+        """
+        Verify many proofs at once with small random exponents, see
+        batch.modp_failing_indices. Both equations of every proof get their
+        own weight, the exponents of the shared generators g1, h1, g2, h2 are
+        added up so each costs one full exponentiation per batch.
+
+        proofs is a list of (g1, h1, g2, h2, P, Q, (t1, s1), (t2, s2)) tuples,
+        the arguments of verify. Returns the indices of the invalid proofs.
+        """
+        def equations(proof):
+            g1, h1, g2, h2, P, Q, (t1, s1), (t2, s2) = proof
+            c = self._challenge([g1, h1, g2, h2, P, Q], [t1, t2], self.q)
+            return [([(s1, g1), (s2, h1), (-c, P)], [t1]),
+                    ([(s1, g2), (s2, h2), (-c, Q)], [t2])]
+
+        return modp_failing_indices(self.p, proofs, equations, weight_bits, self.q)
+
+class PederesenCommitmentsEqualEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
     
     curve = get_curve('secp256r1')
     
@@ -101,22 +141,58 @@ class PederesenCommitmentsEqualEcc(ZeroKnowledgeProtocolNonInteractive):
             self._x = x
             self._y = y
             
-    def response(self, g1, h1, g2, h2, P, Q):
+    def response(self, g1, h1, g2, h2, P, Q, compact=False):
+        assert PederesenCommitmentsEqualEcc.curve.validate_points([g1, h1, g2, h2, P, Q])
         r1 = PederesenCommitmentsEqualEcc.curve.get_random()
         r2 = PederesenCommitmentsEqualEcc.curve.get_random()
-        t1 = PederesenCommitmentsEqualEcc.curve.point_add(PederesenCommitmentsEqualEcc.curve.mult_point(r1, g1), PederesenCommitmentsEqualEcc.curve.mult_point(r2, h1))
-        t2 = PederesenCommitmentsEqualEcc.curve.point_add(PederesenCommitmentsEqualEcc.curve.mult_point(r1, g2), PederesenCommitmentsEqualEcc.curve.mult_point(r2, h2))
-        c = PederesenCommitmentsEqualEcc.curve.hash_points( [ g1, h1, g2, h2, P, Q, t1, t2 ] )
+        t1, t2 = PederesenCommitmentsEqualEcc.curve.multi_mult_batch(
+            [[(r1, g1), (r2, h1)], [(r1, g2), (r2, h2)]], validate=False)
+        c = PederesenCommitmentsEqualEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
         s1 = ((r1 + c * self._x) % PederesenCommitmentsEqualEcc.curve.order )
         s2 = ((r2 + c * self._y) % PederesenCommitmentsEqualEcc.curve.order )
+        if compact:
+            return c, s1, s2
         return (t1, s1), (t2, s2)
     
     def verify(self, g1, h1, g2, h2, P, Q, t1s1, t2s2):
         (t1, s1) = t1s1
         (t2, s2) = t2s2
-        lhs1 = PederesenCommitmentsEqualEcc.curve.point_add(PederesenCommitmentsEqualEcc.curve.mult_point(s1, g1), PederesenCommitmentsEqualEcc.curve.mult_point(s2, h1))
-        lhs2 = PederesenCommitmentsEqualEcc.curve.point_add(PederesenCommitmentsEqualEcc.curve.mult_point(s1, g2), PederesenCommitmentsEqualEcc.curve.mult_point(s2, h2))
-        c = PederesenCommitmentsEqualEcc.curve.hash_points([g1, h1, g2, h2, P, Q, t1, t2])
-        rhs1 = PederesenCommitmentsEqualEcc.curve.point_add(t1 , PederesenCommitmentsEqualEcc.curve.mult_point(c, P))
-        rhs2 = PederesenCommitmentsEqualEcc.curve.point_add(t2 , PederesenCommitmentsEqualEcc.curve.mult_point(c, Q))
-        assert (lhs1 == rhs1) and (lhs2 == rhs2)
\ No newline at end of file
+        assert PederesenCommitmentsEqualEcc.curve.validate_points([g1, h1, g2, h2, P, Q, t1, t2])
+        c = PederesenCommitmentsEqualEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
+        # s1 * g1 + s2 * h1 - c * P - t1 + w * (s1 * g2 + s2 * h2 - c * Q - t2) == 0
+        w = PederesenCommitmentsEqualEcc.curve.get_random_weight()
+        assert PederesenCommitmentsEqualEcc.curve.multi_mult_is_infinity(
+            [(s1, g1), (s2, h1), (-c, P), (-1, t1), (w * s1, g2), (w * s2, h2), (-w * c, Q), (-w, t2)], validate=False)
+
+    def verify_compact(self, g1, h1, g2, h2, P, Q, c, s1, s2):
+        """Verifies a proof (c, s1, s2) returned by response(compact=True),
+        the commitments t1 = s1 * g1 + s2 * h1 - c * P and
+        t2 = s1 * g2 + s2 * h2 - c * Q are recomputed and must hash to c."""
+        assert PederesenCommitmentsEqualEcc.curve.validate_points([g1, h1, g2, h2, P, Q])
+        t1, t2 = PederesenCommitmentsEqualEcc.curve.multi_mult_batch(
+            [[(s1, g1), (s2, h1), (-c, P)], [(s1, g2), (s2, h2), (-c, Q)]], validate=False)
+        assert c == PederesenCommitmentsEqualEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
+
+    def verify_batch(self, proofs):
+        """
+        Verify many proofs at once with one multi-scalar multiplication, see
+        batch.ecc_failing_indices. Both equations of every proof get their
+        own weight, the terms of the shared generators g1, h1, g2, h2 merge
+        into one each.
+
+        proofs is a list of (g1, h1, g2, h2, P, Q, (t1, s1), (t2, s2)) tuples,
+        the arguments of verify. Returns the indices of the invalid proofs.
+        """
+        curve = PederesenCommitmentsEqualEcc.curve
+
+        def points(proof):
+            g1, h1, g2, h2, P, Q, (t1, _), (t2, _) = proof
+            return [g1, h1, g2, h2, P, Q, t1, t2]
+
+        def equations(proof):
+            g1, h1, g2, h2, P, Q, (t1, s1), (t2, s2) = proof
+            c = PederesenCommitmentsEqualEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
+            return [[(s1, g1), (s2, h1), (-c, P), (-1, t1)],
+                    [(s1, g2), (s2, h2), (-c, Q), (-1, t2)]]
+
+        return ecc_failing_indices(curve, proofs, points, equations)
\ No newline at end of file
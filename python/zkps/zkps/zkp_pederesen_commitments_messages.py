@@ -1,12 +1,18 @@
 from .elliptic_curve import get_curve
 from .interface_zkp import ZeroKnowledgeProtocol, ZeroKnowledgeProtocolNonInteractive
 import random
-import hashlib
-from .zkp_base import Base
+from .zkp_base import Base, BaseEcc
+from .backend import powmod
+from .group import get_group
+from .batch import ecc_failing_indices, modp_failing_indices
 
 class PedersenCommitmentsEqualMessagesInteractive(ZeroKnowledgeProtocol):
     def __init__(self, p, g, h, x=None, y=None, z=None):
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h]):
+            raise ValueError('The public values must lie in the group')
         self._g = g
         self._h = h
         if x and y and z:
@@ -16,39 +22,44 @@ class PedersenCommitmentsEqualMessagesInteractive(ZeroKnowledgeProtocol):
         self._random = random.SystemRandom()
             
     def challenge(self):
-        self._c = self._random.randint(1, self._p - 1)
+        self._c = self._group.get_challenge(self.challenge_bits)
         return self._c
 
     def response(self, c):
-        self.r1 = self._random.randint(1, self._p - 1)
-        self.r2 = self._random.randint(1, self._p - 1)
-        self.r3 = self._random.randint(1, self._p - 1)
+        self.r1 = self._random.randint(1, self._q - 1)
+        self.r2 = self._random.randint(1, self._q - 1)
+        self.r3 = self._random.randint(1, self._q - 1)
         
-        t1 = (pow(self._g, self.r1, self._p) * pow(self._h, self.r2, self._p)) % self._p
-        t2 = (pow(self._g, self.r1, self._p) * pow(self._h, self.r3, self._p)) % self._p
+        t1 = (powmod(self._g, self.r1, self._p) * powmod(self._h, self.r2, self._p)) % self._p
+        t2 = (powmod(self._g, self.r1, self._p) * powmod(self._h, self.r3, self._p)) % self._p
         
-        s1 = (self.r1 + c * self._x) % (self._p - 1)
-        s2 = (self.r2 + c * self._y) % (self._p - 1)
-        s3 = (self.r3 + c * self._z) % (self._p - 1)
+        s1 = (self.r1 + c * self._x) % self._q
+        s2 = (self.r2 + c * self._y) % self._q
+        s3 = (self.r3 + c * self._z) % self._q
         
         return (t1, s1), (t2, s2), s3 # t1, s1, s2, s3
 
     def verify(self, P, Q, t1s1, t2s2, s3):
+        assert self._group.validate_elements([P, Q])
         (t1, s1) = t1s1
         (t2, s2) = t2s2
         
-        lhs1 = (pow(self._g, s1, self._p) * pow(self._h, s2, self._p)) % self._p
-        lhs2 = (pow(self._g, s1, self._p) * pow(self._h, s3, self._p)) % self._p
+        lhs1 = (powmod(self._g, s1, self._p) * powmod(self._h, s2, self._p)) % self._p
+        lhs2 = (powmod(self._g, s1, self._p) * powmod(self._h, s3, self._p)) % self._p
         
-        rhs1 = (t1 * pow(P, self._c, self._p)) % self._p
-        rhs2 = (t2 * pow(Q, self._c, self._p)) % self._p
+        rhs1 = (t1 * powmod(P, self._c, self._p)) % self._p
+        rhs2 = (t2 * powmod(Q, self._c, self._p)) % self._p
 
         assert lhs1 == rhs1 and lhs2 == rhs2
 
 class PederesenCommitmentsEqualMessages(ZeroKnowledgeProtocolNonInteractive, Base):
     
     def __init__(self, p, g, h, x = None, y = None, z = None):
-        self._p = p
+        self._group = get_group(p)
+        self._p = self._group.p
+        self._q = self._group.q
+        if not self._group.validate_elements([g, h]):
+            raise ValueError('The public values must lie in the group')
         self._g = g
         self._h = h
         if x and y and z:
@@ -57,37 +68,73 @@ class PederesenCommitmentsEqualMessages(ZeroKnowledgeProtocolNonInteractive, Bas
             self._z = z
         self._random = random.SystemRandom()
 
-    def response(self, P, Q):
-        r1 = self._random.randint(1, self._p - 1)
-        r2 = self._random.randint(1, self._p - 1)
-        r3 = self._random.randint(1, self._p - 1)
+    def response(self, P, Q, compact=False):
+        """Returns (t1, s1), (t2, s2), s3, or (c, s1, s2, s3) with
+        compact=True (see verify_compact)."""
+        r1 = self._random.randint(1, self._q - 1)
+        r2 = self._random.randint(1, self._q - 1)
+        r3 = self._random.randint(1, self._q - 1)
         
-        t1 = (pow(self._g, r1, self._p) * pow(self._h, r2, self._p)) % ( self._p )
-        t2 = (pow(self._g, r1, self._p) * pow(self._h, r3, self._p)) % ( self._p )
+        t1 = (powmod(self._g, r1, self._p) * powmod(self._h, r2, self._p)) % ( self._p )
+        t2 = (powmod(self._g, r1, self._p) * powmod(self._h, r3, self._p)) % ( self._p )
         
-        c = self._hash([P, Q, t1, t2]) % self._p
+        c = self._challenge([self._g, self._h, P, Q], [t1, t2], self._q)
         
-        s1 = (r1 + c * self._x) % (self._p - 1 )
-        s2 = (r2 + c * self._y) % (self._p - 1 )
-        s3 = (r3 + c * self._z) % (self._p - 1 )
+        s1 = (r1 + c * self._x) % self._q
+        s2 = (r2 + c * self._y) % self._q
+        s3 = (r3 + c * self._z) % self._q
         
+        if compact:
+            return c, s1, s2, s3
         return (t1, s1), (t2, s2), s3
 
     def verify(self, P, Q, t1s1, t2s2, s3):
+        assert self._group.validate_elements([P, Q])
         (t1, s1) = t1s1
         (t2, s2) = t2s2
         
-        c = self._hash([P, Q, t1, t2]) % self._p
+        c = self._challenge([self._g, self._h, P, Q], [t1, t2], self._q)
         
-        lhs1 = (pow(self._g, s1, self._p) * pow(self._h, s2, self._p)) % self._p
-        lhs2 = (pow(self._g, s1, self._p) * pow(self._h, s3, self._p)) % self._p
+        lhs1 = (powmod(self._g, s1, self._p) * powmod(self._h, s2, self._p)) % self._p
+        lhs2 = (powmod(self._g, s1, self._p) * powmod(self._h, s3, self._p)) % self._p
         
-        rhs1 = (t1 * pow(P, c, self._p)) % self._p
-        rhs2 = (t2 * pow(Q, c, self._p)) % self._p
+        rhs1 = (t1 * powmod(P, c, self._p)) % self._p
+        rhs2 = (t2 * powmod(Q, c, self._p)) % self._p
 
         assert lhs1 == rhs1 and lhs2 == rhs2
 
-class PederesenCommitmentsEqualMessagesEcc(ZeroKnowledgeProtocolNonInteractive):
+    def verify_compact(self, P, Q, c, s1, s2, s3):
+        """Verifies a proof (c, s1, s2, s3) returned by
+        response(compact=True), the commitments t1 = g^s1 * h^s2 * P^-c and
+        t2 = g^s1 * h^s3 * Q^-c are recomputed and must hash to c."""
+        assert self._group.validate_elements([P, Q])
+        g_s1 = powmod(self._g, s1, self._p)
+        t1 = (g_s1 * powmod(self._h, s2, self._p) * powmod(P, -c, self._p)) % self._p
+        t2 = (g_s1 * powmod(self._h, s3, self._p) * powmod(Q, -c, self._p)) % self._p
+
+        assert c == self._challenge([self._g, self._h, P, Q], [t1, t2], self._q)
+
+    def verify_batch(self, proofs, weight_bits=128):
+        """
+        Verify many proofs at once with small random exponents, see
+        batch.modp_failing_indices. All proofs share g and h, so their
+        exponents are added up and cost one full exponentiation each per
+        batch.
+
+        proofs is a list of (P, Q, (t1, s1), (t2, s2), s3) tuples, the
+        arguments of verify. Returns the indices of the invalid proofs.
+        """
+        g, h = self._g, self._h
+
+        def equations(proof):
+            P, Q, (t1, s1), (t2, s2), s3 = proof
+            c = self._challenge([g, h, P, Q], [t1, t2], self._q)
+            return [([(s1, g), (s2, h), (-c, P)], [t1]),
+                    ([(s1, g), (s3, h), (-c, Q)], [t2])]
+
+        return modp_failing_indices(self._p, proofs, equations, weight_bits, self._q)
+
+class PederesenCommitmentsEqualMessagesEcc(ZeroKnowledgeProtocolNonInteractive, BaseEcc):
     
     curve = get_curve('secp256r1')
     def __init__(self, x = None, y = None, z = None) -> None:
@@ -96,27 +143,64 @@ class PederesenCommitmentsEqualMessagesEcc(ZeroKnowledgeProtocolNonInteractive):
             self._y = y
             self._z = z
     
-    def response(self, g1, h1, g2, h2, P, Q):
+    def response(self, g1, h1, g2, h2, P, Q, compact=False):
+        assert PederesenCommitmentsEqualMessagesEcc.curve.validate_points([g1, h1, g2, h2, P, Q])
         r1 = PederesenCommitmentsEqualMessagesEcc.curve.get_random()
         r2 = PederesenCommitmentsEqualMessagesEcc.curve.get_random()
         r3 = PederesenCommitmentsEqualMessagesEcc.curve.get_random()
         
-        t1 = PederesenCommitmentsEqualMessagesEcc.curve.point_add(PederesenCommitmentsEqualMessagesEcc.curve.mult_point(r1, g1), PederesenCommitmentsEqualMessagesEcc.curve.mult_point(r2, h1))
-        t2 = PederesenCommitmentsEqualMessagesEcc.curve.point_add(PederesenCommitmentsEqualMessagesEcc.curve.mult_point(r1, g2), PederesenCommitmentsEqualMessagesEcc.curve.mult_point(r3, h2))
+        t1, t2 = PederesenCommitmentsEqualMessagesEcc.curve.multi_mult_batch(
+            [[(r1, g1), (r2, h1)], [(r1, g2), (r3, h2)]], validate=False)
         
-        c = PederesenCommitmentsEqualMessagesEcc.curve.hash_points( [ g1, h1, g2, h2, P, Q, t1, t2 ] )
+        c = PederesenCommitmentsEqualMessagesEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
         
         s1 = ((r1 + c * self._x) % PederesenCommitmentsEqualMessagesEcc.curve.order )
         s2 = ((r2 + c * self._y) % PederesenCommitmentsEqualMessagesEcc.curve.order )
         s3 = ((r3 + c * self._z) % PederesenCommitmentsEqualMessagesEcc.curve.order )
+        if compact:
+            return c, s1, s2, s3
         return (t1, s1), (t2, s2), s3
     
     def verify(self, g1, h1, g2, h2, P, Q, t1s1, t2s2, s3):
         (t1, s1) = t1s1
         (t2, s2) = t2s2
-        lhs1 = PederesenCommitmentsEqualMessagesEcc.curve.point_add(PederesenCommitmentsEqualMessagesEcc.curve.mult_point(s1, g1), PederesenCommitmentsEqualMessagesEcc.curve.mult_point(s2, h1))
-        lhs2 = PederesenCommitmentsEqualMessagesEcc.curve.point_add(PederesenCommitmentsEqualMessagesEcc.curve.mult_point(s1, g2), PederesenCommitmentsEqualMessagesEcc.curve.mult_point(s3, h2))
-        c = PederesenCommitmentsEqualMessagesEcc.curve.hash_points([g1, h1, g2, h2, P, Q, t1, t2])
-        rhs1 = PederesenCommitmentsEqualMessagesEcc.curve.point_add(t1 , PederesenCommitmentsEqualMessagesEcc.curve.mult_point(c, P))
-        rhs2 = PederesenCommitmentsEqualMessagesEcc.curve.point_add(t2 , PederesenCommitmentsEqualMessagesEcc.curve.mult_point(c, Q))
-        assert lhs1 == rhs1 and lhs2 == rhs2
\ No newline at end of file
+        assert PederesenCommitmentsEqualMessagesEcc.curve.validate_points([g1, h1, g2, h2, P, Q, t1, t2])
+        c = PederesenCommitmentsEqualMessagesEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
+        # s1 * g1 + s2 * h1 - c * P - t1 + w * (s1 * g2 + s3 * h2 - c * Q - t2) == 0
+        w = PederesenCommitmentsEqualMessagesEcc.curve.get_random_weight()
+        assert PederesenCommitmentsEqualMessagesEcc.curve.multi_mult_is_infinity(
+            [(s1, g1), (s2, h1), (-c, P), (-1, t1), (w * s1, g2), (w * s3, h2), (-w * c, Q), (-w, t2)], validate=False)
+
+    def verify_compact(self, g1, h1, g2, h2, P, Q, c, s1, s2, s3):
+        """Verifies a proof (c, s1, s2, s3) returned by
+        response(compact=True), the commitments t1 = s1 * g1 + s2 * h1 - c * P
+        and t2 = s1 * g2 + s3 * h2 - c * Q are recomputed and must hash to c."""
+        assert PederesenCommitmentsEqualMessagesEcc.curve.validate_points([g1, h1, g2, h2, P, Q])
+        t1, t2 = PederesenCommitmentsEqualMessagesEcc.curve.multi_mult_batch(
+            [[(s1, g1), (s2, h1), (-c, P)], [(s1, g2), (s3, h2), (-c, Q)]], validate=False)
+        assert c == PederesenCommitmentsEqualMessagesEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
+
+    def verify_batch(self, proofs):
+        """
+        Verify many proofs at once with one multi-scalar multiplication, see
+        batch.ecc_failing_indices. Both equations of every proof get their
+        own weight, the terms of the shared generators g1, h1, g2, h2 merge
+        into one each.
+
+        proofs is a list of (g1, h1, g2, h2, P, Q, (t1, s1), (t2, s2), s3)
+        tuples, the arguments of verify. Returns the indices of the invalid
+        proofs.
+        """
+        curve = PederesenCommitmentsEqualMessagesEcc.curve
+
+        def points(proof):
+            g1, h1, g2, h2, P, Q, (t1, _), (t2, _), _ = proof
+            return [g1, h1, g2, h2, P, Q, t1, t2]
+
+        def equations(proof):
+            g1, h1, g2, h2, P, Q, (t1, s1), (t2, s2), s3 = proof
+            c = PederesenCommitmentsEqualMessagesEcc._challenge([g1, h1, g2, h2, P, Q], [t1, t2])
+            return [[(s1, g1), (s2, h1), (-c, P), (-1, t1)],
+                    [(s1, g2), (s3, h2), (-c, Q), (-1, t2)]]
+
+        return ecc_failing_indices(curve, proofs, points, equations)
\ No newline at end of file